@@ -22,6 +22,20 @@ from app.models.base import Base
 from app.models.user import User  # noqa: F401
 from app.models.item import Item  # noqa: F401
 from app.models.supplier import Supplier  # noqa: F401
+from app.models.product import (  # noqa: F401
+    Product,
+    ProductCategory,
+    SupplierProduct,
+    UnitConversion,
+)
+from app.models.price_list import (  # noqa: F401
+    SupplierPriceList,
+    SupplierPriceListItem,
+)
+from app.models.analytics import (  # noqa: F401
+    DailySpendRollup,
+    MonthlySupplierSpendRollup,
+)
 
 # Alembic Config object
 config = context.config
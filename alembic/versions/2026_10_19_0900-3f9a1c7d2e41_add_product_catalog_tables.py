@@ -0,0 +1,122 @@
+"""Add product catalog tables
+
+Revision ID: 3f9a1c7d2e41
+Revises: b4501b38c47f
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7d2e41'
+down_revision: Union[str, None] = 'b4501b38c47f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Product categories
+    op.create_table(
+        'product_categories',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('code', sa.String(length=50), nullable=False, comment='Mã danh mục'),
+        sa.Column('name', sa.String(length=200), nullable=False, comment='Tên danh mục'),
+        sa.Column('description', sa.Text(), nullable=True, comment='Mô tả danh mục'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true'), comment='Trạng thái hoạt động'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_product_categories_id', 'product_categories', ['id'])
+    op.create_index('ix_product_categories_code', 'product_categories', ['code'], unique=True)
+
+    # Canonical products
+    op.create_table(
+        'products',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('code', sa.String(length=50), nullable=False, comment='Mã sản phẩm Aladdin (unique)'),
+        sa.Column('name', sa.String(length=200), nullable=False, comment='Tên sản phẩm'),
+        sa.Column('category_id', sa.Integer(), nullable=False, comment='ID danh mục sản phẩm'),
+        sa.Column('unit', sa.String(length=50), nullable=False, comment='Đơn vị tính chuẩn (kg, lít, cái, ...)'),
+        sa.Column('description', sa.Text(), nullable=True, comment='Mô tả sản phẩm'),
+        sa.Column('specifications', sa.Text(), nullable=True, comment='Thông số kỹ thuật (JSON string)'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true'), comment='Trạng thái hoạt động'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['category_id'], ['product_categories.id'], ondelete='RESTRICT'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_products_id', 'products', ['id'])
+    op.create_index('ix_products_code', 'products', ['code'], unique=True)
+    op.create_index('ix_products_name', 'products', ['name'])
+    op.create_index('ix_products_category_id', 'products', ['category_id'])
+    op.create_index('ix_products_is_active', 'products', ['is_active'])
+
+    # Supplier item -> product mappings
+    op.create_table(
+        'supplier_products',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('supplier_id', sa.Integer(), nullable=False, comment='ID nhà cung cấp'),
+        sa.Column('product_id', sa.Integer(), nullable=False, comment='ID sản phẩm Aladdin'),
+        sa.Column('supplier_product_code', sa.String(length=100), nullable=False, comment='Mã sản phẩm của supplier (iit_code)'),
+        sa.Column('supplier_product_name', sa.String(length=255), nullable=False, comment='Tên sản phẩm của supplier (iit_name)'),
+        sa.Column('supplier_unit', sa.String(length=50), nullable=False, comment='Đơn vị tính của supplier (iit_uom)'),
+        sa.Column('conversion_rate', sa.Numeric(precision=12, scale=4), nullable=True, comment='1 supplier_unit = rate * đơn vị chuẩn; NULL: tra unit_conversions'),
+        sa.Column('price', sa.Numeric(precision=15, scale=2), nullable=True, comment='Giá mặc định'),
+        sa.Column('min_order_quantity', sa.Numeric(precision=12, scale=4), nullable=True, comment='Số lượng đặt hàng tối thiểu'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true'), comment='Trạng thái hoạt động'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='RESTRICT'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('supplier_id', 'supplier_product_code', name='uq_supplier_products_supplier_code'),
+    )
+    op.create_index('ix_supplier_products_id', 'supplier_products', ['id'])
+    op.create_index('ix_supplier_products_supplier_id', 'supplier_products', ['supplier_id'])
+    op.create_index('ix_supplier_products_product_id', 'supplier_products', ['product_id'])
+
+    # Unit of measure conversions
+    op.create_table(
+        'unit_conversions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('product_id', sa.Integer(), nullable=True, comment='Sản phẩm áp dụng (NULL: quy đổi chung)'),
+        sa.Column('from_unit', sa.String(length=50), nullable=False, comment='Đơn vị nguồn'),
+        sa.Column('to_unit', sa.String(length=50), nullable=False, comment='Đơn vị đích'),
+        sa.Column('factor', sa.Numeric(precision=12, scale=4), nullable=False, comment='1 from_unit = factor * to_unit'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('product_id', 'from_unit', 'to_unit', name='uq_unit_conversions_product_units'),
+    )
+    op.create_index('ix_unit_conversions_id', 'unit_conversions', ['id'])
+    op.create_index('ix_unit_conversions_units', 'unit_conversions', ['from_unit', 'to_unit'])
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_unit_conversions_units', table_name='unit_conversions')
+    op.drop_index('ix_unit_conversions_id', table_name='unit_conversions')
+    op.drop_table('unit_conversions')
+
+    op.drop_index('ix_supplier_products_product_id', table_name='supplier_products')
+    op.drop_index('ix_supplier_products_supplier_id', table_name='supplier_products')
+    op.drop_index('ix_supplier_products_id', table_name='supplier_products')
+    op.drop_table('supplier_products')
+
+    op.drop_index('ix_products_is_active', table_name='products')
+    op.drop_index('ix_products_category_id', table_name='products')
+    op.drop_index('ix_products_name', table_name='products')
+    op.drop_index('ix_products_code', table_name='products')
+    op.drop_index('ix_products_id', table_name='products')
+    op.drop_table('products')
+
+    op.drop_index('ix_product_categories_code', table_name='product_categories')
+    op.drop_index('ix_product_categories_id', table_name='product_categories')
+    op.drop_table('product_categories')
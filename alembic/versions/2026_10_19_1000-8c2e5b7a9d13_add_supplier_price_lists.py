@@ -0,0 +1,78 @@
+"""Add supplier price lists
+
+Revision ID: 8c2e5b7a9d13
+Revises: 3f9a1c7d2e41
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e5b7a9d13'
+down_revision: Union[str, None] = '3f9a1c7d2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Effective-dated supplier price lists
+    op.create_table(
+        'supplier_price_lists',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('supplier_id', sa.Integer(), nullable=False, comment='ID nhà cung cấp'),
+        sa.Column('code', sa.String(length=50), nullable=False, comment='Mã bảng giá'),
+        sa.Column('name', sa.String(length=200), nullable=False, comment='Tên bảng giá'),
+        sa.Column('valid_from', sa.Date(), nullable=False, comment='Ngày bắt đầu hiệu lực'),
+        sa.Column('valid_to', sa.Date(), nullable=True, comment='Ngày hết hiệu lực (NULL: không thời hạn)'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true'), comment='Trạng thái hoạt động'),
+        sa.Column('note', sa.Text(), nullable=True, comment='Ghi chú'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('supplier_id', 'code', name='uq_supplier_price_lists_supplier_code'),
+    )
+    op.create_index('ix_supplier_price_lists_id', 'supplier_price_lists', ['id'])
+    op.create_index('ix_supplier_price_lists_supplier_id', 'supplier_price_lists', ['supplier_id'])
+
+    # Prices; validity is copied from the price list for point-in-time lookups
+    op.create_table(
+        'supplier_price_list_items',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('price_list_id', sa.Integer(), nullable=False, comment='ID bảng giá'),
+        sa.Column('supplier_product_id', sa.Integer(), nullable=False, comment='ID sản phẩm của supplier'),
+        sa.Column('price', sa.Numeric(precision=15, scale=2), nullable=False, comment='Đơn giá theo đơn vị tính của supplier'),
+        sa.Column('valid_from', sa.Date(), nullable=False, comment='Ngày bắt đầu hiệu lực (theo bảng giá)'),
+        sa.Column('valid_to', sa.Date(), nullable=True, comment='Ngày hết hiệu lực (theo bảng giá)'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true'), comment='Trạng thái hoạt động (theo bảng giá)'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['price_list_id'], ['supplier_price_lists.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['supplier_product_id'], ['supplier_products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('price_list_id', 'supplier_product_id', name='uq_supplier_price_list_items_list_product'),
+    )
+    op.create_index('ix_supplier_price_list_items_id', 'supplier_price_list_items', ['id'])
+    op.create_index('ix_supplier_price_list_items_price_list_id', 'supplier_price_list_items', ['price_list_id'])
+    op.create_index(
+        'ix_supplier_price_list_items_product_valid_from',
+        'supplier_price_list_items',
+        ['supplier_product_id', 'valid_from'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_supplier_price_list_items_product_valid_from', table_name='supplier_price_list_items')
+    op.drop_index('ix_supplier_price_list_items_price_list_id', table_name='supplier_price_list_items')
+    op.drop_index('ix_supplier_price_list_items_id', table_name='supplier_price_list_items')
+    op.drop_table('supplier_price_list_items')
+
+    op.drop_index('ix_supplier_price_lists_supplier_id', table_name='supplier_price_lists')
+    op.drop_index('ix_supplier_price_lists_id', table_name='supplier_price_lists')
+    op.drop_table('supplier_price_lists')
@@ -0,0 +1,80 @@
+"""Add spend rollup tables
+
+Revision ID: 5d7f1e3b8a62
+Revises: 8c2e5b7a9d13
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7f1e3b8a62'
+down_revision: Union[str, None] = '8c2e5b7a9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Daily spend per supplier / restaurant / product
+    op.create_table(
+        'spend_daily_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('spend_date', sa.Date(), nullable=False, comment='Ngày giao hàng'),
+        sa.Column('supplier_id', sa.Integer(), nullable=False, comment='ID nhà cung cấp'),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False, comment='ID nhà hàng nhận hàng'),
+        sa.Column('product_id', sa.Integer(), nullable=False, comment='ID sản phẩm Aladdin'),
+        sa.Column('quantity', sa.Numeric(precision=18, scale=4), nullable=False, server_default='0', comment='Tổng số lượng (đơn vị chuẩn)'),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False, server_default='0', comment='Tổng thành tiền'),
+        sa.Column('line_count', sa.Integer(), nullable=False, server_default='0', comment='Số dòng phiếu giao hàng'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('spend_date', 'supplier_id', 'restaurant_id', 'product_id', name='uq_spend_daily_rollups_key'),
+    )
+    op.create_index('ix_spend_daily_rollups_id', 'spend_daily_rollups', ['id'])
+    op.create_index('ix_spend_daily_rollups_product_id', 'spend_daily_rollups', ['product_id'])
+    op.create_index('ix_spend_daily_rollups_restaurant_date', 'spend_daily_rollups', ['restaurant_id', 'spend_date'])
+    op.create_index('ix_spend_daily_rollups_supplier_date', 'spend_daily_rollups', ['supplier_id', 'spend_date'])
+
+    # Monthly spend per supplier / restaurant
+    op.create_table(
+        'spend_monthly_supplier_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Primary key'),
+        sa.Column('month', sa.Date(), nullable=False, comment='Ngày đầu tháng'),
+        sa.Column('supplier_id', sa.Integer(), nullable=False, comment='ID nhà cung cấp'),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False, comment='ID nhà hàng nhận hàng'),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False, server_default='0', comment='Tổng thành tiền'),
+        sa.Column('line_count', sa.Integer(), nullable=False, server_default='0', comment='Số dòng phiếu giao hàng'),
+        sa.Column('delivery_count', sa.Integer(), nullable=False, server_default='0', comment='Số phiếu giao hàng'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('month', 'supplier_id', 'restaurant_id', name='uq_spend_monthly_supplier_rollups_key'),
+    )
+    op.create_index('ix_spend_monthly_supplier_rollups_id', 'spend_monthly_supplier_rollups', ['id'])
+    op.create_index(
+        'ix_spend_monthly_supplier_rollups_supplier_month',
+        'spend_monthly_supplier_rollups',
+        ['supplier_id', 'month'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_spend_monthly_supplier_rollups_supplier_month', table_name='spend_monthly_supplier_rollups')
+    op.drop_index('ix_spend_monthly_supplier_rollups_id', table_name='spend_monthly_supplier_rollups')
+    op.drop_table('spend_monthly_supplier_rollups')
+
+    op.drop_index('ix_spend_daily_rollups_supplier_date', table_name='spend_daily_rollups')
+    op.drop_index('ix_spend_daily_rollups_restaurant_date', table_name='spend_daily_rollups')
+    op.drop_index('ix_spend_daily_rollups_product_id', table_name='spend_daily_rollups')
+    op.drop_index('ix_spend_daily_rollups_id', table_name='spend_daily_rollups')
+    op.drop_table('spend_daily_rollups')
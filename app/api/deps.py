@@ -6,19 +6,24 @@ This module provides dependency injection functions for:
 - Service instances
 - Repository instances
 - Permission checks
+- Sparse fieldsets and batch reads
 """
 
-from typing import Annotated, Any
+from typing import Annotated, Any, Callable, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants import MAX_BATCH_IDS
+from app.core.scope import set_supplier_scope_for_user
 from app.core.security import decode_token
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.repositories.item import ItemRepository
 from app.repositories.user import UserRepository
 from app.services.item_service import ItemService
+from app.services.loaders import Loaders
 from app.services.user_service import UserService
 
 # Security scheme for JWT Bearer token
@@ -26,16 +31,9 @@ security = HTTPBearer()
 
 
 # Database dependencies
-async def get_db_session() -> AsyncSession:
-    """Get database session dependency.
-    
-    This is a wrapper around get_db for clearer naming.
-    
-    Yields:
-        AsyncSession: Database session.
-    """
-    async for session in get_db():
-        yield session
+# The same callable as get_db, so every dependency of a request (repositories,
+# services, FastAPI-Users) resolves to one cached session and one commit
+get_db_session = get_db
 
 
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
@@ -144,6 +142,9 @@ async def get_current_user(
                 detail="Inactive user",
             )
         
+        # Restrict repository queries of this request to the user's supplier
+        set_supplier_scope_for_user(user)
+        
         return user
         
     except Exception as e:
@@ -263,3 +264,93 @@ async def get_current_user_optional(
 
 
 CurrentUserOptional = Annotated[Any | None, Depends(get_current_user_optional)]
+
+
+# Sparse fieldsets
+def sparse_fields(
+    schema: type[BaseModel],
+    model: type[Any],
+) -> Callable[..., Optional[tuple[str, ...]]]:
+    """Build a `?fields=` query dependency for a response schema.
+    
+    Only schema fields backed by a column of the model can be requested,
+    so the repository can select exactly those columns. `id` is always
+    included.
+    
+    Args:
+        schema: Full response schema.
+        model: SQLAlchemy model the schema is read from.
+        
+    Returns:
+        Dependency returning the requested field names in schema order,
+        or None if the parameter was not given.
+    """
+    columns = set(model.__table__.columns.keys())
+    allowed = tuple(name for name in schema.model_fields if name in columns)
+    
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Comma-separated subset of fields: {', '.join(allowed)}",
+        ),
+    ) -> Optional[tuple[str, ...]]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        requested.add("id")
+        return tuple(name for name in allowed if name in requested)
+    
+    return dependency
+
+
+# Batch reads
+def batch_ids(
+    ids: Optional[str] = Query(
+        None,
+        description=f"Comma-separated IDs to fetch in one request (max {MAX_BATCH_IDS})",
+    ),
+) -> Optional[tuple[int, ...]]:
+    """Parse the `?ids=` query parameter.
+    
+    Args:
+        ids: Comma-separated IDs.
+        
+    Returns:
+        Unique IDs in request order, or None if the parameter was not given.
+        
+    Raises:
+        HTTPException: If an ID is not an integer or there are too many.
+    """
+    if ids is None:
+        return None
+    try:
+        parsed = tuple(dict.fromkeys(int(part) for part in ids.split(",") if part.strip()))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers",
+        ) from e
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids can be requested at once",
+        )
+    return parsed
+
+
+def get_loaders(db: AsyncSession = Depends(get_read_db)) -> Loaders:
+    """Get the DataLoaders of the current request.
+    
+    Args:
+        db: Request read session.
+        
+    Returns:
+        Loaders instance (one per request).
+    """
+    return Loaders(db)
@@ -0,0 +1,148 @@
+"""Route class managing the database work of each request."""
+
+import asyncio
+import contextlib
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.profiling import trace_task
+from app.db.session import (
+    release_request_sessions,
+    track_request_sessions,
+    untrack_request_sessions,
+)
+from app.db.timeouts import (
+    end_request_queries,
+    interrupt_request_queries,
+    is_statement_timeout,
+    route_statement_timeout,
+    start_request_queries,
+)
+
+logger = get_logger(__name__)
+
+# Status of requests whose client went away (as logged by nginx)
+CLIENT_CLOSED_REQUEST = 499
+
+# Request being handled, for the disconnect watcher of its endpoint
+_current_request: ContextVar[Optional[Request]] = ContextVar("current_request", default=None)
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """Return once the client has disconnected.
+
+    Only runs after FastAPI has read the request body, so the body messages
+    it skips belong to endpoints that do not use the body.
+    """
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _cancel_on_disconnect(call: Coroutine[Any, Any, Any], request: Request) -> Any:
+    """Run an endpoint, cancelling it and its queries if the client disconnects."""
+    endpoint = asyncio.ensure_future(call)
+    trace_task(endpoint)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({endpoint, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not endpoint.done():
+            interrupt_request_queries()
+            endpoint.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await endpoint
+    if endpoint.cancelled():
+        logger.info(f"Client disconnected, cancelled {request.method} {request.url.path}")
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+    return endpoint.result()
+
+
+def _wrap_endpoint(call: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+    """Wrap an endpoint to watch for disconnects and release sessions once it returns."""
+
+    @functools.wraps(call)
+    async def endpoint(**values: Any) -> Any:
+        request = _current_request.get()
+        if settings.DATABASE_CANCEL_ON_DISCONNECT and request is not None:
+            result = await _cancel_on_disconnect(call(**values), request)
+        else:
+            result = await call(**values)
+        # Streaming bodies may still read from their session
+        if settings.DATABASE_RELEASE_EARLY and not isinstance(result, StreamingResponse):
+            await release_request_sessions()
+        return result
+
+    return endpoint
+
+
+class DBRoute(APIRoute):
+    """Route that manages the database work of its requests.
+
+    - Statements run under the route's timeout (`DATABASE_STATEMENT_TIMEOUT`
+      or its entry in `DATABASE_ROUTE_STATEMENT_TIMEOUTS`); a timeout is
+      answered with 504 and an exhausted connection pool with 503.
+    - With `DATABASE_CANCEL_ON_DISCONNECT`, the endpoint and its queries
+      are cancelled when the client disconnects, freeing the connection.
+    - FastAPI runs the cleanup of `yield` dependencies after the response
+      has been sent, so a `get_db` session would keep its connection
+      checked out while the result is serialized and written to the
+      client. With `DATABASE_RELEASE_EARLY`, sessions are committed (if
+      they wrote) or closed as soon as the endpoint returns, and commit
+      errors surface as error responses instead of happening after a 2xx
+      was sent.
+
+    Example:
+        ```python
+        router = APIRouter(route_class=DBRoute)
+        ```
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        """Create the route and wrap async endpoints."""
+        super().__init__(path, endpoint, **kwargs)
+        self.statement_timeout = route_statement_timeout(self.path)
+        # Signature analysis is done; the handler looks dependant.call up per request
+        if asyncio.iscoroutinefunction(endpoint):
+            self.dependant.call = _wrap_endpoint(endpoint)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Set up the database state of each request and map database timeouts."""
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            sessions_token = track_request_sessions()
+            queries_token = start_request_queries(self.statement_timeout)
+            request_token = _current_request.set(request)
+            try:
+                return await handler(request)
+            except PoolTimeoutError as e:
+                logger.warning(f"No database connection for {request.url.path}: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database is busy, retry shortly",
+                    headers={"Retry-After": "1"},
+                ) from e
+            except DBAPIError as e:
+                if not is_statement_timeout(e):
+                    raise
+                logger.warning(f"Statement timeout on {request.url.path}: {e.orig}")
+                raise HTTPException(
+                    status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                    detail="Database query timed out",
+                ) from e
+            finally:
+                _current_request.reset(request_token)
+                end_request_queries(queries_token)
+                untrack_request_sessions(sessions_token)
+
+        return route_handler
@@ -0,0 +1,104 @@
+"""
+Admin endpoints: worker profiling and slow request captures.
+Chỉ dành cho superuser.
+
+Profiles are speedscope files (open them at https://www.speedscope.app).
+Every worker profiles itself and keeps its own captures, so behind a load
+balancer a request reaches one worker at random.
+"""
+
+import os
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.api.deps import get_current_superuser
+from app.api.routing import DBRoute
+from app.core.config import settings
+from app.core.profiling import ProfilerBusy, profile_worker, slow_requests
+from app.db.session import release_request_sessions
+from app.models.user import User
+from app.schemas.profiling import SlowRequestDetail, SlowRequestSummary
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.get(
+    "/profile",
+    summary="Profile this worker",
+    description="Sample the worker's event loop for a few seconds and return a "
+    "speedscope profile.",
+)
+async def profile(
+    response: Response,
+    seconds: float = Query(10.0, gt=0, description="Sampling duration"),
+    interval_ms: Optional[float] = Query(
+        None, ge=1, description="Sampling interval (default PROFILING_INTERVAL_MS)"
+    ),
+    current_user: User = Depends(get_current_superuser),
+) -> dict[str, Any]:
+    """Sampling profile of the worker handling this request."""
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiles last at most {settings.PROFILING_MAX_SECONDS:g} seconds",
+        )
+    # Do not hold a database connection while sampling
+    await release_request_sessions()
+    try:
+        result = await profile_worker(
+            seconds, (interval_ms or settings.PROFILING_INTERVAL_MS) / 1000
+        )
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="worker-{os.getpid()}.speedscope.json"'
+    )
+    return result
+
+
+@router.get(
+    "/slow-requests",
+    response_model=list[SlowRequestSummary],
+    summary="List slow requests",
+    description="Requests of this worker that exceeded SLOW_REQUEST_THRESHOLD_MS, newest first.",
+)
+async def list_slow_requests(
+    current_user: User = Depends(get_current_superuser),
+) -> list[SlowRequestSummary]:
+    """Slow request captures of this worker."""
+    return [SlowRequestSummary.model_validate(c) for c in slow_requests.list()]
+
+
+@router.get(
+    "/slow-requests/{capture_id}",
+    response_model=SlowRequestDetail,
+    summary="Get slow request",
+    description="SQL trace and speedscope profile of a slow request.",
+)
+async def get_slow_request(
+    capture_id: int,
+    current_user: User = Depends(get_current_superuser),
+) -> SlowRequestDetail:
+    """One slow request capture."""
+    capture = slow_requests.get(capture_id)
+    if capture is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Slow request {capture_id} not found on this worker",
+        )
+    return SlowRequestDetail.model_validate(capture)
+
+
+@router.delete(
+    "/slow-requests",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Clear slow requests",
+)
+async def clear_slow_requests(
+    current_user: User = Depends(get_current_superuser),
+) -> None:
+    """Drop the slow request captures of this worker."""
+    slow_requests.clear()
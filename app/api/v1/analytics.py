@@ -0,0 +1,73 @@
+"""
+Purchasing analytics API endpoints.
+Báo cáo chi phí mua hàng từ các bảng tổng hợp.
+"""
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user, get_current_superuser, get_db, get_read_db
+from app.api.routing import DBRoute
+from app.models.user import User
+from app.schemas.analytics import ProductSpend, SpendDeliveryRecord, SupplierMonthlySpend
+from app.services.analytics_service import SpendAnalyticsService
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.get(
+    "/spend/suppliers/monthly",
+    response_model=list[SupplierMonthlySpend],
+    summary="Spend by supplier by month",
+)
+async def spend_by_supplier_by_month(
+    date_from: date = Query(..., description="Any day in the first month"),
+    date_to: date = Query(..., description="Any day in the last month"),
+    supplier_id: Optional[int] = Query(None, description="Filter by supplier"),
+    restaurant_id: Optional[int] = Query(None, description="Filter by restaurant"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[SupplierMonthlySpend]:
+    """Monthly spend per supplier, read from the monthly rollup."""
+    service = SpendAnalyticsService(db)
+    return await service.spend_by_supplier_by_month(
+        date_from, date_to, supplier_id=supplier_id, restaurant_id=restaurant_id
+    )
+
+
+@router.get(
+    "/spend/restaurants/{restaurant_id}/top-products",
+    response_model=list[ProductSpend],
+    summary="Top products of a restaurant",
+)
+async def top_products(
+    restaurant_id: int,
+    date_from: date = Query(..., description="First day (inclusive)"),
+    date_to: date = Query(..., description="Last day (inclusive)"),
+    limit: int = Query(10, ge=1, le=100, description="Number of products to return"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[ProductSpend]:
+    """Products with the highest spend, read from the daily rollup."""
+    service = SpendAnalyticsService(db)
+    return await service.top_products(restaurant_id, date_from, date_to, limit=limit)
+
+
+@router.post(
+    "/spend/deliveries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Record confirmed delivery note",
+    description="Add (or, with reverse=true, subtract) a confirmed delivery "
+    "note to the spend rollups. Superuser only.",
+)
+async def record_confirmed_delivery(
+    data: SpendDeliveryRecord,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser),
+) -> None:
+    """Apply a confirmed delivery note to the rollups."""
+    service = SpendAnalyticsService(db)
+    await service.record_confirmed_delivery(data)
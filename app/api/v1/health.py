@@ -1,9 +1,13 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
 from app.core.config import settings
-from app.schemas.common import HealthCheck
+from app.core.health import health_monitor
+from app.schemas.common import HealthCheck, ReadinessCheck
+
+# Probe outcomes as reported by the summary endpoint
+_PROBE_STATES = {"ok": "connected", "error": "disconnected", "timeout": "timeout"}
 
 router = APIRouter()
 
@@ -18,20 +22,69 @@ router = APIRouter()
 async def health_check() -> HealthCheck:
     """Health check endpoint.
     
-    Returns basic information about the service status.
+    Returns basic information about the service status, from the
+    (briefly cached) dependency probes.
     
     Returns:
         HealthCheck: Service health information.
     """
+    report = await health_monitor.check()
     return HealthCheck(
-        status="healthy",
+        status="healthy" if report.status == "ready" else "unhealthy",
         version=settings.APP_VERSION,
         environment=settings.ENVIRONMENT,
-        database="connected",  # TODO: Add actual database health check
-        cache="connected" if settings.REDIS_URL else None,
+        database=_PROBE_STATES[report.database.status],
+        cache=_PROBE_STATES[report.cache.status] if report.cache else None,
     )
 
 
+@router.get(
+    "/live",
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="Check the process is serving requests (no dependency checks)",
+)
+async def liveness() -> dict[str, str]:
+    """Liveness probe.
+    
+    Does not touch the database: a slow database must not get the
+    process restarted, only taken out of rotation (see /ready).
+    
+    Returns:
+        dict: Liveness status.
+    """
+    return {"status": "alive"}
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessCheck,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness probe",
+    description=(
+        "Probe the database and cache; 503 when the database is unreachable "
+        "or the connection pool is exhausted"
+    ),
+    responses={503: {"model": ReadinessCheck, "description": "Not ready"}},
+)
+async def readiness(response: Response) -> ReadinessCheck:
+    """Readiness probe.
+    
+    Probe results are cached for HEALTH_CACHE_TTL seconds.
+    
+    Args:
+        response: Response to set the status code on.
+        
+    Returns:
+        ReadinessCheck: Probe results and pool usage.
+    """
+    report = await health_monitor.check()
+    response.headers["Cache-Control"] = "no-store"
+    if report.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
 @router.get(
     "/ping",
     status_code=status.HTTP_200_OK,
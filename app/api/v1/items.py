@@ -3,11 +3,12 @@
 from fastapi import APIRouter, Query, status
 
 from app.api.deps import CurrentUser, ItemSvc
+from app.api.routing import DBRoute
 from app.schemas.base import PaginatedResponse, PaginationParams
 from app.schemas.common import Message
 from app.schemas.item import ItemCreate, ItemListResponse, ItemResponse, ItemUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=DBRoute)
 
 
 @router.get(
@@ -0,0 +1,127 @@
+"""
+Supplier price list API endpoints.
+Quản lý bảng giá nhà cung cấp và kiểm tra giá phiếu giao hàng.
+"""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user, get_db, get_read_db
+from app.api.routing import DBRoute
+from app.models.user import User
+from app.schemas.common import PaginatedResponse
+from app.schemas.price_list import (
+    DeliveryPriceValidationRequest,
+    DeliveryPriceValidationResponse,
+    SupplierPriceListCreate,
+    SupplierPriceListRead,
+    SupplierPriceListUpdate,
+)
+from app.services.price_list_service import PriceListService
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.post(
+    "",
+    response_model=SupplierPriceListRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create price list",
+)
+async def create_price_list(
+    data: SupplierPriceListCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierPriceListRead:
+    """Create a supplier price list with its prices."""
+    service = PriceListService(db)
+    price_list = await service.create_price_list(data)
+    return SupplierPriceListRead.model_validate(price_list)
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[SupplierPriceListRead],
+    summary="List price lists",
+)
+async def list_price_lists(
+    supplier_id: int = Query(..., description="Supplier ID"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PaginatedResponse[SupplierPriceListRead]:
+    """List price lists of a supplier, newest first."""
+    service = PriceListService(db)
+    price_lists, total = await service.list_price_lists(supplier_id, skip=skip, limit=limit)
+    return PaginatedResponse(
+        items=[SupplierPriceListRead.model_validate(p) for p in price_lists],
+        total=total,
+        skip=skip,
+        limit=limit,
+    )
+
+
+@router.post(
+    "/validate",
+    response_model=DeliveryPriceValidationResponse,
+    summary="Validate delivery note prices",
+    description="Check the price and money of each delivery line against the "
+    "agreed supplier price valid on the delivery date.",
+)
+async def validate_delivery_prices(
+    data: DeliveryPriceValidationRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> DeliveryPriceValidationResponse:
+    """Validate delivery line prices against price lists."""
+    service = PriceListService(db)
+    return await service.validate_delivery_prices(data)
+
+
+@router.get(
+    "/{price_list_id}",
+    response_model=SupplierPriceListRead,
+    summary="Get price list by ID",
+)
+async def get_price_list(
+    price_list_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierPriceListRead:
+    """Get price list details with prices."""
+    service = PriceListService(db)
+    price_list = await service.get_price_list(price_list_id)
+    return SupplierPriceListRead.model_validate(price_list)
+
+
+@router.patch(
+    "/{price_list_id}",
+    response_model=SupplierPriceListRead,
+    summary="Update price list",
+)
+async def update_price_list(
+    price_list_id: int,
+    data: SupplierPriceListUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierPriceListRead:
+    """Update price list name, end date or status."""
+    service = PriceListService(db)
+    price_list = await service.update_price_list(price_list_id, data)
+    return SupplierPriceListRead.model_validate(price_list)
+
+
+@router.delete(
+    "/{price_list_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete price list",
+)
+async def delete_price_list(
+    price_list_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> None:
+    """Delete a price list and its prices."""
+    service = PriceListService(db)
+    await service.delete_price_list(price_list_id)
@@ -0,0 +1,291 @@
+"""
+Product catalog API endpoints.
+Quản lý danh mục sản phẩm chuẩn và mapping sản phẩm của nhà cung cấp.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user, get_db, get_read_db, sparse_fields
+from app.api.routing import DBRoute
+from app.core.etag import check_etag
+from app.core.serialization import column_plan, json_response, render_item, render_page
+from app.models.product import Product
+from app.models.user import User
+from app.schemas.common import PaginatedResponse
+from app.schemas.product import (
+    ProductCategoryCreate,
+    ProductCategoryRead,
+    ProductCreate,
+    ProductMatchRequest,
+    ProductMatchResponse,
+    ProductRead,
+    ProductUpdate,
+    SupplierItemResolveRequest,
+    SupplierItemResolveResponse,
+    SupplierProductCreate,
+    SupplierProductRead,
+    SupplierProductUpdate,
+    UnitConversionCreate,
+    UnitConversionRead,
+)
+from app.services.product_service import ProductService
+
+router = APIRouter(route_class=DBRoute)
+
+product_fields = sparse_fields(ProductRead, Product)
+
+
+@router.post(
+    "/categories",
+    response_model=ProductCategoryRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create product category",
+)
+async def create_category(
+    data: ProductCategoryCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ProductCategoryRead:
+    """Create a new product category."""
+    service = ProductService(db)
+    category = await service.create_category(data)
+    return ProductCategoryRead.model_validate(category)
+
+
+@router.get(
+    "/categories",
+    response_model=PaginatedResponse[ProductCategoryRead],
+    summary="List product categories",
+)
+async def list_categories(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PaginatedResponse[ProductCategoryRead]:
+    """List product categories with pagination."""
+    service = ProductService(db)
+    categories, total = await service.list_categories(skip=skip, limit=limit)
+    return PaginatedResponse(
+        items=[ProductCategoryRead.model_validate(c) for c in categories],
+        total=total,
+        skip=skip,
+        limit=limit,
+    )
+
+
+@router.post(
+    "",
+    response_model=ProductRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create product",
+)
+async def create_product(
+    data: ProductCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ProductRead:
+    """Create a new canonical product."""
+    service = ProductService(db)
+    product = await service.create_product(data)
+    return ProductRead.model_validate(product)
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[ProductRead],
+    summary="List products",
+)
+async def list_products(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
+    category_id: Optional[int] = Query(None, description="Filter by category"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    fields: Optional[tuple[str, ...]] = Depends(product_fields),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PaginatedResponse[ProductRead] | Response:
+    """List canonical products with pagination and filters (304 if unchanged)."""
+    service = ProductService(db)
+    etag = await service.list_products_etag(
+        skip=skip, limit=limit, category_id=category_id, is_active=is_active, fields=fields
+    )
+    if (not_modified := check_etag(request, response, etag)) is not None:
+        return not_modified
+    plan = column_plan(ProductRead, fields)
+    rows, total = await service.list_product_fields(
+        plan.fields, skip=skip, limit=limit, category_id=category_id, is_active=is_active
+    )
+    return json_response(response, render_page(plan, rows, total, skip, limit))
+
+
+@router.post(
+    "/mappings/resolve",
+    response_model=SupplierItemResolveResponse,
+    summary="Resolve supplier items",
+    description="Resolve a batch of supplier item codes (e.g. one delivery note) "
+    "to canonical products using the in-memory catalog index.",
+)
+async def resolve_supplier_items(
+    data: SupplierItemResolveRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierItemResolveResponse:
+    """Resolve supplier item codes to canonical products."""
+    service = ProductService(db)
+    return await service.resolve_supplier_items(data.supplier_code, data.iit_codes)
+
+
+@router.post(
+    "/mappings/match",
+    response_model=ProductMatchResponse,
+    summary="Suggest products for supplier items",
+    description="Suggest canonical products for a batch of supplier item lines "
+    "(e.g. the unmapped lines of one delivery note) by fuzzy name matching.",
+)
+async def match_supplier_items(
+    data: ProductMatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ProductMatchResponse:
+    """Suggest top-k canonical products for each supplier item line."""
+    service = ProductService(db)
+    return await service.match_supplier_items(
+        data.lines,
+        supplier_code=data.supplier_code,
+        top_k=data.top_k,
+        min_score=data.min_score,
+    )
+
+
+@router.post(
+    "/supplier-products",
+    response_model=SupplierProductRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Map supplier item to product",
+)
+async def create_supplier_product(
+    data: SupplierProductCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierProductRead:
+    """Map a supplier's item code to a canonical product."""
+    service = ProductService(db)
+    supplier_product = await service.create_supplier_product(data)
+    return SupplierProductRead.model_validate(supplier_product)
+
+
+@router.get(
+    "/supplier-products",
+    response_model=list[SupplierProductRead],
+    summary="List supplier product mappings",
+)
+async def list_supplier_products(
+    supplier_id: int = Query(..., description="Supplier ID"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[SupplierProductRead]:
+    """List product mappings of a supplier."""
+    service = ProductService(db)
+    supplier_products = await service.list_supplier_products(
+        supplier_id, skip=skip, limit=limit
+    )
+    return [SupplierProductRead.model_validate(sp) for sp in supplier_products]
+
+
+@router.patch(
+    "/supplier-products/{supplier_product_id}",
+    response_model=SupplierProductRead,
+    summary="Update supplier product mapping",
+)
+async def update_supplier_product(
+    supplier_product_id: int,
+    data: SupplierProductUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SupplierProductRead:
+    """Update a supplier product mapping."""
+    service = ProductService(db)
+    supplier_product = await service.update_supplier_product(supplier_product_id, data)
+    return SupplierProductRead.model_validate(supplier_product)
+
+
+@router.delete(
+    "/supplier-products/{supplier_product_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete supplier product mapping",
+)
+async def delete_supplier_product(
+    supplier_product_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> None:
+    """Delete a supplier product mapping."""
+    service = ProductService(db)
+    await service.delete_supplier_product(supplier_product_id)
+
+
+@router.post(
+    "/unit-conversions",
+    response_model=UnitConversionRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create unit conversion rule",
+)
+async def create_unit_conversion(
+    data: UnitConversionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> UnitConversionRead:
+    """Create a unit conversion rule (generic or product-specific)."""
+    service = ProductService(db)
+    conversion = await service.create_unit_conversion(data)
+    return UnitConversionRead.model_validate(conversion)
+
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductRead,
+    summary="Get product by ID",
+)
+async def get_product(
+    product_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[tuple[str, ...]] = Depends(product_fields),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ProductRead | Response:
+    """Get canonical product details (304 if unchanged)."""
+    service = ProductService(db)
+    etag = await service.get_product_etag(product_id, fields=fields)
+    if (not_modified := check_etag(request, response, etag)) is not None:
+        return not_modified
+    if fields is not None:
+        row = await service.get_product_fields(product_id, fields)
+        return json_response(response, render_item(column_plan(ProductRead, fields), row))
+    product = await service.get_product(product_id)
+    return ProductRead.model_validate(product)
+
+
+@router.patch(
+    "/{product_id}",
+    response_model=ProductRead,
+    summary="Update product",
+)
+async def update_product(
+    product_id: int,
+    data: ProductUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ProductRead:
+    """Update canonical product."""
+    service = ProductService(db)
+    product = await service.update_product(product_id, data)
+    return ProductRead.model_validate(product)
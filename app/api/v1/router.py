@@ -5,7 +5,17 @@ This module combines all v1 routes into a single router.
 
 from fastapi import APIRouter
 
-from app.api.v1 import auth, health, items, suppliers, users
+from app.api.v1 import (
+    admin,
+    analytics,
+    auth,
+    health,
+    items,
+    price_lists,
+    products,
+    suppliers,
+    users,
+)
 from app.core.constants import API_V1_PREFIX
 
 # Create main router for v1
@@ -38,3 +48,27 @@ router.include_router(
     prefix="/suppliers",
     tags=["Suppliers"],
 )
+
+router.include_router(
+    products.router,
+    prefix="/products",
+    tags=["Products"],
+)
+
+router.include_router(
+    price_lists.router,
+    prefix="/price-lists",
+    tags=["Price Lists"],
+)
+
+router.include_router(
+    analytics.router,
+    prefix="/analytics",
+    tags=["Analytics"],
+)
+
+router.include_router(
+    admin.router,
+    prefix="/admin",
+    tags=["Admin"],
+)
@@ -5,21 +5,42 @@ Provides CRUD operations for supplier management in YCMS.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_db
+from app.api.deps import (
+    batch_ids,
+    get_current_active_user,
+    get_db,
+    get_loaders,
+    get_read_db,
+    sparse_fields,
+)
+from app.api.routing import DBRoute
+from app.core.etag import check_etag
+from app.core.serialization import (
+    column_plan,
+    json_response,
+    render_batch,
+    render_item,
+    render_page,
+)
+from app.models.supplier import Supplier
 from app.models.user import User, UserRole
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import BatchResponse, PaginatedResponse
 from app.schemas.supplier import (
     SupplierCreate,
     SupplierList,
     SupplierRead,
     SupplierUpdate,
 )
+from app.services.loaders import Loaders
 from app.services.supplier_service import SupplierService
 
-router = APIRouter()
+router = APIRouter(route_class=DBRoute)
+
+# ?fields= may name any column-backed field of SupplierRead
+supplier_fields = sparse_fields(SupplierRead, Supplier)
 
 
 @router.post(
@@ -56,39 +77,56 @@ async def create_supplier(
 
 @router.get(
     "",
-    response_model=PaginatedResponse[SupplierList],
+    response_model=PaginatedResponse[SupplierList] | BatchResponse[SupplierList],
     summary="List suppliers",
-    description="Get paginated list of suppliers with optional filtering.",
+    description="Get paginated list of suppliers with optional filtering, "
+                "or many suppliers by ID with `?ids=`.",
 )
 async def list_suppliers(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[tuple[str, ...]] = Depends(supplier_fields),
+    ids: Optional[tuple[int, ...]] = Depends(batch_ids),
+    db: AsyncSession = Depends(get_read_db),
+    loaders: Loaders = Depends(get_loaders),
     current_user: User = Depends(get_current_active_user),
-) -> PaginatedResponse[SupplierList]:
+) -> PaginatedResponse[SupplierList] | BatchResponse[SupplierList] | Response:
     """
     List all suppliers with pagination.
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 50, max: 100)
     - **is_active**: Optional filter by active status
+    - **fields**: Optional comma-separated fields to return (e.g. `id,code,name`
+      for dropdowns); only those columns are selected
+    - **ids**: Optional comma-separated IDs; returns those suppliers in the
+      requested order plus the IDs not found, ignoring paging and filters
     
-    Returns paginated list with total count.
+    Returns paginated list with total count. Answers 304 if the
+    If-None-Match header carries the current ETag.
     """
+    plan = column_plan(SupplierRead, fields) if fields is not None else column_plan(SupplierList)
+    if ids is not None:
+        found = await loaders.suppliers.load_many(ids)
+        rows = [{f: getattr(s, f) for f in plan.fields} for s in found if s is not None]
+        missing = [id for id, s in zip(ids, found, strict=True) if s is None]
+        return json_response(response, render_batch(plan, rows, missing))
+    
     service = SupplierService(db)
-    suppliers, total = await service.list_suppliers(
-        skip=skip,
-        limit=limit,
-        is_active=is_active,
+    etag = await service.list_suppliers_etag(
+        skip=skip, limit=limit, is_active=is_active, fields=fields
     )
+    if (not_modified := check_etag(request, response, etag)) is not None:
+        return not_modified
     
-    return PaginatedResponse(
-        items=[SupplierList.model_validate(s) for s in suppliers],
-        total=total,
-        skip=skip,
-        limit=limit,
+    # Rows are rendered straight from the selected columns (no schema instances)
+    rows, total = await service.list_supplier_fields(
+        plan.fields, skip=skip, limit=limit, is_active=is_active, version=etag
     )
+    return json_response(response, render_page(plan, rows, total, skip, limit))
 
 
 @router.get(
@@ -100,7 +138,7 @@ async def list_suppliers(
 async def search_suppliers(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> list[SupplierList]:
     """
@@ -124,19 +162,30 @@ async def search_suppliers(
 )
 async def get_supplier(
     supplier_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[tuple[str, ...]] = Depends(supplier_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
-) -> SupplierRead:
+) -> SupplierRead | Response:
     """
     Get supplier details by ID.
     
     - **supplier_id**: ID of the supplier to retrieve
+    - **fields**: Optional comma-separated fields to return
     
     Returns full supplier information including timestamps and audit fields.
+    Answers 304 if the If-None-Match header carries the current ETag.
     """
     service = SupplierService(db)
-    supplier = await service.get_supplier(supplier_id)
-    return SupplierRead.model_validate(supplier)
+    etag = await service.get_supplier_etag(supplier_id, fields=fields)
+    if (not_modified := check_etag(request, response, etag)) is not None:
+        return not_modified
+    
+    if fields is not None:
+        row = await service.get_supplier_fields(supplier_id, fields, version=etag)
+        return json_response(response, render_item(column_plan(SupplierRead, fields), row))
+    return await service.get_supplier(supplier_id, version=etag)
 
 
 @router.patch(
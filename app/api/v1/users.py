@@ -1,13 +1,24 @@
 """User endpoints."""
 
-from fastapi import APIRouter, status
+from typing import Optional
 
-from app.api.deps import CurrentAdmin, CurrentUser, UserSvc
+from fastapi import APIRouter, Depends, Response, status
+
+from app.api.deps import CurrentAdmin, CurrentUser, UserSvc, batch_ids, get_loaders
+from app.api.routing import DBRoute
+from app.core.serialization import json_response
 from app.schemas.base import PaginatedResponse, PaginationParams
-from app.schemas.common import Message
-from app.schemas.user import UserListResponse, UserProfileUpdate, UserRead, UserRoleUpdate
+from app.schemas.common import BatchResponse, Message
+from app.schemas.user import (
+    UserList,
+    UserListResponse,
+    UserProfileUpdate,
+    UserRead,
+    UserRoleUpdate,
+)
+from app.services.loaders import Loaders
 
-router = APIRouter()
+router = APIRouter(route_class=DBRoute)
 
 
 @router.get(
@@ -59,26 +70,43 @@ async def update_current_user_profile(
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[UserListResponse],
+    response_model=PaginatedResponse[UserListResponse] | BatchResponse[UserList],
     status_code=status.HTTP_200_OK,
     summary="List users",
-    description="Get a paginated list of users (admin only)",
+    description="Get a paginated list of users, or many users by ID with `?ids=` (admin only)",
 )
 async def list_users(
     pagination: PaginationParams,
     current_admin: CurrentAdmin,
     service: UserSvc,
-) -> PaginatedResponse[UserListResponse]:
+    response: Response,
+    ids: Optional[tuple[int, ...]] = Depends(batch_ids),
+    loaders: Loaders = Depends(get_loaders),
+) -> PaginatedResponse[UserListResponse] | Response:
     """List all users with pagination (admin only).
     
+    With `?ids=1,2,3` returns those users in the requested order plus the
+    IDs not found, in one query, instead of a page.
+    
     Args:
         pagination: Pagination parameters.
         current_admin: Current admin user.
         service: User service instance.
+        response: Response whose headers are kept on batch reads.
+        ids: Optional IDs for a batch read.
+        loaders: Request DataLoaders.
         
     Returns:
         PaginatedResponse: Paginated list of users.
     """
+    if ids is not None:
+        found = await loaders.users.load_many(ids)
+        batch = BatchResponse[UserList](
+            items=[UserList.model_validate(user) for user in found if user is not None],
+            missing=[id for id, user in zip(ids, found, strict=True) if user is None],
+        )
+        return json_response(response, batch.model_dump_json().encode())
+    
     users, total = await service.get_users(
         skip=pagination.skip,
         limit=pagination.limit,
@@ -14,6 +14,7 @@ from fastapi_users.authentication import (
 )
 
 from app.core.config import settings
+from app.core.security import LOGIN_TOKEN_AUDIENCE
 from app.core.users import get_user_manager
 from app.models.user import User
 
@@ -37,6 +38,7 @@ def get_jwt_strategy() -> JWTStrategy:
         secret=settings.SECRET_KEY,
         lifetime_seconds=3600,  # 1 hour
         algorithm="HS256",
+        token_audience=[LOGIN_TOKEN_AUDIENCE],
     )
 
 
@@ -0,0 +1,518 @@
+"""Two-tier cache for service read methods.
+
+- L1: in-process LRU with per-entry TTL. Holds the returned objects
+  themselves, so a hit costs a dict lookup.
+- L2: optional shared tier (Redis when `REDIS_URL` is set, or
+  `MemoryBackend` in tests). Holds JSON produced from the method's return
+  annotation, so other workers can reuse entries.
+
+Entries carry tags. Writers register `invalidate_tags()` with
+`after_commit()` so it runs once the request commits, which
+drops matching entries from both tiers. The L2 tier broadcasts every
+invalidation (Redis pub/sub), and each worker drops the tags from its own
+L1 tier. L1 TTLs are always capped at `CACHE_TTL_SHORT`, which bounds
+staleness if a broadcast is lost. Without a shared tier nothing can reach
+the other workers, so `init_cache()` disables the cache when `WORKERS > 1`
+and `REDIS_URL` is not set.
+
+Example:
+    ```python
+    class SupplierService:
+        @cached("supplier", ttl=CACHE_TTL_MEDIUM, tags=["suppliers", "supplier:{supplier_id}"])
+        async def get_supplier(self, supplier_id: int) -> SupplierRead:
+            ...
+
+        async def update_supplier(self, supplier_id: int, ...) -> Supplier:
+            ...
+            await self.session.flush()
+            after_commit(
+                self.session, get_cache().invalidate_tags, "suppliers", f"supplier:{supplier_id}"
+            )
+    ```
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Protocol, TypeVar, get_type_hints
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.constants import CACHE_TTL_SHORT
+from app.core.logging import get_logger
+from app.core.scope import get_supplier_scope
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+KEY_PREFIX = "cache"
+TAG_PREFIX = "cache-tag"
+INVALIDATION_CHANNEL = "cache-invalidate"
+
+# Receives the tags of an invalidation, or None if some may have been missed
+InvalidationHandler = Callable[[Optional[list[str]]], None]
+
+
+class CacheBackend(Protocol):
+    """Shared (L2) cache tier storing serialized values."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value, or None on miss."""
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str]) -> None:
+        """Store a value with a TTL in seconds and attach it to tags."""
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Delete every value attached to any of the tags and broadcast the tags."""
+
+    def subscribe(self, on_invalidate: InvalidationHandler) -> None:
+        """Call `on_invalidate` for every invalidation broadcast by any worker."""
+
+    async def clear(self) -> None:
+        """Delete every value."""
+
+    async def ping(self) -> None:
+        """Check the backend is reachable (raises if not)."""
+
+    async def close(self) -> None:
+        """Release connections."""
+
+
+class LocalCache:
+    """In-process LRU cache with per-entry expiry and tag index."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Entries beyond this are evicted least recently used first.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Get a value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (hit, value).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key.
+            value: Value to store; returned as-is on hit.
+            ttl: Time to live in seconds.
+            tags: Tags to attach.
+        """
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop every entry attached to any of the tags."""
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its tag references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class MemoryBackend:
+    """In-memory stand-in for the Redis tier (tests, single-process dev)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty backend."""
+        self._local = LocalCache(max_entries=1_000_000)
+        self._subscribers: list[InvalidationHandler] = []
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value, or None on miss."""
+        hit, value = self._local.get(key)
+        return value if hit else None
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str]) -> None:
+        """Store a value with a TTL and attach it to tags."""
+        self._local.set(key, value, ttl, tags)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Delete every value attached to any of the tags and notify subscribers."""
+        tags = list(tags)
+        self._local.invalidate_tags(tags)
+        for on_invalidate in self._subscribers:
+            on_invalidate(tags)
+
+    def subscribe(self, on_invalidate: InvalidationHandler) -> None:
+        """Call `on_invalidate` for every invalidation of this backend."""
+        self._subscribers.append(on_invalidate)
+
+    async def clear(self) -> None:
+        """Delete every value."""
+        self._local.clear()
+
+    async def ping(self) -> None:
+        """Always reachable."""
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class RedisBackend:
+    """Redis tier. Tags are Redis sets holding the keys attached to them."""
+
+    def __init__(self, url: str) -> None:
+        """Create a client; connections are opened lazily.
+
+        Args:
+            url: Redis connection URL.
+        """
+        from redis import asyncio as redis
+
+        self._client = redis.from_url(url)
+        self._listener: Optional[asyncio.Task] = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value, or None on miss."""
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str]) -> None:
+        """Store a value with a TTL and attach it to tags."""
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ttl)
+            # Tag sets outlive their members so invalidation can still find them
+            tag_ttl = max(ttl, settings.REDIS_CACHE_TTL)
+            for tag in tags:
+                tag_key = f"{TAG_PREFIX}:{tag}"
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, tag_ttl)
+            await pipe.execute()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Delete every value attached to any of the tags and publish the tags."""
+        tags = list(tags)
+        if not tags:
+            return
+        tag_keys = [f"{TAG_PREFIX}:{tag}" for tag in tags]
+        members = await self._client.sunion(tag_keys)
+        await self._client.delete(*members, *tag_keys)
+        await self._client.publish(INVALIDATION_CHANNEL, orjson.dumps(tags))
+
+    def subscribe(self, on_invalidate: InvalidationHandler) -> None:
+        """Call `on_invalidate` for every invalidation published by any worker.
+
+        A listener task runs until `close()`. Must be called from the event loop.
+        """
+        self._listener = asyncio.get_running_loop().create_task(self._listen(on_invalidate))
+
+    async def _listen(self, on_invalidate: InvalidationHandler) -> None:
+        """Forward published invalidations, resubscribing after connection errors."""
+        missed = False
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    if missed:
+                        # Invalidations published while disconnected are lost
+                        on_invalidate(None)
+                        missed = False
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            on_invalidate(orjson.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                missed = True
+                await asyncio.sleep(1)
+
+    async def clear(self) -> None:
+        """Delete every cache value and tag set."""
+        async for key in self._client.scan_iter(match=f"{KEY_PREFIX}:*"):
+            await self._client.delete(key)
+        async for key in self._client.scan_iter(match=f"{TAG_PREFIX}:*"):
+            await self._client.delete(key)
+
+    async def ping(self) -> None:
+        """Check Redis is reachable."""
+        await self._client.ping()
+
+    async def close(self) -> None:
+        """Stop the invalidation listener and close the connection pool."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._client.aclose()
+
+
+class TieredCache:
+    """L1 local cache in front of an optional shared L2 backend.
+
+    L2 errors are logged and treated as misses: the cache never fails a
+    request that the database could answer. The L1 tier follows the
+    invalidations the L2 backend broadcasts, including other workers' ones.
+    """
+
+    def __init__(
+        self,
+        local: Optional[LocalCache] = None,
+        backend: Optional[CacheBackend] = None,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            local: L1 tier; a default-sized LocalCache if omitted.
+            backend: Optional L2 tier.
+            enabled: When False every call goes straight to the method.
+        """
+        self.local = local if local is not None else LocalCache()
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        if backend is not None:
+            backend.subscribe(self._drop_local)
+
+    def _drop_local(self, tags: Optional[list[str]]) -> None:
+        """Apply a broadcast invalidation to L1 (None drops everything)."""
+        if tags is None:
+            self.local.clear()
+        else:
+            self.local.invalidate_tags(tags)
+
+    async def get(
+        self,
+        key: str,
+        adapter: TypeAdapter,
+        ttl: int,
+        tags: tuple[str, ...],
+    ) -> tuple[bool, Any]:
+        """Look a key up in L1, then L2 (filling L1 on an L2 hit)."""
+        hit, value = self.local.get(key)
+        if hit:
+            self.hits += 1
+            return True, value
+
+        if self.backend is not None:
+            try:
+                raw = await self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"Cache backend get failed: {e}")
+                raw = None
+            if raw is not None:
+                self.hits += 1
+                value = adapter.validate_json(raw)
+                self.local.set(key, value, min(ttl, CACHE_TTL_SHORT), tags)
+                return True, value
+
+        self.misses += 1
+        return False, None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        adapter: TypeAdapter,
+        ttl: int,
+        tags: tuple[str, ...],
+    ) -> None:
+        """Store a value in both tiers."""
+        self.local.set(key, value, min(ttl, CACHE_TTL_SHORT), tags)
+        if self.backend is not None:
+            try:
+                await self.backend.set(key, adapter.dump_json(value), ttl, tags)
+            except Exception as e:
+                logger.warning(f"Cache backend set failed: {e}")
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Drop every entry attached to any of the tags from both tiers."""
+        self.local.invalidate_tags(tags)
+        if self.backend is not None:
+            try:
+                await self.backend.invalidate_tags(tags)
+            except Exception as e:
+                logger.warning(f"Cache backend invalidation failed: {e}")
+
+    async def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        self.local.clear()
+        if self.backend is not None:
+            await self.backend.clear()
+
+    async def close(self) -> None:
+        """Release backend connections."""
+        if self.backend is not None:
+            await self.backend.close()
+
+
+_cache = TieredCache(enabled=settings.CACHE_ENABLED)
+
+
+def get_cache() -> TieredCache:
+    """Get the process-wide cache."""
+    return _cache
+
+
+def set_cache(cache: TieredCache) -> None:
+    """Replace the process-wide cache (startup, tests)."""
+    global _cache
+    _cache = cache
+
+
+async def init_cache() -> None:
+    """Configure the process-wide cache from settings.
+
+    Several workers without a shared tier could not invalidate each other's
+    entries, so the cache is disabled in that case.
+    """
+    backend: Optional[CacheBackend] = None
+    if settings.REDIS_URL:
+        try:
+            backend = RedisBackend(settings.REDIS_URL)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+    enabled = settings.CACHE_ENABLED
+    if enabled and backend is None and settings.WORKERS > 1:
+        logger.warning(
+            f"Cache disabled: {settings.WORKERS} workers need REDIS_URL to share invalidations"
+        )
+        enabled = False
+    set_cache(
+        TieredCache(
+            local=LocalCache(max_entries=settings.CACHE_LOCAL_MAX_ENTRIES),
+            backend=backend,
+            enabled=enabled,
+        )
+    )
+    if enabled:
+        logger.info(f"Cache initialized ({'local + redis' if backend else 'local only'})")
+
+
+async def close_cache() -> None:
+    """Close the process-wide cache."""
+    await _cache.close()
+
+
+def _default(value: Any) -> Any:
+    """Fallback for key serialization of non-JSON arguments."""
+    return str(value)
+
+
+def make_key(namespace: str, arguments: dict[str, Any]) -> str:
+    """Build a cache key from a namespace, call arguments and the scope.
+
+    The current supplier scope is part of the key, so a supplier user never
+    receives an entry computed for another principal.
+
+    Args:
+        namespace: Method namespace.
+        arguments: Bound call arguments (without self).
+
+    Returns:
+        Cache key.
+    """
+    scope = get_supplier_scope()
+    payload = orjson.dumps(arguments, default=_default, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{KEY_PREFIX}:{namespace}:{'all' if scope is None else scope}:{digest}"
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[int] = None,
+    tags: Iterable[str] = (),
+) -> Callable[[F], F]:
+    """Cache the result of an async function or method.
+
+    The return annotation drives (de)serialization for the L2 tier.
+    Exceptions are not cached.
+
+    Args:
+        namespace: Key namespace, unique per cached method.
+        ttl: Time to live in seconds; defaults to `REDIS_CACHE_TTL`.
+        tags: Tag templates formatted with the call arguments,
+            e.g. "supplier:{supplier_id}".
+
+    Returns:
+        Decorator.
+    """
+    tag_templates = tuple(tags)
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        adapter: Optional[TypeAdapter] = None
+
+        def get_adapter() -> TypeAdapter:
+            nonlocal adapter
+            if adapter is None:
+                adapter = TypeAdapter(get_type_hints(func)["return"])
+            return adapter
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_cache()
+            if not cache.enabled:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k not in ("self", "cls")}
+            key = make_key(namespace, arguments)
+            entry_ttl = ttl if ttl is not None else settings.REDIS_CACHE_TTL
+            entry_tags = tuple(t.format(**arguments) for t in tag_templates)
+
+            hit, value = await cache.get(key, get_adapter(), entry_ttl, entry_tags)
+            if hit:
+                return value
+
+            value = await func(*args, **kwargs)
+            await cache.set(key, value, get_adapter(), entry_ttl, entry_tags)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
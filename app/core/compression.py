@@ -0,0 +1,236 @@
+"""Response compression with content negotiation.
+
+Replaces Starlette's `GZipMiddleware`:
+
+- negotiates zstd, brotli or gzip from `Accept-Encoding` (q-values
+  honoured; on ties the server prefers zstd > br > gzip). zstd and
+  brotli are used only if the `zstandard` / `brotli` packages are
+  installed.
+- picks the level per media type (JSON and text compress well at
+  moderate levels; higher levels cost CPU for little gain).
+- leaves alone bodies that are small, already encoded, of compressed
+  media types (images, archives...) or streamed in several chunks.
+- compresses bodies above `COMPRESSION_THREAD_MIN_SIZE` in a worker
+  thread so large exports do not stall the event loop.
+"""
+
+import gzip
+from typing import Callable, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+Encoder = Callable[[bytes, int], bytes]
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    """Compress with gzip (mtime fixed so output is deterministic)."""
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _brotli(body: bytes, level: int) -> bytes:
+    """Compress with brotli."""
+    return brotli.compress(body, quality=level)
+
+
+def _zstd(body: bytes, level: int) -> bytes:
+    """Compress with zstd."""
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+def available_encoders() -> dict[str, Encoder]:
+    """Encoders usable in this process, in server preference order."""
+    encoders: dict[str, Encoder] = {}
+    if zstandard is not None:
+        encoders["zstd"] = _zstd
+    if brotli is not None:
+        encoders["br"] = _brotli
+    encoders["gzip"] = _gzip
+    return encoders
+
+
+# Levels by media type; anything else compressible uses DEFAULT_LEVELS
+LEVELS: dict[str, dict[str, int]] = {
+    "application/json": {"zstd": 6, "br": 5, "gzip": 6},
+    "text/html": {"zstd": 6, "br": 6, "gzip": 6},
+    "text/csv": {"zstd": 9, "br": 7, "gzip": 7},
+}
+DEFAULT_LEVELS: dict[str, int] = {"zstd": 3, "br": 4, "gzip": 5}
+
+# Media types that are already compressed
+_COMPRESSED_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+_COMPRESSED_TYPES = {
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zstd",
+    "application/x-brotli",
+    "application/pdf",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a media type is worth compressing."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type:
+        return False
+    if media_type in _COMPRESSED_TYPES or media_type.startswith(_COMPRESSED_PREFIXES):
+        return media_type == "image/svg+xml"
+    return True
+
+
+def negotiate(accept_encoding: str, encoders: dict[str, Encoder]) -> Optional[str]:
+    """Choose a content coding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, br;q=0.9, zstd".
+        encoders: Supported encodings in server preference order.
+
+    Returns:
+        Chosen encoding, or None to send the body unencoded.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best: Optional[str] = None
+    best_q = 0.0
+    for encoding in encoders:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing single-chunk responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        thread_min_size: int = 256 * 1024,
+        encoders: Optional[dict[str, Encoder]] = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            minimum_size: Bodies smaller than this are sent as-is.
+            thread_min_size: Bodies at least this large are compressed in a
+                worker thread.
+            encoders: Supported encodings in preference order; defaults to
+                the installed ones.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_min_size = thread_min_size
+        self.encoders = encoders if encoders is not None else available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encoders)
+        responder = _Responder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _Responder:
+    """Per-response state: holds the start message until the body is known."""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        send: Send,
+        encoding: Optional[str],
+    ) -> None:
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.decided = False
+
+    async def send(self, message: Message) -> None:
+        """Intercept response messages."""
+        if self.decided:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.start is None:
+            await self._flush(message)
+            return
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        body: bytes = message.get("body", b"")
+        if (
+            message.get("more_body", False)
+            or "content-encoding" in headers
+            or not is_compressible(headers.get("content-type", ""))
+            or len(body) < self.middleware.minimum_size
+        ):
+            await self._flush(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            await self._flush(message)
+            return
+
+        compressed = await self._compress(body, headers.get("content-type", ""))
+        if len(compressed) >= len(body):
+            await self._flush(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded bytes differ, so a strong validator no longer holds
+            headers["ETag"] = f"W/{etag}"
+        await self._flush({**message, "body": compressed})
+
+    async def _compress(self, body: bytes, content_type: str) -> bytes:
+        """Compress a body, off the event loop if it is large."""
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        level = LEVELS.get(media_type, DEFAULT_LEVELS)[self.encoding]
+        encoder = self.middleware.encoders[self.encoding]
+        if len(body) >= self.middleware.thread_min_size:
+            return await anyio.to_thread.run_sync(encoder, body, level)
+        return encoder(body, level)
+
+    async def _flush(self, message: Message) -> None:
+        """Send the held start message, then pass everything through."""
+        self.decided = True
+        if self.start is not None:
+            await self._send(self.start)
+        await self._send(message)
@@ -75,6 +75,105 @@ class Settings(BaseSettings):
         default=True,
         description="Test connections before using",
     )
+    DATABASE_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        ge=0,
+        description="Compiled SQL cache entries per engine (0 disables the cache)",
+    )
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        ge=0,
+        description=(
+            "Prepared statements cached per asyncpg connection "
+            "(0 for PgBouncer in transaction pooling mode)"
+        ),
+    )
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for a pool connection before answering 503",
+    )
+    DATABASE_POOL_WARMUP: bool = Field(
+        default=True,
+        description="Open DATABASE_POOL_SIZE connections at startup",
+    )
+    DATABASE_POOL_ADAPTIVE: bool = Field(
+        default=False,
+        description="Resize the pool from checkout wait times",
+    )
+    DATABASE_POOL_MIN_SIZE: int = Field(
+        default=2,
+        ge=1,
+        description="Smallest pool size in adaptive mode",
+    )
+    DATABASE_POOL_MAX_SIZE: int = Field(
+        default=20,
+        ge=1,
+        description="Largest pool size in adaptive mode",
+    )
+    DATABASE_POOL_ADAPT_INTERVAL: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between adaptive pool sizing decisions",
+    )
+    DATABASE_POOL_TARGET_WAIT_MS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Average checkout wait above which the adaptive pool grows",
+    )
+    DATABASE_SQLITE_PROFILE: Literal["basic", "tuned"] = Field(
+        default="tuned",
+        description="SQLite profile: tuned = pooled connections, WAL and pragmas; basic = defaults",
+    )
+    DATABASE_SQLITE_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        description="Pooled connections of a SQLite file database (tuned profile)",
+    )
+    DATABASE_SQLITE_MMAP_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the SQLite database file memory-mapped per connection",
+    )
+    DATABASE_SQLITE_CACHE_SIZE_KB: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="SQLite page cache per connection in KiB",
+    )
+    DATABASE_SQLITE_BUSY_TIMEOUT: int = Field(
+        default=5000,
+        ge=0,
+        description="Milliseconds to wait for a SQLite lock (and the writer lock)",
+    )
+    DATABASE_STATEMENT_TIMEOUT: float = Field(
+        default=15.0,
+        ge=0,
+        description="Default statement timeout in seconds (0 disables)",
+    )
+    DATABASE_ROUTE_STATEMENT_TIMEOUTS: dict[str, float] = Field(
+        default={"/api/v1/analytics": 60.0},
+        description="Statement timeouts of routes by path prefix (longest prefix wins)",
+    )
+    DATABASE_CANCEL_ON_DISCONNECT: bool = Field(
+        default=True,
+        description="Cancel a request's queries when the client disconnects",
+    )
+    DATABASE_RELEASE_EARLY: bool = Field(
+        default=True,
+        description="Finish request sessions when the endpoint returns, before sending the response",
+    )
+    DATABASE_READ_REPLICA_URLS: list[str] = Field(
+        default=[],
+        description="Read replica URLs used by GET endpoints and reports (empty: use the primary)",
+    )
+    DATABASE_READ_STICKY_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "Seconds a principal's reads stay on the primary after it writes "
+            "(shared between workers through REDIS_URL)"
+        ),
+    )
     
     # CORS
     CORS_ORIGINS: list[str] = Field(
@@ -100,6 +199,36 @@ class Settings(BaseSettings):
         description="Redis connection URL",
     )
     REDIS_CACHE_TTL: int = Field(default=3600, description="Redis cache TTL")
+    CACHE_ENABLED: bool = Field(default=True, description="Enable service result cache")
+    CACHE_LOCAL_MAX_ENTRIES: int = Field(
+        default=10_000,
+        description="Max entries of the in-process cache tier",
+    )
+    SNAPSHOT_CHECK_SECONDS: float = Field(
+        default=5.0,
+        description="How often in-memory catalog and price snapshots check the database "
+        "for writes made by other workers",
+    )
+    SNAPSHOT_MAX_AGE_SECONDS: float = Field(
+        default=300.0,
+        description="In-memory catalog and price snapshots are rebuilt at least this often",
+    )
+    
+    # Compression
+    COMPRESSION_MINIMUM_SIZE: int = Field(
+        default=1000,
+        description="Responses smaller than this (bytes) are not compressed",
+    )
+    COMPRESSION_THREAD_MIN_SIZE: int = Field(
+        default=256 * 1024,
+        description="Responses at least this large (bytes) are compressed in a worker thread",
+    )
+    
+    # Serialization
+    FAST_SERIALIZATION_VERIFY: bool = Field(
+        default=False,
+        description="Check fast row rendering against Pydantic output (tests only)",
+    )
     
     # Email (Optional)
     SMTP_HOST: str | None = Field(default=None, description="SMTP host")
@@ -135,7 +264,69 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enable rate limiting")
     RATE_LIMIT_PER_MINUTE: int = Field(
         default=60,
-        description="Requests per minute per IP",
+        description="Requests per minute per user (or per IP when anonymous)",
+    )
+    RATE_LIMIT_EXPENSIVE_PER_MINUTE: int = Field(
+        default=10,
+        description="Requests per minute to expensive routes (search, matching, export)",
+    )
+    
+    # Health Checks
+    HEALTH_PROBE_TIMEOUT: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds a database or cache probe may take before it counts as failed",
+    )
+    HEALTH_CACHE_TTL: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds a probe result is reused before probing again",
+    )
+    HEALTH_MAX_POOL_SATURATION: float = Field(
+        default=1.0,
+        gt=0,
+        le=1.0,
+        description="Fraction of pool connections checked out at which the worker is not ready",
+    )
+    
+    # Profiling
+    PROFILING_ENABLED: bool = Field(
+        default=True,
+        description="Serve on-demand worker profiles to superusers",
+    )
+    PROFILING_MAX_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Longest on-demand profile in seconds",
+    )
+    PROFILING_INTERVAL_MS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Default sampling interval of on-demand profiles",
+    )
+    SLOW_REQUEST_CAPTURE: bool = Field(
+        default=True,
+        description="Capture a profile and SQL trace of slow requests",
+    )
+    SLOW_REQUEST_THRESHOLD_MS: float = Field(
+        default=2000.0,
+        gt=0,
+        description="Latency from which a request is captured (sampling starts then)",
+    )
+    SLOW_REQUEST_INTERVAL_MS: float = Field(
+        default=10.0,
+        gt=0,
+        description="Sampling interval of slow request profiles",
+    )
+    SLOW_REQUEST_MAX_CAPTURES: int = Field(
+        default=50,
+        ge=1,
+        description="Slow requests kept in memory per worker",
+    )
+    SLOW_REQUEST_MAX_QUERIES: int = Field(
+        default=200,
+        ge=0,
+        description="SQL statements kept per captured request",
     )
     
     # Logging
@@ -147,6 +338,24 @@ class Settings(BaseSettings):
         default="json",
         description="Log format",
     )
+    LOG_ENQUEUE: bool = Field(
+        default=True,
+        description="Write logs from a background thread instead of the event loop",
+    )
+    LOG_BATCH_SIZE: int = Field(
+        default=100,
+        ge=1,
+        description="Log lines buffered before writing to stdout",
+    )
+    LOG_FLUSH_INTERVAL: float = Field(
+        default=1.0,
+        gt=0,
+        description="Maximum seconds a buffered log line waits before being written",
+    )
+    LOG_SAMPLE_RATES: dict[str, float] = Field(
+        default={"sqlalchemy.engine": 0.1, "uvicorn.access": 0.1},
+        description="Fraction of records below WARNING kept, per stdlib logger",
+    )
     
     # Sentry (Optional)
     SENTRY_DSN: str | None = Field(default=None, description="Sentry DSN")
@@ -63,6 +63,7 @@ API_V2_PREFIX = "/api/v2"
 # Pagination
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+MAX_BATCH_IDS = 100  # ?ids= batch reads
 
 # Rate Limiting
 RATE_LIMIT_PER_MINUTE = 60
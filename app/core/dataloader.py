@@ -0,0 +1,123 @@
+"""Request-scoped batching of lookups by key.
+
+Code that resolves references one at a time (``await load(supplier_id)``
+inside a loop or from concurrent tasks) would issue one query per key. A
+`DataLoader` collects every key requested during the same event loop
+tick and resolves them with one batch call, caching results for the rest
+of the request.
+
+Example:
+    ```python
+    loader = DataLoader(load_suppliers)  # ids -> {id: supplier}
+    a, b = await asyncio.gather(loader.load(1), loader.load(2))  # one query
+    suppliers = await loader.load_many([1, 2, 3])  # only 3 is fetched
+    ```
+
+Loaders hold per-request state and must not be shared between requests
+(see `app.services.loaders.Loaders`).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[list[K]], Awaitable[dict[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """Batches and caches lookups by key."""
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFn,
+        max_batch_size: int = 500,
+        lock: Optional[asyncio.Lock] = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            batch_load: Coroutine function resolving a list of keys to a dict;
+                keys absent from the dict resolve to None.
+            max_batch_size: Keys per batch call (bounds IN list length).
+            lock: Lock serializing batch calls, e.g. shared by loaders that
+                use the same database session.
+        """
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._lock = lock or asyncio.Lock()
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        """Request one key.
+
+        Args:
+            key: Key to load.
+
+        Returns:
+            Future resolving to the value, or None if not found.
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            # Dispatch after the current tick so sibling loads join the batch
+            loop.call_soon(self._schedule)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[Optional[V]]:
+        """Request many keys (one batch call for all uncached keys).
+
+        Args:
+            keys: Keys to load.
+
+        Returns:
+            Values in key order, None where not found.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache with an already loaded value."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a cached key (e.g. after the row was updated)."""
+        self._futures.pop(key, None)
+
+    def _schedule(self) -> None:
+        """Start a dispatch task, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        """Resolve every queued key with batch calls."""
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = keys[start:start + self._max_batch_size]
+            try:
+                async with self._lock:
+                    self.batches += 1
+                    values = await self._batch_load(chunk)
+            except Exception as e:
+                for key in chunk:
+                    future = self._futures.pop(key, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+            for key in chunk:
+                future = self._futures.get(key)
+                if future is not None and not future.done():
+                    future.set_result(values.get(key))
@@ -0,0 +1,89 @@
+"""Conditional GET support (ETag / If-None-Match).
+
+ETags are derived from row versions rather than response bodies, so a
+`304 Not Modified` is answered after one cheap version query, without
+loading or serializing the resource:
+
+- single resource: `(id, updated_at)`
+- list: `(max(updated_at), count)` over the filtered query, plus the
+  page and filter parameters
+
+Bodies served from the per-worker cache are looked up with the ETag as part
+of the cache key, so a body cached before a write on another worker is
+never paired with the newer ETag.
+
+Example:
+    ```python
+    etag = await service.get_supplier_etag(supplier_id)
+    if (cached := check_etag(request, response, etag)) is not None:
+        return cached
+    return await service.get_supplier(supplier_id, version=etag)
+    ```
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response, status
+
+# Clients may store responses but must revalidate before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from version parts.
+
+    Args:
+        *parts: JSON-serializable values (datetimes allowed) identifying
+            the representation, e.g. namespace, id and updated_at.
+
+    Returns:
+        Weak ETag header value.
+    """
+    payload = orjson.dumps(parts, default=str)
+    return f'W/"{hashlib.blake2b(payload, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compare an If-None-Match header with an ETag (weak comparison).
+
+    Args:
+        if_none_match: Header value, possibly a comma-separated list or "*".
+        etag: Current ETag.
+
+    Returns:
+        True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_etag(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    """Answer 304 if the client's copy is current, else tag the response.
+
+    Args:
+        request: Incoming request.
+        response: Response the endpoint will return (headers are set on it).
+        etag: Current ETag, or None if the resource does not exist.
+
+    Returns:
+        A 304 response to return as-is, or None to continue normally.
+    """
+    if etag is None:
+        return None
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
@@ -5,9 +5,14 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
+from app.core.cache import close_cache, init_cache
 from app.core.config import settings
 from app.core.logging import get_logger, setup_logging
-from app.db.session import close_db, init_db
+from app.core.rate_limit import close_rate_limiter, init_rate_limiter
+from app.db.pool import close_pools, init_pools
+from app.db.session import close_db, get_db_context, get_engines, init_db
+from app.services.catalog_index import product_mapping_index
+from app.services.product_matching import product_match_index
 
 logger = get_logger(__name__)
 
@@ -16,7 +21,7 @@ async def on_startup() -> None:
     """Execute tasks on application startup.
     
     - Initialize logging
-    - Connect to database
+    - Connect to database and warm its pool
     - Initialize cache
     - Setup other services
     """
@@ -32,13 +37,35 @@ async def on_startup() -> None:
     await init_db()
     logger.info("Database initialized")
     
-    # Initialize cache if Redis is configured
-    if settings.REDIS_URL:
-        logger.info("Redis cache configured")
+    # Open pool connections ahead of traffic; start adaptive sizing
+    await init_pools(get_engines)
+    
+    # Warm the in-memory product catalog index
+    await load_catalog_index()
+    
+    # Initialize cache (local tier, plus Redis if configured)
+    await init_cache()
+    
+    # Initialize rate limit buckets (local, or shared through Redis)
+    await init_rate_limiter()
     
     logger.info("Application started successfully!")
 
 
+async def load_catalog_index() -> None:
+    """Load the supplier item mapping index and the fuzzy match index.
+    
+    A failure (e.g. migrations not applied yet) is logged and the indexes
+    are left unloaded; they will be loaded lazily on first use.
+    """
+    try:
+        async with await get_db_context() as session:
+            await product_mapping_index.load(session)
+            await product_match_index.load(session)
+    except Exception as e:
+        logger.warning(f"Product catalog indexes not loaded at startup: {e}")
+
+
 async def on_shutdown() -> None:
     """Execute tasks on application shutdown.
     
@@ -49,9 +76,14 @@ async def on_shutdown() -> None:
     logger.info("Shutting down application...")
     
     # Close database
+    await close_pools()
     await close_db()
     logger.info("Database connections closed")
     
+    # Close cache
+    await close_cache()
+    await close_rate_limiter()
+    
     logger.info("Application shutdown complete")
 
 
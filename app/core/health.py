@@ -0,0 +1,164 @@
+"""Dependency probes behind the readiness endpoint.
+
+`HealthMonitor.check()` probes the database (``SELECT 1`` through the
+pool) and the shared cache tier, each bounded by `HEALTH_PROBE_TIMEOUT`,
+and reads the pool and statement cache usage of this worker. The report
+is reused for `HEALTH_CACHE_TTL` seconds and concurrent polls share one
+probe, so load balancer polling adds at most one query per worker every
+few seconds.
+
+A worker is ready when the database answers in time and its pool is below
+`HEALTH_MAX_POOL_SATURATION`; an exhausted pool makes the probe wait for a
+connection and time out, which is the signal to stop routing traffic to
+it. The cache is reported but never fails readiness, since reads fall
+back to the local tier and the database.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.singleflight import SingleFlight
+from app.db.pool import AdaptiveQueuePool
+from app.db.session import get_engine
+from app.db.statements import statement_cache_stats
+from app.schemas.common import DependencyStatus, PoolStatus, ReadinessCheck
+
+logger = get_logger(__name__)
+
+
+async def probe(check: Callable[[], Awaitable[None]], timeout: float) -> DependencyStatus:
+    """Run one probe with a timeout.
+
+    Args:
+        check: Coroutine function raising if the dependency is unhealthy.
+        timeout: Seconds before the probe counts as failed.
+
+    Returns:
+        Probe outcome and latency.
+    """
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(check(), timeout)
+    except TimeoutError:
+        status, detail = "timeout", f"No answer within {timeout}s"
+    except Exception as e:
+        status, detail = "error", str(e)
+    else:
+        status, detail = "ok", None
+    latency_ms = round((time.perf_counter() - started) * 1000, 2)
+    return DependencyStatus(status=status, latency_ms=latency_ms, detail=detail)
+
+
+def pool_status(engine: AsyncEngine) -> Optional[PoolStatus]:
+    """Read the usage of an engine's connection pool.
+
+    Args:
+        engine: Database engine.
+
+    Returns:
+        Pool usage, or None for engines without a bounded pool (in-memory or
+        basic-profile SQLite).
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    waits = {}
+    if isinstance(pool, AdaptiveQueuePool):
+        waits = {
+            "checkouts": pool.checkouts,
+            "avg_wait_ms": (
+                round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0
+            ),
+            "max_wait_ms": round(pool.wait_max * 1000, 3),
+            "resizes": pool.resizes,
+        }
+    return PoolStatus(
+        size=pool.size(),
+        checked_out=checked_out,
+        capacity=capacity,
+        saturation=round(checked_out / capacity, 3) if capacity else 1.0,
+        **waits,
+    )
+
+
+class HealthMonitor:
+    """Probe dependencies and cache the report for a few seconds."""
+
+    def __init__(self, engine: Optional[AsyncEngine] = None) -> None:
+        """Initialize the monitor.
+
+        Args:
+            engine: Engine to probe; defaults to the application engine.
+        """
+        self.engine = engine
+        self.probes = 0
+        self._report: Optional[ReadinessCheck] = None
+        self._expires_at = 0.0
+        self._flight = SingleFlight()
+
+    async def check(self) -> ReadinessCheck:
+        """Get the current report, probing if the cached one expired."""
+        if self._report is not None and time.monotonic() < self._expires_at:
+            return self._report
+        return await self._flight.do("health", self._probe)
+
+    def reset(self) -> None:
+        """Forget the cached report."""
+        self._report = None
+        self._expires_at = 0.0
+
+    async def _probe(self) -> ReadinessCheck:
+        """Probe every dependency and cache the report."""
+        self.probes += 1
+        timeout = settings.HEALTH_PROBE_TIMEOUT
+        try:
+            engine = self.engine or get_engine()
+        except RuntimeError as e:
+            engine = None
+            database = DependencyStatus(status="error", latency_ms=0.0, detail=str(e))
+
+        # Read the pool before the probe checks a connection out
+        pool = pool_status(engine) if engine is not None else None
+        if engine is not None:
+
+            async def select_one() -> None:
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+
+            database = await probe(select_one, timeout)
+        statement_cache = statement_cache_stats.status(engine) if engine is not None else None
+
+        backend = get_cache().backend
+        cache = await probe(backend.ping, timeout) if backend is not None else None
+
+        ready = database.status == "ok" and (
+            pool is None or pool.saturation < settings.HEALTH_MAX_POOL_SATURATION
+        )
+        report = ReadinessCheck(
+            status="ready" if ready else "not_ready",
+            checked_at=datetime.now(timezone.utc),
+            database=database,
+            cache=cache,
+            pool=pool,
+            statement_cache=statement_cache,
+        )
+        if not ready:
+            logger.warning(f"Readiness check failed: {report.model_dump(mode='json')}")
+
+        self._report = report
+        self._expires_at = time.monotonic() + settings.HEALTH_CACHE_TTL
+        return report
+
+
+health_monitor = HealthMonitor()
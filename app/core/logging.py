@@ -1,20 +1,88 @@
-"""Logging configuration for the application."""
+"""Logging configuration for the application.
 
+Logging is kept off the request path as much as possible:
+
+- with `LOG_ENQUEUE`, records are formatted by the caller and handed to a
+  background thread that writes them; stdout is written in batches
+  (`LOG_BATCH_SIZE` lines, at most `LOG_FLUSH_INTERVAL` seconds late,
+  errors at once) instead of one write and flush per line.
+- `LOG_FORMAT=json` writes one compact JSON object per line.
+- noisy stdlib loggers (`sqlalchemy.engine`, `uvicorn.access`) are sampled
+  with `LOG_SAMPLE_RATES` before their records reach loguru.
+- records from the standard `logging` module carry their origin, so
+  forwarding them does not walk the stack.
+"""
+
+import itertools
 import logging
 import sys
-from typing import Any
+import threading
+import traceback
+from typing import Any, Optional, TextIO
 
+import orjson
 from loguru import logger
 
 from app.core.config import settings
 
+TEXT_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+
+# Stdlib loggers forwarded to loguru
+INTERCEPTED_LOGGERS = ("uvicorn", "uvicorn.access", "fastapi", "sqlalchemy.engine")
+
+
+class LogSampler(logging.Filter):
+    """Keep a fraction of the records below WARNING of noisy stdlib loggers.
+
+    Sampling is deterministic (one record in every N) and applies to child
+    loggers too, e.g. a rate for "sqlalchemy.engine" also covers
+    "sqlalchemy.engine.Engine".
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        """Initialize the sampler.
+
+        Args:
+            rates: Fraction of records kept, by logger name (0 drops all).
+        """
+        super().__init__()
+        self._every = {name: round(1 / rate) if rate > 0 else 0 for name, rate in rates.items()}
+        self._counters = {name: itertools.count() for name in rates}
+        self._sources: dict[str, Optional[str]] = {}
+
+    def _source(self, name: str) -> Optional[str]:
+        """Sampled logger a logger name falls under, if any."""
+        try:
+            return self._sources[name]
+        except KeyError:
+            candidate = name
+            while candidate and candidate not in self._every:
+                candidate = candidate.rpartition(".")[0]
+            self._sources[name] = candidate or None
+            return self._sources[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Whether to keep a record."""
+        if record.levelno >= logging.WARNING:
+            return True
+        source = self._source(record.name)
+        if source is None:
+            return True
+        every = self._every[source]
+        return every > 0 and next(self._counters[source]) % every == 0
+
 
 class InterceptHandler(logging.Handler):
     """Intercept standard logging messages and redirect to loguru."""
-    
+
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to loguru.
-        
+
         Args:
             record: Log record to emit.
         """
@@ -23,50 +91,138 @@ class InterceptHandler(logging.Handler):
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno
-        
-        # Find caller from where the logged message originated
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-        
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level,
-            record.getMessage(),
+
+        # The origin comes from the record (see _stdlib_origin), no stack walk
+        logger.opt(exception=record.exc_info).bind(
+            _origin=(record.name, record.funcName, record.lineno),
+        ).log(level, record.getMessage())
+
+
+def _stdlib_origin(record: dict[str, Any]) -> None:
+    """Report forwarded stdlib records at their original location."""
+    origin = record["extra"].pop("_origin", None)
+    if origin is not None:
+        record["name"], record["function"], record["line"] = origin
+
+
+def _json_format(record: dict[str, Any]) -> str:
+    """Render a record as one JSON line."""
+    extra = record["extra"]
+    payload: dict[str, Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": extra.get("logger", record["name"]),
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    context = {key: value for key, value in extra.items() if key not in ("logger", "json")}
+    if context:
+        payload["extra"] = context
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    extra["json"] = orjson.dumps(payload, default=str).decode()
+    return "{extra[json]}\n"
+
+
+class BatchedStream:
+    """Stream sink writing log lines in batches.
+
+    loguru flushes a stream after every message if it has a `flush`
+    method; this wrapper has none and instead writes pending lines
+    together once `batch_size` are buffered, every `flush_interval`
+    seconds, and immediately for ERROR and above.
+    """
+
+    def __init__(self, stream: TextIO, batch_size: int = 100, flush_interval: float = 1.0) -> None:
+        """Wrap a stream and start the periodic flusher thread.
+
+        Args:
+            stream: Underlying stream (e.g. sys.stdout).
+            batch_size: Lines buffered before writing.
+            flush_interval: Seconds between periodic writes.
+        """
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lines: list[str] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="log-flusher",
+            daemon=True,
         )
+        self._flusher.start()
+
+    def write(self, message: str) -> None:
+        """Buffer one formatted line (called by loguru)."""
+        record = getattr(message, "record", None)
+        urgent = record is not None and record["level"].no >= logging.ERROR
+        with self._lock:
+            self._lines.append(message)
+            if urgent or len(self._lines) >= self.batch_size:
+                self._write_pending()
+
+    def stop(self) -> None:
+        """Write pending lines and stop the flusher (called when the sink is removed)."""
+        self._stopped.set()
+        with self._lock:
+            try:
+                self._write_pending()
+            except (OSError, ValueError):  # stream already closed at interpreter exit
+                self._lines.clear()
+
+    def _write_pending(self) -> None:
+        """Write buffered lines; the caller holds the lock."""
+        if self._lines:
+            self.stream.write("".join(self._lines))
+            self._lines.clear()
+            self.stream.flush()
+
+    def _flush_periodically(self) -> None:
+        """Write buffered lines every flush_interval until stopped."""
+        while not self._stopped.wait(self.flush_interval):
+            with self._lock:
+                try:
+                    self._write_pending()
+                except (OSError, ValueError):  # stream already closed at interpreter exit
+                    return
 
 
 def setup_logging() -> None:
     """Configure application logging with loguru.
-    
+
     This function:
     - Removes default loguru handlers
     - Configures format based on settings (JSON or text)
     - Sets log level from settings
-    - Intercepts standard logging to redirect to loguru
+    - Enqueues and batches sinks when LOG_ENQUEUE is set
+    - Intercepts standard logging to redirect to loguru, with sampling
     """
-    # Remove default handler
+    # Remove default handler (stops and flushes previous sinks)
     logger.remove()
-    
-    # Configure format based on settings
-    # Use simple text format for now to avoid JSON serialization issues
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>"
-    )
-    
+    logger.configure(patcher=_stdlib_origin)
+
+    log_format = _json_format if settings.LOG_FORMAT == "json" else TEXT_FORMAT
+    # Variable values in tracebacks are costly to render and may leak data
+    diagnose = settings.DEBUG
+
+    stdout: Any = sys.stdout
+    if settings.LOG_ENQUEUE:
+        stdout = BatchedStream(sys.stdout, settings.LOG_BATCH_SIZE, settings.LOG_FLUSH_INTERVAL)
+
     # Add handler with configured format
     logger.add(
-        sys.stdout,
+        stdout,
         format=log_format,
         level=settings.LOG_LEVEL,
-        colorize=True,
+        colorize=settings.LOG_FORMAT == "text",
         backtrace=True,
-        diagnose=True,
+        diagnose=diagnose,
+        enqueue=settings.LOG_ENQUEUE,
     )
-    
+
     # Add file handler in production
     if settings.is_production:
         logger.add(
@@ -77,25 +233,34 @@ def setup_logging() -> None:
             format=log_format,
             level=settings.LOG_LEVEL,
             backtrace=True,
-            diagnose=True,
+            diagnose=diagnose,
+            enqueue=settings.LOG_ENQUEUE,
         )
-    
-    # Intercept standard logging
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
-    
+
+    # Intercept standard logging, sampling noisy sources first
+    sampler = LogSampler(settings.LOG_SAMPLE_RATES)
+
+    def intercept() -> InterceptHandler:
+        handler = InterceptHandler()
+        handler.addFilter(sampler)
+        return handler
+
+    logging.basicConfig(handlers=[intercept()], level=0, force=True)
+
     # Set levels for specific loggers
-    logging.getLogger("uvicorn").handlers = [InterceptHandler()]
-    logging.getLogger("uvicorn.access").handlers = [InterceptHandler()]
-    logging.getLogger("fastapi").handlers = [InterceptHandler()]
-    logging.getLogger("sqlalchemy.engine").handlers = [InterceptHandler()]
+    # (not propagated, so root does not handle their records a second time)
+    for name in INTERCEPTED_LOGGERS:
+        stdlib_logger = logging.getLogger(name)
+        stdlib_logger.handlers = [intercept()]
+        stdlib_logger.propagate = False
 
 
 def get_logger(name: str) -> Any:
     """Get a logger instance.
-    
+
     Args:
         name: Logger name (usually __name__).
-        
+
     Returns:
         Logger instance.
     """
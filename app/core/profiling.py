@@ -0,0 +1,471 @@
+"""Sampling profiler and slow-request capture.
+
+Profiles use speedscope's sampled format, so they open directly in
+https://www.speedscope.app.
+
+- `profile_worker()` samples this worker's event loop thread from a
+  background thread (``sys._current_frames()``) for a few seconds. It sees
+  every request and any CPU-bound work blocking the loop. Superusers get
+  it from ``GET /api/v1/admin/profile``.
+- `SlowRequestMiddleware` times every request and traces its SQL
+  (statement text and duration, never parameters). Once a request has run
+  for `SLOW_REQUEST_THRESHOLD_MS`, a sampler thread starts profiling it:
+  while the request's code runs on the loop, the loop thread's stack is
+  recorded; while it waits (database, network), the await chain of its
+  tasks is recorded with a final ``[await]`` frame. The last
+  `SLOW_REQUEST_MAX_CAPTURES` slow requests are kept in memory and listed
+  at ``GET /api/v1/admin/slow-requests``.
+
+A request that stays under the threshold costs one timer and the list of
+its statements; no thread is started for it.
+"""
+
+import asyncio
+import functools
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# (function name, file, first line)
+Frame = tuple[str, str, int]
+
+# Leaf frame of samples taken while a request was waiting
+AWAIT_FRAME: Frame = ("[await]", "", 0)
+
+# Connection info key holding the start time of the running statement
+QUERY_STARTED = "trace_query_started"
+
+# Longest statement text kept in a SQL trace
+MAX_STATEMENT_LENGTH = 2000
+
+# Requests never captured (the profiler endpoint is slow by design)
+EXEMPT_PATHS = re.compile(r"^/api/v1/admin/profile$")
+
+
+class ProfilerBusy(Exception):
+    """A profile of this worker is already being taken."""
+
+
+def _frame(frame: FrameType) -> Frame:
+    """Identify the function a frame runs."""
+    code = frame.f_code
+    return code.co_qualname, code.co_filename, code.co_firstlineno
+
+
+def thread_stack(frame: Optional[FrameType]) -> list[Frame]:
+    """Stack of a thread from its current frame, outermost first."""
+    stack = []
+    while frame is not None:
+        stack.append(_frame(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def await_chain(task: asyncio.Task) -> list[Frame]:
+    """Coroutines a suspended task is awaiting through, outermost first."""
+    stack = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            break
+        stack.append(_frame(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return stack
+
+
+class SampledProfile:
+    """Stack samples, exported in speedscope's sampled format."""
+
+    def __init__(self, name: str) -> None:
+        """Create an empty profile.
+
+        Args:
+            name: Profile name shown by speedscope.
+        """
+        self.name = name
+        self.frames: dict[Frame, int] = {}
+        self.samples: list[list[int]] = []
+        self.weights: list[float] = []
+
+    def add(self, stack: list[Frame], weight_ms: float) -> None:
+        """Record one sample.
+
+        Args:
+            stack: Frames, outermost first.
+            weight_ms: Time the sample stands for.
+        """
+        self.samples.append([self.frames.setdefault(frame, len(self.frames)) for frame in stack])
+        self.weights.append(round(weight_ms, 3))
+
+    def speedscope(self) -> dict[str, Any]:
+        """Export the profile as a speedscope file."""
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": self.name,
+            "exporter": settings.APP_NAME,
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line}
+                    for name, file, line in self.frames
+                ],
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(self.weights), 3),
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+class Sampler:
+    """Background thread adding a stack to a profile every interval."""
+
+    def __init__(
+        self,
+        profile: SampledProfile,
+        take: Callable[[], Optional[list[Frame]]],
+        interval: float,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            profile: Profile receiving the samples.
+            take: Function returning the stack to record (None to skip).
+            interval: Seconds between samples.
+        """
+        self.profile = profile
+        self.take = take
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; the profile is complete when this returns."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Sample until stopped; each sample weighs the time since the previous."""
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            try:
+                stack = self.take()
+            except Exception:
+                # Frames change under the sampler; skip this sample
+                stack = None
+            if stack:
+                self.profile.add(stack, (now - last) * 1000)
+            last = now
+
+
+_profile_lock = threading.Lock()
+
+
+async def profile_worker(seconds: float, interval: float) -> dict[str, Any]:
+    """Sample the event loop thread of this worker.
+
+    Args:
+        seconds: Sampling duration.
+        interval: Seconds between samples.
+
+    Returns:
+        dict: speedscope profile.
+
+    Raises:
+        ProfilerBusy: If another profile of this worker is running.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile of this worker is already running")
+    try:
+        loop_thread = threading.get_ident()
+        profile = SampledProfile(f"Worker {os.getpid()}, {seconds:g}s")
+        sampler = Sampler(
+            profile,
+            lambda: thread_stack(sys._current_frames().get(loop_thread)),
+            interval,
+        )
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        return profile.speedscope()
+    finally:
+        _profile_lock.release()
+
+
+@dataclass
+class RequestTrace:
+    """Tasks and SQL statements of one request.
+
+    Attributes:
+        tasks: The request's task, then tasks it started (see `trace_task`).
+        queries: Statements with their duration, in execution order.
+        dropped_queries: Statements beyond `SLOW_REQUEST_MAX_QUERIES`.
+    """
+
+    tasks: list[asyncio.Task]
+    queries: list[dict[str, Any]] = field(default_factory=list)
+    dropped_queries: int = 0
+
+    def add_query(self, statement: str, duration_ms: float, error: Optional[str] = None) -> None:
+        """Record one statement."""
+        if len(self.queries) >= settings.SLOW_REQUEST_MAX_QUERIES:
+            self.dropped_queries += 1
+            return
+        query: dict[str, Any] = {
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "duration_ms": round(duration_ms, 3),
+        }
+        if error is not None:
+            query["error"] = error
+        self.queries.append(query)
+
+    def stack(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread: int,
+    ) -> Optional[list[Frame]]:
+        """Current stack of the request, from the sampler thread."""
+        if asyncio.current_task(loop) in self.tasks:
+            return thread_stack(sys._current_frames().get(loop_thread))
+        stack = []
+        for task in self.tasks:
+            if not task.done():
+                stack.extend(await_chain(task))
+        return stack + [AWAIT_FRAME] if stack else None
+
+
+_request_trace: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def trace_task(task: asyncio.Future) -> None:
+    """Include a task started for the current request in its profile.
+
+    Args:
+        task: Task running part of the request (e.g. its endpoint).
+    """
+    trace = _request_trace.get()
+    if trace is not None and isinstance(task, asyncio.Task):
+        trace.tasks.append(task)
+
+
+def trace_queries(engine: AsyncEngine) -> None:
+    """Record the statements of traced requests.
+
+    Args:
+        engine: Engine to instrument.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_query(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Note when a traced statement starts."""
+        if _request_trace.get() is not None:
+            conn.info[QUERY_STARTED] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def end_query(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Record a traced statement."""
+        started = conn.info.pop(QUERY_STARTED, None)
+        trace = _request_trace.get()
+        if trace is not None and started is not None:
+            trace.add_query(statement, (time.perf_counter() - started) * 1000)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def failed_query(context: ExceptionContext) -> None:
+        """Record a traced statement that failed (e.g. timed out)."""
+        conn = context.connection
+        started = conn.info.pop(QUERY_STARTED, None) if conn is not None else None
+        trace = _request_trace.get()
+        if trace is not None and started is not None and context.statement:
+            trace.add_query(
+                context.statement,
+                (time.perf_counter() - started) * 1000,
+                error=type(context.original_exception).__name__,
+            )
+
+
+@dataclass
+class SlowRequest:
+    """A captured slow request.
+
+    Attributes:
+        id: Capture ID (per worker).
+        method: HTTP method.
+        path: Request path.
+        status_code: Response status (None if no response was started).
+        duration_ms: Time to handle the request.
+        started_at: When the request arrived.
+        queries: SQL statements with their duration.
+        dropped_queries: Statements not kept.
+        profile: speedscope profile from the threshold on.
+    """
+
+    id: int
+    method: str
+    path: str
+    status_code: Optional[int]
+    duration_ms: float
+    started_at: datetime
+    queries: list[dict[str, Any]]
+    dropped_queries: int
+    profile: dict[str, Any]
+
+    @property
+    def query_count(self) -> int:
+        """Statements the request ran."""
+        return len(self.queries) + self.dropped_queries
+
+    @property
+    def query_ms(self) -> float:
+        """Time spent in the kept statements."""
+        return round(sum(q["duration_ms"] for q in self.queries), 3)
+
+
+class SlowRequestLog:
+    """The most recent slow requests of this worker."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty log.
+
+        Args:
+            max_entries: Captures kept; the oldest are dropped first.
+        """
+        self._entries: deque[SlowRequest] = deque(maxlen=max_entries)
+        self._ids = itertools.count(1)
+
+    def add(self, **fields: Any) -> SlowRequest:
+        """Store a capture (fields of `SlowRequest` except the ID)."""
+        capture = SlowRequest(id=next(self._ids), **fields)
+        self._entries.append(capture)
+        return capture
+
+    def list(self) -> list[SlowRequest]:
+        """Captures, newest first."""
+        return list(reversed(self._entries))
+
+    def get(self, capture_id: int) -> Optional[SlowRequest]:
+        """Get a capture by ID."""
+        return next((c for c in self._entries if c.id == capture_id), None)
+
+    def clear(self) -> None:
+        """Drop every capture."""
+        self._entries.clear()
+
+
+slow_requests = SlowRequestLog(settings.SLOW_REQUEST_MAX_CAPTURES)
+
+
+class SlowRequestMiddleware:
+    """Capture a profile and the SQL trace of requests over the latency threshold."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one request, capturing it if it is slow."""
+        if (
+            scope["type"] != "http"
+            or not settings.SLOW_REQUEST_CAPTURE
+            or EXEMPT_PATHS.match(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        trace = RequestTrace(tasks=[task] if task is not None else [])
+        threshold = settings.SLOW_REQUEST_THRESHOLD_MS / 1000
+        profile = SampledProfile(f"{scope['method']} {scope['path']}")
+        sampler = Sampler(
+            profile,
+            functools.partial(trace.stack, loop, threading.get_ident()),
+            settings.SLOW_REQUEST_INTERVAL_MS / 1000,
+        )
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        token = _request_trace.set(trace)
+        timer = loop.call_later(threshold, sampler.start)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            timer.cancel()
+            _request_trace.reset(token)
+            sampler.stop()
+            if duration >= threshold:
+                capture = slow_requests.add(
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    duration_ms=round(duration * 1000, 3),
+                    started_at=started_at,
+                    queries=trace.queries,
+                    dropped_queries=trace.dropped_queries,
+                    profile=profile.speedscope(),
+                )
+                logger.warning(
+                    f"Slow request {scope['method']} {scope['path']}: "
+                    f"{duration * 1000:.0f} ms, {len(trace.queries)} queries "
+                    f"(capture {capture.id})"
+                )
@@ -0,0 +1,331 @@
+"""Token-bucket rate limiting.
+
+Every request takes one token from each of the buckets of its identity:
+
+- the authenticated principal (``user:<id>`` from the bearer token), or
+  the client IP for anonymous requests;
+- a per-minute bucket (`RATE_LIMIT_PER_MINUTE`, bursts up to that size)
+  and a per-hour bucket (`RATE_LIMIT_PER_HOUR`);
+- expensive routes (search, fuzzy matching, exports) also draw from a
+  separate, smaller bucket (`RATE_LIMIT_EXPENSIVE_PER_MINUTE`), so heavy
+  calls cannot use up the whole allowance of cheap ones.
+
+Tokens are taken from all buckets or from none: a request rejected by
+one bucket does not drain the others.
+
+Buckets live in process memory (per worker). When `REDIS_URL` is set
+they are shared through Redis with an atomic Lua script; Redis errors
+fall back to the local buckets, so a Redis outage never blocks traffic.
+
+Responses carry `RateLimit-Limit`, `RateLimit-Remaining` and
+`RateLimit-Reset`; rejected requests get `429` with `Retry-After`.
+"""
+
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Protocol, Sequence
+
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.constants import RATE_LIMIT_PER_HOUR
+from app.core.logging import get_logger
+from app.core.security import request_principal
+
+logger = get_logger(__name__)
+
+# Paths never limited (probes, docs)
+EXEMPT_PATHS = re.compile(r"^/(api/v1/health(/.*)?|docs|redoc|openapi\.json)?$")
+
+# Routes that get an extra, smaller bucket
+EXPENSIVE_PATHS = re.compile(r"/(search|export)(/|$)|/mappings/(match|resolve)$")
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """Bucket definition.
+
+    Attributes:
+        name: Bucket name, part of the key.
+        capacity: Maximum tokens (burst size).
+        period: Seconds to refill from empty to full.
+    """
+
+    name: str
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.period
+
+
+@dataclass(frozen=True)
+class Decision:
+    """Outcome of a request for one bucket.
+
+    Attributes:
+        allowed: Whether the bucket had a token; the request is allowed
+            (and the tokens taken) only if every bucket had one.
+        limit: Bucket capacity.
+        remaining: Whole tokens left.
+        reset: Seconds until the bucket is full again.
+        retry_after: Seconds until a token is available (0 if allowed).
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int
+    retry_after: int
+
+
+def _decide(bucket: Bucket, tokens: float, allowed: bool) -> Decision:
+    """Build a decision from the tokens left after taking (or not)."""
+    missing = 0.0 if allowed else 1.0 - tokens
+    return Decision(
+        allowed=allowed,
+        limit=bucket.capacity,
+        remaining=max(int(tokens), 0),
+        reset=math.ceil((bucket.capacity - tokens) / bucket.rate),
+        retry_after=math.ceil(missing / bucket.rate),
+    )
+
+
+class RateLimitBackend(Protocol):
+    """Storage of bucket states."""
+
+    async def take(self, identity: str, buckets: Sequence[Bucket]) -> list[Decision]:
+        """Take one token from every bucket if all of them have one."""
+
+
+class LocalRateLimitBackend:
+    """In-process buckets (per worker), least recently used evicted first."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        """Initialize with no buckets.
+
+        Args:
+            max_keys: Bucket states kept; evicted buckets start full again.
+        """
+        self.max_keys = max_keys
+        self._states: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, identity: str, buckets: Sequence[Bucket]) -> list[Decision]:
+        """Take one token from every bucket if all of them have one."""
+        now = time.monotonic()
+        keys = [f"{identity}:{bucket.name}" for bucket in buckets]
+        levels = []
+        for key, bucket in zip(keys, buckets, strict=True):
+            tokens, updated_at = self._states.pop(key, (float(bucket.capacity), now))
+            levels.append(min(float(bucket.capacity), tokens + (now - updated_at) * bucket.rate))
+        available = [tokens >= 1.0 for tokens in levels]
+        if all(available):
+            levels = [tokens - 1.0 for tokens in levels]
+        for key, tokens in zip(keys, levels, strict=True):
+            self._states[key] = (tokens, now)
+        while len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
+        return [
+            _decide(bucket, tokens, ok)
+            for bucket, tokens, ok in zip(buckets, levels, available, strict=True)
+        ]
+
+
+# KEYS bucket keys; ARGV now, then capacity and rate of each bucket.
+# Returns {available, tokens} of each bucket, flattened.
+_TAKE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local levels = {}
+local granted = true
+for i, key in ipairs(KEYS) do
+  local capacity = tonumber(ARGV[2 * i])
+  local rate = tonumber(ARGV[2 * i + 1])
+  local state = redis.call('HMGET', key, 'tokens', 'ts')
+  local tokens = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  levels[i] = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+  if levels[i] < 1 then
+    granted = false
+  end
+end
+local result = {}
+for i, key in ipairs(KEYS) do
+  local capacity = tonumber(ARGV[2 * i])
+  local rate = tonumber(ARGV[2 * i + 1])
+  local tokens = levels[i]
+  local available = 0
+  if tokens >= 1 then
+    available = 1
+  end
+  if granted then
+    tokens = tokens - 1
+  end
+  redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+  redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+  table.insert(result, available)
+  table.insert(result, tostring(tokens))
+end
+return result
+"""
+
+
+class RedisRateLimitBackend:
+    """Buckets shared by all workers through Redis."""
+
+    def __init__(self, url: str, fallback: Optional[LocalRateLimitBackend] = None) -> None:
+        """Create a client; connections are opened lazily.
+
+        Args:
+            url: Redis connection URL.
+            fallback: Local buckets used while Redis is unreachable.
+        """
+        from redis import asyncio as redis
+
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(_TAKE_SCRIPT)
+        self._fallback = fallback or LocalRateLimitBackend()
+
+    async def take(self, identity: str, buckets: Sequence[Bucket]) -> list[Decision]:
+        """Take one token from every bucket if all of them have one.
+
+        All buckets are checked and updated by one script call, so the
+        decision is atomic across workers.
+        """
+        args: list[float] = [time.time()]
+        for bucket in buckets:
+            args.extend((bucket.capacity, bucket.rate))
+        try:
+            result = await self._script(
+                keys=[f"ratelimit:{identity}:{bucket.name}" for bucket in buckets],
+                args=args,
+            )
+        except Exception as e:
+            logger.warning(f"Rate limit backend failed, using local buckets: {e}")
+            return await self._fallback.take(identity, buckets)
+        return [
+            _decide(bucket, float(tokens), bool(available))
+            for bucket, available, tokens in zip(
+                buckets, result[::2], result[1::2], strict=True
+            )
+        ]
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+
+_backend: RateLimitBackend = LocalRateLimitBackend()
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Get the process-wide bucket backend."""
+    return _backend
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Replace the process-wide bucket backend (startup, tests)."""
+    global _backend
+    _backend = backend
+
+
+async def init_rate_limiter() -> None:
+    """Configure the bucket backend from settings."""
+    if settings.REDIS_URL:
+        try:
+            set_rate_limit_backend(RedisRateLimitBackend(settings.REDIS_URL))
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+
+
+async def close_rate_limiter() -> None:
+    """Close the bucket backend."""
+    if isinstance(_backend, RedisRateLimitBackend):
+        await _backend.close()
+
+
+def buckets_for(path: str) -> list[Bucket]:
+    """Buckets a request to a path draws from."""
+    buckets = [
+        Bucket("minute", settings.RATE_LIMIT_PER_MINUTE, 60),
+        Bucket("hour", RATE_LIMIT_PER_HOUR, 3600),
+    ]
+    if EXPENSIVE_PATHS.search(path):
+        buckets.append(Bucket("expensive", settings.RATE_LIMIT_EXPENSIVE_PER_MINUTE, 60))
+    return buckets
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing the token buckets."""
+
+    def __init__(self, app: ASGIApp, backend: Optional[RateLimitBackend] = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            backend: Bucket backend; defaults to the process-wide one.
+        """
+        self.app = app
+        self.backend = backend
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope.get("method") == "OPTIONS"
+            or EXEMPT_PATHS.match(path)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        backend = self.backend or get_rate_limit_backend()
+        identity = request_principal(Headers(scope=scope), scope.get("client"))
+        decisions = await backend.take(identity, buckets_for(path))
+        denied = [d for d in decisions if not d.allowed]
+        # Report the bucket closest to running out (or the one that did)
+        shown = max(denied, key=lambda d: d.retry_after) if denied else min(
+            decisions, key=lambda d: d.remaining / d.limit
+        )
+        rate_headers = {
+            "RateLimit-Limit": str(shown.limit),
+            "RateLimit-Remaining": str(shown.remaining),
+            "RateLimit-Reset": str(shown.reset),
+        }
+
+        if denied:
+            logger.warning(f"Rate limit exceeded for {identity} on {path}")
+            body = orjson.dumps({
+                "success": False,
+                "error": "RateLimitExceeded",
+                "message": "Too many requests",
+                "detail": f"Rate limit exceeded, retry in {shown.retry_after}s",
+            })
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(shown.retry_after).encode()),
+                    *((k.lower().encode(), v.encode()) for k, v in rate_headers.items()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,72 @@
+"""Request-scoped data visibility.
+
+Supplier users may only see rows of their own supplier. The request
+principal's supplier ID is stored in a context variable when the user is
+authenticated, and `BaseRepository` adds `supplier_id = :scope` to every
+query on models that carry a supplier column. Aladdin users run unscoped.
+
+Example:
+    ```python
+    with supplier_scope(3):
+        suppliers, total = await SupplierRepository(db).get_multi()
+
+    with unscoped():
+        await product_mapping_index.load(db)  # process-wide data
+    ```
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from app.models.user import UserType
+
+# Supplier ID the current request is restricted to; None means unrestricted
+_supplier_scope: ContextVar[Optional[int]] = ContextVar("supplier_scope", default=None)
+
+# Supplier users without a supplier must not see any supplier rows
+NO_SUPPLIER = -1
+
+
+def get_supplier_scope() -> Optional[int]:
+    """Get the supplier ID queries are restricted to.
+
+    Returns:
+        Supplier ID, or None if queries are unrestricted.
+    """
+    return _supplier_scope.get()
+
+
+def set_supplier_scope_for_user(user: Any) -> None:
+    """Restrict the current request to the user's supplier if needed.
+
+    Args:
+        user: Authenticated user.
+    """
+    if user.user_type == UserType.SUPPLIER:
+        _supplier_scope.set(user.supplier_id if user.supplier_id is not None else NO_SUPPLIER)
+    else:
+        _supplier_scope.set(None)
+
+
+@contextmanager
+def supplier_scope(supplier_id: Optional[int]) -> Iterator[None]:
+    """Run a block restricted to one supplier (None lifts the restriction).
+
+    Args:
+        supplier_id: Supplier ID, or None for unrestricted access.
+    """
+    token = _supplier_scope.set(supplier_id)
+    try:
+        yield
+    finally:
+        _supplier_scope.reset(token)
+
+
+def unscoped() -> Any:
+    """Run a block without supplier restriction.
+
+    Use for process-wide data (in-memory indexes, caches) and integrity
+    checks that must see every row regardless of who triggered them.
+    """
+    return supplier_scope(None)
@@ -1,7 +1,8 @@
 """Security utilities for password hashing and JWT token management."""
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -11,6 +12,9 @@ from app.core.config import settings
 # Password hashing context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Audience of the tokens issued by /auth/login (FastAPI-Users JWTStrategy)
+LOGIN_TOKEN_AUDIENCE = "fastapi-users:auth"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password.
@@ -110,11 +114,13 @@ def create_refresh_token(
     return encoded_jwt
 
 
-def decode_token(token: str) -> dict[str, Any]:
+def decode_token(token: str, audience: Optional[str] = None) -> dict[str, Any]:
     """Decode and verify a JWT token.
     
     Args:
         token: JWT token to decode.
+        audience: Audience to accept. Tokens with another audience are
+            rejected; tokens without one are accepted either way.
         
     Returns:
         dict: Decoded token payload.
@@ -127,6 +133,7 @@ def decode_token(token: str) -> dict[str, Any]:
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
+            audience=audience,
         )
         return payload
     except JWTError as e:
@@ -155,3 +162,33 @@ def verify_token_type(token: str, expected_type: str) -> dict[str, Any]:
         )
     
     return payload
+
+
+def request_principal(
+    headers: Mapping[str, str],
+    client: Optional[tuple[str, int]],
+) -> str:
+    """Identify who sent a request, without loading the user.
+    
+    The bearer token is verified (signature and expiry). Both login tokens
+    (audience LOGIN_TOKEN_AUDIENCE) and tokens from create_access_token are
+    accepted; an invalid or missing token counts as anonymous and the
+    client address is used.
+    
+    Args:
+        headers: Request headers (case-insensitive mapping).
+        client: (host, port) of the peer.
+        
+    Returns:
+        str: "user:<id>" or "ip:<address>".
+    """
+    authorization = headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = decode_token(token, audience=LOGIN_TOKEN_AUDIENCE).get("sub")
+        except JWTError:
+            subject = None
+        if subject is not None:
+            return f"user:{subject}"
+    return f"ip:{client[0] if client else 'unknown'}"
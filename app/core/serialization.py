@@ -0,0 +1,201 @@
+"""Fast JSON rendering of row dicts for read endpoints.
+
+The Pydantic path validates every row into a schema instance
+(`validate_assignment`, `str_strip_whitespace`, validators) and then
+serializes it again. Rows read from the database were already validated
+on write, so list endpoints can skip that work: a `ColumnPlan`
+precomputed per schema lists the columns to select and the output keys,
+and rows are rendered with orjson in one pass.
+
+Set `FAST_SERIALIZATION_VERIFY` (the test suite does) to also render
+each response through the Pydantic path and fail on any difference.
+
+Example:
+    ```python
+    plan = column_plan(SupplierList)
+    rows, total = await service.list_supplier_fields(plan.fields, skip=0, limit=50)
+    return json_response(response, render_page(plan, rows, total, 0, 50))
+    ```
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.schemas.common import BatchResponse, PaginatedResponse, sparse_model
+
+# Match Pydantic's JSON output: UTC as "Z", Decimal as string
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Precomputed rendering plan of a response schema.
+
+    Attributes:
+        schema: Schema the output must be equivalent to.
+        fields: Columns to select, in output order (column name = field name).
+        keys: Output keys (serialization aliases), parallel to `fields`.
+    """
+
+    schema: type[BaseModel]
+    fields: tuple[str, ...]
+    keys: tuple[str, ...]
+
+    @property
+    def renames(self) -> bool:
+        """Whether any output key differs from its column name."""
+        return self.keys != self.fields
+
+    def row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Shape one row dict for output."""
+        if not self.renames:
+            return row
+        return {key: row[field] for field, key in zip(self.fields, self.keys, strict=True)}
+
+
+@lru_cache(maxsize=256)
+def column_plan(
+    schema: type[BaseModel],
+    fields: Optional[tuple[str, ...]] = None,
+) -> ColumnPlan:
+    """Build (once) the rendering plan of a schema or a subset of it.
+
+    Args:
+        schema: Response schema whose fields all map to model columns.
+        fields: Subset of field names (sparse fieldsets); all if omitted.
+
+    Returns:
+        Column plan.
+
+    Raises:
+        ValueError: If the schema customizes serialization, which the fast
+            path cannot reproduce.
+    """
+    decorators = schema.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers or decorators.computed_fields:
+        raise ValueError(f"{schema.__name__} customizes serialization; use the Pydantic path")
+
+    names = tuple(schema.model_fields) if fields is None else fields
+    keys = tuple(
+        schema.model_fields[name].serialization_alias or schema.model_fields[name].alias or name
+        for name in names
+    )
+    return ColumnPlan(schema=schema, fields=names, keys=keys)
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize with the options matching Pydantic's JSON output."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+def _verify(body: bytes, reference: BaseModel) -> None:
+    """Fail if the fast output differs from the Pydantic output."""
+    expected = reference.model_dump(mode="json", by_alias=True)
+    actual = orjson.loads(body)
+    if actual != expected:
+        raise AssertionError(
+            f"Fast serialization of {type(reference).__name__} differs from Pydantic: "
+            f"{actual!r} != {expected!r}"
+        )
+
+
+def _reference_schema(plan: ColumnPlan) -> type[BaseModel]:
+    """Schema the Pydantic path would use for a plan."""
+    if plan.fields == tuple(plan.schema.model_fields):
+        return plan.schema
+    return sparse_model(plan.schema, plan.fields)
+
+
+def render_item(plan: ColumnPlan, row: dict[str, Any]) -> bytes:
+    """Render one row.
+
+    Args:
+        plan: Column plan.
+        row: Dict of column values keyed by field name.
+
+    Returns:
+        JSON bytes.
+    """
+    body = _dumps(plan.row(row))
+    if settings.FAST_SERIALIZATION_VERIFY:
+        _verify(body, _reference_schema(plan).model_validate(row))
+    return body
+
+
+def render_page(
+    plan: ColumnPlan,
+    rows: list[dict[str, Any]],
+    total: int,
+    skip: int,
+    limit: int,
+) -> bytes:
+    """Render a page shaped like `PaginatedResponse`.
+
+    Args:
+        plan: Column plan of the items.
+        rows: Dicts of column values keyed by field name.
+        total: Total number of matching rows.
+        skip: Number of rows skipped.
+        limit: Page size.
+
+    Returns:
+        JSON bytes.
+    """
+    body = _dumps({
+        "items": [plan.row(row) for row in rows],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+    })
+    if settings.FAST_SERIALIZATION_VERIFY:
+        page = PaginatedResponse[_reference_schema(plan)]
+        _verify(body, page(items=rows, total=total, skip=skip, limit=limit))
+    return body
+
+
+def render_batch(
+    plan: ColumnPlan,
+    rows: list[dict[str, Any]],
+    missing: list[int],
+) -> bytes:
+    """Render a batch read shaped like `BatchResponse`.
+
+    Args:
+        plan: Column plan of the items.
+        rows: Dicts of column values keyed by field name, in request order.
+        missing: Requested IDs that were not found.
+
+    Returns:
+        JSON bytes.
+    """
+    body = _dumps({"items": [plan.row(row) for row in rows], "missing": missing})
+    if settings.FAST_SERIALIZATION_VERIFY:
+        _verify(body, BatchResponse[_reference_schema(plan)](items=rows, missing=missing))
+    return body
+
+
+def json_response(response: Response, body: bytes) -> Response:
+    """Wrap rendered JSON, keeping headers (e.g. ETag) set on the injected response.
+
+    Args:
+        response: Response injected into the endpoint.
+        body: Rendered JSON.
+
+    Returns:
+        Response to return as-is, bypassing the endpoint's response_model.
+    """
+    return Response(body, media_type="application/json", headers=dict(response.headers))
@@ -0,0 +1,130 @@
+"""Request coalescing for identical concurrent reads.
+
+When many requests ask for the same data at once, only the first one
+(the leader) runs the query; the others wait for its result. Keys are
+built like cache keys, so they include the principal's supplier scope.
+
+Followers only share results and exceptions of a call that finished. If
+the leader is cancelled (client disconnected), a waiting follower takes
+over and runs the call itself.
+
+Example:
+    ```python
+    class SupplierService:
+        @cached("supplier.get", ttl=CACHE_TTL_MEDIUM, tags=["supplier:{supplier_id}"])
+        @coalesce("supplier.get")
+        async def get_supplier(self, supplier_id: int) -> SupplierRead:
+            ...
+    ```
+
+Coalesced methods must return values that are safe to share between
+requests (schemas, not ORM objects bound to the leader's session).
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.core.cache import make_key
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """The leader of a call was cancelled before it finished."""
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls with the same key within one process."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Call key.
+            fn: Zero-argument coroutine function doing the actual work.
+
+        Returns:
+            Result of fn (possibly of another caller's invocation).
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.followers += 1
+            try:
+                # Shield: a cancelled follower must not cancel the shared call
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                return await self.do(key, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._fail(future, _LeaderCancelled())
+            raise
+        except Exception as e:
+            self._fail(future, e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    @staticmethod
+    def _fail(future: asyncio.Future, exc: BaseException) -> None:
+        """Propagate an exception to followers."""
+        future.set_exception(exc)
+        # Mark as retrieved so calls without followers do not log a warning
+        future.exception()
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight group."""
+    return _single_flight
+
+
+def coalesce(namespace: str) -> Callable[[F], F]:
+    """Coalesce concurrent identical calls of an async function or method.
+
+    Args:
+        namespace: Key namespace, unique per coalesced method.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k not in ("self", "cls")}
+            return await _single_flight.do(
+                make_key(namespace, arguments),
+                lambda: func(*args, **kwargs),
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
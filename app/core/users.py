@@ -9,8 +9,10 @@ from typing import Optional
 from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, IntegerIDMixin
 from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.db.session import get_db
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -174,21 +176,20 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
 
 
 async def get_user_db(
-    session = Depends(lambda: None)  # Will be replaced with actual session dependency
+    session: AsyncSession = Depends(get_db),
 ) -> SQLAlchemyUserDatabase:
     """Get SQLAlchemy user database instance.
     
+    Uses the request's shared session, so user lookups and writes are part
+    of the request's single commit.
+    
     Args:
-        session: Database session from dependency injection
+        session: The request's database session
         
     Yields:
         SQLAlchemyUserDatabase instance
     """
-    # Import here to avoid circular dependency
-    from app.db.session import get_db
-    
-    async for db_session in get_db():
-        yield SQLAlchemyUserDatabase(db_session, User)
+    yield SQLAlchemyUserDatabase(session, User)
 
 
 async def get_user_manager(
@@ -0,0 +1,220 @@
+"""Connection pool warmup and adaptive pool sizing.
+
+`warm_pool()` opens `DATABASE_POOL_SIZE` connections at startup, so the
+first requests after a deploy do not pay for connection setup.
+
+`AdaptiveQueuePool` records how long each checkout waited for a
+connection (including connecting, when the pool had none idle). With
+`DATABASE_POOL_ADAPTIVE`, `PoolSizer` looks at the waits of every interval
+and resizes the pool within `DATABASE_POOL_MIN_SIZE` and
+`DATABASE_POOL_MAX_SIZE`:
+
+- grow by one when checkouts waited longer than
+  `DATABASE_POOL_TARGET_WAIT_MS` on average or every pooled connection
+  was in use at once;
+- shrink by one when checkouts did not wait and the peak usage left at
+  least two connections idle.
+
+`DATABASE_MAX_OVERFLOW` connections beyond the pool size stay available
+either way. Decisions are logged and counted in the readiness report's
+pool status (see `app.core.health`).
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdaptiveQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording checkout waits and resizable at runtime."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool (arguments of `AsyncAdaptedQueuePool`)."""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak_checked_out = 0
+        self.resizes = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Check a connection out, recording the wait."""
+        started = time.perf_counter()
+        record = super()._do_get()
+        waited = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+        return record
+
+    def resize(self, size: int) -> None:
+        """Change the number of connections kept in the pool.
+
+        Connections checked out beyond the new size count as overflow and
+        are closed when returned.
+
+        Args:
+            size: New pool size.
+        """
+        delta = size - self._pool.maxsize
+        if delta == 0:
+            return
+        with self._overflow_lock:
+            self._pool.maxsize = size
+            # The asyncio queue is created on first use
+            queue = self._pool.__dict__.get("_queue")
+            if queue is not None:
+                queue._maxsize = size
+            self._overflow -= delta
+        self.resizes += 1
+
+
+class PoolSizer:
+    """Resize adaptive pools from the checkout waits of each interval."""
+
+    def __init__(
+        self,
+        engines: Callable[[], list[AsyncEngine]],
+        interval: Optional[float] = None,
+    ) -> None:
+        """Initialize the sizer.
+
+        Args:
+            engines: Function returning the engines whose pools to size.
+            interval: Seconds between decisions; defaults to
+                `DATABASE_POOL_ADAPT_INTERVAL`.
+        """
+        self.engines = engines
+        self.interval = interval or settings.DATABASE_POOL_ADAPT_INTERVAL
+        self._task: Optional[asyncio.Task] = None
+        # Counters of each pool at the previous decision
+        self._last: dict[int, tuple[int, float]] = {}
+
+    def decide(self, pool: AdaptiveQueuePool) -> int:
+        """Pick the pool size for the next interval.
+
+        Args:
+            pool: Pool to look at; its peak usage is reset.
+
+        Returns:
+            New pool size (the current one when nothing changes).
+        """
+        checkouts, wait_total = self._last.get(id(pool), (0, 0.0))
+        self._last[id(pool)] = (pool.checkouts, pool.wait_total)
+        count = pool.checkouts - checkouts
+        avg_wait_ms = (pool.wait_total - wait_total) / count * 1000 if count else 0.0
+        peak, pool.peak_checked_out = pool.peak_checked_out, pool.checkedout()
+
+        size = pool.size()
+        if avg_wait_ms > settings.DATABASE_POOL_TARGET_WAIT_MS or peak >= size:
+            new_size = min(size + 1, settings.DATABASE_POOL_MAX_SIZE)
+        elif avg_wait_ms < settings.DATABASE_POOL_TARGET_WAIT_MS / 10 and peak <= size - 2:
+            new_size = max(size - 1, settings.DATABASE_POOL_MIN_SIZE)
+        else:
+            new_size = size
+        if new_size != size:
+            logger.info(
+                f"Resizing connection pool {size} -> {new_size} "
+                f"(checkouts={count}, avg_wait_ms={avg_wait_ms:.2f}, peak_checked_out={peak})"
+            )
+        return new_size
+
+    def adjust(self) -> None:
+        """Resize every adaptive pool once."""
+        for engine in self.engines():
+            pool = engine.pool
+            if isinstance(pool, AdaptiveQueuePool):
+                pool.resize(self.decide(pool))
+
+    def start(self) -> None:
+        """Start adjusting pools in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop adjusting pools."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Adjust pools every interval."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.adjust()
+            except Exception as e:
+                logger.error(f"Pool sizing failed: {e}")
+
+
+async def warm_pool(engine: AsyncEngine, connections: Optional[int] = None) -> int:
+    """Open pool connections ahead of the first requests.
+
+    Args:
+        engine: Engine whose pool to fill.
+        connections: Connections to open; defaults to the pool size.
+
+    Returns:
+        Number of connections opened (0 for engines without a queue pool).
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    count = pool.size() if connections is None else min(connections, pool.size())
+    # Hold every connection until all are open, so each is a distinct one
+    opened = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count)),
+        return_exceptions=True,
+    )
+    for connection in opened:
+        if isinstance(connection, AsyncConnection):
+            await connection.close()
+    failures = [e for e in opened if isinstance(e, BaseException)]
+    if failures:
+        logger.warning(f"Pool warmup opened {count - len(failures)}/{count}: {failures[0]}")
+    return count - len(failures)
+
+
+_pool_sizer: Optional[PoolSizer] = None
+
+
+async def init_pools(engines: Callable[[], list[AsyncEngine]]) -> None:
+    """Warm the pools and start adaptive sizing if enabled.
+
+    Args:
+        engines: Function returning the application's engines.
+    """
+    global _pool_sizer
+
+    if settings.DATABASE_POOL_WARMUP:
+        for engine in engines():
+            opened = await warm_pool(engine)
+            if opened:
+                logger.info(f"Warmed connection pool with {opened} connections")
+
+    if settings.DATABASE_POOL_ADAPTIVE and _pool_sizer is None:
+        _pool_sizer = PoolSizer(engines)
+        _pool_sizer.start()
+        logger.info("Adaptive connection pool sizing started")
+
+
+async def close_pools() -> None:
+    """Stop adaptive sizing."""
+    global _pool_sizer
+
+    if _pool_sizer is not None:
+        await _pool_sizer.stop()
+        _pool_sizer = None
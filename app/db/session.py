@@ -1,18 +1,57 @@
-"""Database session management with async SQLAlchemy."""
+"""Database session management with async SQLAlchemy.
 
-from collections.abc import AsyncGenerator
-from typing import Any
+Writes go to the primary engine (`get_db`). When
+`DATABASE_READ_REPLICA_URLS` is set, GET endpoints and reports read from
+replicas (`get_read_db`, round-robin, each with its own pool) so they do
+not compete with writes for primary connections.
 
+Replicas lag behind the primary. After a principal commits a write, its
+reads stay on the primary for `DATABASE_READ_STICKY_SECONDS`, so users
+see their own changes (read-your-writes). Write times are shared through
+Redis when `REDIS_URL` is set; otherwise each worker only knows its own
+writers, so with several workers a read served by another worker may
+still hit a lagging replica (a warning is logged at startup).
+
+A request has one unit of work: `get_db` opens the session that every
+dependency shares (repositories, services, FastAPI-Users, `get_read_db`
+without replicas) and commits it once. Services flush instead of
+committing and defer side effects such as cache invalidation with
+`after_commit()`.
+
+Sessions check a connection out of the pool on their first statement, so
+requests that never query hold no pool slot. Sessions that wrote nothing
+are closed without COMMIT, and with `DATABASE_RELEASE_EARLY` request
+sessions are finalized when the endpoint returns, before the response is
+serialized and sent (see `app.api.routing.DBRoute`).
+"""
+
+import inspect
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.profiling import trace_queries
+from app.core.security import request_principal
+from app.db.pool import AdaptiveQueuePool
+from app.db.sqlite import sqlite_engine_config, tune_sqlite
+from app.db.statements import statement_cache_stats
+from app.db.timeouts import enforce_statement_timeouts
 
 logger = get_logger(__name__)
 
@@ -20,30 +59,279 @@ logger = get_logger(__name__)
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
+# Read replicas (empty when reads go to the primary)
+_read_engines: list[AsyncEngine] = []
+_read_session_factories: list[async_sessionmaker[AsyncSession]] = []
+_replica_turn = itertools.count()
+
+# Session.info keys: the session has written at some point / since its last commit
+WROTE = "wrote"
+UNCOMMITTED = "uncommitted"
+# Session.info key of the callbacks to run after the next commit
+AFTER_COMMIT = "after_commit"
+
+# Sessions opened by dependencies of the current request (see DBRoute)
+_request_sessions: ContextVar[Optional[list[AsyncSession]]] = ContextVar(
+    "request_sessions",
+    default=None,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:
+    """Remember that a session flushed changes."""
+    session.info[WROTE] = session.info[UNCOMMITTED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(state: ORMExecuteState) -> None:
+    """Remember that a session executed INSERT / UPDATE / DELETE statements."""
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[WROTE] = state.session.info[UNCOMMITTED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_commit(session: Session) -> None:
+    """Forget uncommitted writes once they are committed."""
+    session.info.pop(UNCOMMITTED, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _mark_rollback(session: Session) -> None:
+    """Forget rolled back writes and the side effects waiting for them."""
+    session.info.pop(UNCOMMITTED, None)
+    session.info.pop(AFTER_COMMIT, None)
+
+
+def after_commit(session: AsyncSession, callback: Callable[..., Any], *args: Any) -> None:
+    """Run a callback once the session's writes are committed.
+    
+    Use for side effects that must not be visible before the data is,
+    e.g. cache invalidation. Callbacks are dropped if the transaction
+    rolls back. Coroutine results are awaited.
+    
+    Example:
+        ```python
+        await self.repository.update(supplier_id, data)
+        after_commit(self.session, get_cache().invalidate_tags, f"supplier:{supplier_id}")
+        ```
+    
+    Args:
+        session: Session the writes were made in.
+        callback: Function to call after the commit.
+        *args: Arguments of the callback.
+    """
+    session.info.setdefault(AFTER_COMMIT, []).append((callback, args))
+
+
+async def commit_session(session: AsyncSession) -> None:
+    """Commit a session, then run its after-commit callbacks.
+    
+    Args:
+        session: Session to commit.
+    """
+    await session.commit()
+    for callback, args in session.info.pop(AFTER_COMMIT, ()):
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"After-commit callback {callback!r} failed: {e}")
+
+
+def session_wrote(session: AsyncSession) -> bool:
+    """Whether a session has written anything since it was opened.
+    
+    Args:
+        session: Database session.
+        
+    Returns:
+        bool: True after a flush with changes or a DML statement.
+    """
+    return bool(session.info.get(WROTE))
+
+
+def needs_commit(session: AsyncSession) -> bool:
+    """Whether committing a session would write anything.
+    
+    Args:
+        session: Database session.
+        
+    Returns:
+        bool: True with pending (unflushed) changes or uncommitted writes.
+    """
+    return bool(session.new or session.dirty or session.deleted) or UNCOMMITTED in session.info
+
+
+async def release_session(session: AsyncSession) -> None:
+    """End a session's work and return its connection to the pool.
+    
+    Commits if the session has writes, otherwise closes it without COMMIT.
+    The session stays usable; a later statement checks out a new connection.
+    
+    Args:
+        session: Database session.
+    """
+    if needs_commit(session):
+        await commit_session(session)
+    else:
+        session.info.pop(AFTER_COMMIT, None)
+        await session.close()
+
+
+def track_request_sessions() -> Token:
+    """Start collecting the sessions opened for the current request.
+    
+    Returns:
+        Token: Pass to untrack_request_sessions() when the request is done.
+    """
+    return _request_sessions.set([])
+
+
+def untrack_request_sessions(token: Token) -> None:
+    """Stop collecting sessions for the current request."""
+    _request_sessions.reset(token)
+
+
+async def release_request_sessions() -> None:
+    """Release every session opened for the current request."""
+    for session in _request_sessions.get() or ():
+        await release_session(session)
+
+
+def _track(session: AsyncSession) -> None:
+    """Register a session opened for the current request, if tracked."""
+    sessions = _request_sessions.get()
+    if sessions is not None:
+        sessions.append(session)
+
+
+class RecentWriters:
+    """Principals that committed writes recently, for read-your-writes.
+    
+    Kept in process memory, so only this worker's writes are known.
+    """
+    
+    def __init__(self, max_entries: int = 100_000) -> None:
+        """Initialize with no writers.
+        
+        Args:
+            max_entries: Principals remembered; the oldest are forgotten first.
+        """
+        self.max_entries = max_entries
+        self._written_at: OrderedDict[str, float] = OrderedDict()
+    
+    async def record(self, principal: str) -> None:
+        """Remember that a principal just wrote."""
+        self._written_at.pop(principal, None)
+        self._written_at[principal] = time.monotonic()
+        if len(self._written_at) > self.max_entries:
+            self._written_at.popitem(last=False)
+    
+    async def is_recent(self, principal: str, window: float) -> bool:
+        """Whether a principal wrote within the last `window` seconds."""
+        written_at = self._written_at.get(principal)
+        return written_at is not None and time.monotonic() - written_at < window
+    
+    def clear(self) -> None:
+        """Forget every writer."""
+        self._written_at.clear()
+    
+    async def close(self) -> None:
+        """Release resources (nothing to release locally)."""
+
+
+class RedisRecentWriters(RecentWriters):
+    """Recent writers shared by all workers through Redis.
+    
+    Each write stores the wall-clock time under the principal's key, which
+    expires after the sticky window. Writes are also remembered locally,
+    and Redis errors fall back to the local writers, so an outage only
+    loses stickiness across workers.
+    """
+    
+    def __init__(self, url: str, ttl: float, max_entries: int = 100_000) -> None:
+        """Create a client; connections are opened lazily.
+        
+        Args:
+            url: Redis connection URL.
+            ttl: Seconds a write time is kept (the sticky window).
+            max_entries: Principals remembered locally.
+        """
+        from redis import asyncio as redis
+        
+        super().__init__(max_entries)
+        self.ttl = ttl
+        self._client = redis.from_url(url)
+    
+    async def record(self, principal: str) -> None:
+        """Remember that a principal just wrote, in every worker."""
+        await super().record(principal)
+        try:
+            await self._client.set(
+                f"recent-writer:{principal}",
+                repr(time.time()),
+                px=max(int(self.ttl * 1000), 1),
+            )
+        except Exception as e:
+            logger.warning(f"Recent writers backend failed, using local writers: {e}")
+    
+    async def is_recent(self, principal: str, window: float) -> bool:
+        """Whether a principal wrote within the last `window` seconds on any worker."""
+        if await super().is_recent(principal, window):
+            return True
+        try:
+            written_at = await self._client.get(f"recent-writer:{principal}")
+        except Exception as e:
+            logger.warning(f"Recent writers backend failed, using local writers: {e}")
+            return False
+        return written_at is not None and time.time() - float(written_at) < window
+    
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
 
-def get_engine_config() -> dict[str, Any]:
+recent_writers: RecentWriters = RecentWriters()
+
+
+def get_engine_config(url: str | None = None) -> dict[str, Any]:
     """Get database engine configuration based on settings.
     
+    Args:
+        url: Database URL the engine is for; DATABASE_URL if omitted.
+        
     Returns:
         dict: Engine configuration parameters.
     """
+    url = url or settings.DATABASE_URL
     config: dict[str, Any] = {
         "echo": settings.DATABASE_ECHO,
         "future": True,
+        "query_cache_size": settings.DATABASE_QUERY_CACHE_SIZE,
     }
     
     # Use different pool settings for SQLite vs PostgreSQL
-    if "sqlite" in settings.DATABASE_URL:
-        # SQLite doesn't support connection pooling
-        config["poolclass"] = NullPool
-        config["connect_args"] = {"check_same_thread": False}
+    if "sqlite" in url:
+        # Pool and pragmas depend on DATABASE_SQLITE_PROFILE
+        config.update(sqlite_engine_config(url))
     else:
-        # PostgreSQL with connection pooling
-        config["poolclass"] = QueuePool
+        # PostgreSQL with connection pooling (asyncio-compatible queue pool,
+        # recording checkout waits for adaptive sizing)
+        config["poolclass"] = AdaptiveQueuePool
         config["pool_size"] = settings.DATABASE_POOL_SIZE
         config["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
         config["pool_recycle"] = settings.DATABASE_POOL_RECYCLE
         config["pool_pre_ping"] = settings.DATABASE_POOL_PRE_PING
+        config["pool_timeout"] = settings.DATABASE_POOL_TIMEOUT
+        if "asyncpg" in url:
+            config["connect_args"] = {
+                "prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+                "server_settings": {
+                    "statement_timeout": str(int(settings.DATABASE_STATEMENT_TIMEOUT * 1000)),
+                },
+            }
     
     return config
 
@@ -53,7 +341,7 @@ async def init_db() -> None:
     
     Should be called on application startup.
     """
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engines, _read_session_factories, recent_writers
     
     if _engine is not None:
         logger.warning("Database engine already initialized")
@@ -62,19 +350,57 @@ async def init_db() -> None:
     logger.info(f"Initializing database: {settings.DATABASE_URL.split('@')[-1]}")
     
     # Create async engine
-    engine_config = get_engine_config()
-    _engine = create_async_engine(settings.DATABASE_URL, **engine_config)
+    _engine = _create_engine(settings.DATABASE_URL)
     
     # Create session factory
-    _session_factory = async_sessionmaker(
-        _engine,
+    _session_factory = _make_session_factory(_engine)
+    
+    # Create read replica engines, each with its own pool
+    for url in settings.DATABASE_READ_REPLICA_URLS:
+        logger.info(f"Initializing read replica: {url.split('@')[-1]}")
+        engine = _create_engine(url)
+        _read_engines.append(engine)
+        _read_session_factories.append(_make_session_factory(engine))
+    
+    # Share read-your-writes stickiness between workers
+    if _read_engines and settings.REDIS_URL:
+        try:
+            recent_writers = RedisRecentWriters(
+                settings.REDIS_URL, settings.DATABASE_READ_STICKY_SECONDS
+            )
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+    if _read_engines and settings.WORKERS > 1 and not isinstance(
+        recent_writers, RedisRecentWriters
+    ):
+        logger.warning(
+            f"Read-your-writes is per worker: {settings.WORKERS} workers need REDIS_URL "
+            f"to share recent writes"
+        )
+    
+    logger.info("Database engine initialized successfully")
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an engine with statement cache stats, timeouts, SQL tracing and SQLite tuning."""
+    engine = create_async_engine(url, **get_engine_config(url))
+    statement_cache_stats.instrument(engine)
+    enforce_statement_timeouts(engine)
+    trace_queries(engine)
+    if engine.dialect.name == "sqlite":
+        tune_sqlite(engine)
+    return engine
+
+
+def _make_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory of an engine."""
+    return async_sessionmaker(
+        engine,
         class_=AsyncSession,
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
     )
-    
-    logger.info("Database engine initialized successfully")
 
 
 async def close_db() -> None:
@@ -82,7 +408,7 @@ async def close_db() -> None:
     
     Should be called on application shutdown.
     """
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engines, _read_session_factories, recent_writers
     
     if _engine is None:
         return
@@ -93,9 +419,41 @@ async def close_db() -> None:
     _engine = None
     _session_factory = None
     
+    for engine in _read_engines:
+        await engine.dispose()
+    _read_engines = []
+    _read_session_factories = []
+    await recent_writers.close()
+    recent_writers = RecentWriters()
+    
     logger.info("Database connections closed")
 
 
+def get_engine() -> AsyncEngine:
+    """Get the database engine.
+    
+    Returns:
+        AsyncEngine: Engine created by init_db().
+        
+    Raises:
+        RuntimeError: If database is not initialized.
+    """
+    if _engine is None:
+        raise RuntimeError(
+            "Database not initialized. Call init_db() first."
+        )
+    return _engine
+
+
+def get_engines() -> list[AsyncEngine]:
+    """Get the primary and read replica engines.
+    
+    Returns:
+        list: Engines created by init_db() (empty before).
+    """
+    return [_engine, *_read_engines] if _engine is not None else []
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get the session factory.
     
@@ -112,11 +470,33 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_read_session_factory(
+    principal: str | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """Get the session factory reads should use.
+    
+    Args:
+        principal: Who is reading (see request_principal); principals who
+            wrote recently read from the primary.
+        
+    Returns:
+        async_sessionmaker: Next replica's factory, or the primary's when
+            there are no replicas or the principal wrote recently.
+    """
+    if not _read_session_factories or (
+        principal is not None
+        and await recent_writers.is_recent(principal, settings.DATABASE_READ_STICKY_SECONDS)
+    ):
+        return get_session_factory()
+    return _read_session_factories[next(_replica_turn) % len(_read_session_factories)]
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Get database session for dependency injection.
     
     This is the main function used with FastAPI's Depends() to inject
-    database sessions into route handlers.
+    database sessions into route handlers. Sessions use the primary and
+    commit when the request succeeds, unless nothing was written.
     
     Example:
         ```python
@@ -126,15 +506,22 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             pass
         ```
     
+    Args:
+        request: Current request (identifies the writer for read-your-writes).
+    
     Yields:
         AsyncSession: Database session that will be automatically closed.
     """
     session_factory = get_session_factory()
     
     async with session_factory() as session:
+        _track(session)
         try:
             yield session
-            await session.commit()
+            if needs_commit(session):
+                await commit_session(session)
+            if _read_session_factories and session_wrote(session):
+                await recent_writers.record(request_principal(request.headers, request.client))
         except Exception:
             await session.rollback()
             raise
@@ -142,6 +529,43 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only database session for dependency injection.
+    
+    Use for GET endpoints and reports. The session reads from a replica
+    when one is configured and never commits. Without replicas, or right
+    after the same principal wrote, it is the request's `get_db` session.
+    
+    Example:
+        ```python
+        @router.get("/reports/spend")
+        async def spend(db: AsyncSession = Depends(get_read_db)):
+            ...
+        ```
+    
+    Args:
+        request: Current request (identifies the reader).
+        db: The request's primary session.
+        
+    Yields:
+        AsyncSession: Database session that will be automatically closed.
+    """
+    if not _read_session_factories or await recent_writers.is_recent(
+        request_principal(request.headers, request.client),
+        settings.DATABASE_READ_STICKY_SECONDS,
+    ):
+        yield db
+        return
+    
+    session_factory = _read_session_factories[next(_replica_turn) % len(_read_session_factories)]
+    async with session_factory() as session:
+        _track(session)
+        yield session
+
+
 async def get_db_context() -> AsyncSession:
     """Get database session for use outside of FastAPI dependency injection.
     
@@ -162,11 +586,45 @@ async def get_db_context() -> AsyncSession:
     return session_factory()
 
 
+@asynccontextmanager
+async def primary_session(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Use the primary for reads that must not lag behind writes.
+    
+    Process-wide snapshots (catalog indexes, price cache) serve every later
+    request, so they are never built from a replica.
+    
+    Args:
+        session: The caller's session, possibly on a read replica.
+        
+    Yields:
+        AsyncSession: `session` itself if it uses the primary, else a
+            short-lived primary session.
+    """
+    if not any(session.bind is engine for engine in _read_engines):
+        yield session
+        return
+    async with get_session_factory()() as primary:
+        yield primary
+
+
 # Export for convenience
 __all__ = [
     "init_db",
+    "after_commit",
     "close_db",
+    "commit_session",
     "get_db",
     "get_db_context",
+    "get_engine",
+    "get_engines",
+    "get_read_db",
+    "get_read_session_factory",
     "get_session_factory",
+    "needs_commit",
+    "primary_session",
+    "release_request_sessions",
+    "release_session",
+    "session_wrote",
+    "track_request_sessions",
+    "untrack_request_sessions",
 ]
@@ -0,0 +1,126 @@
+"""SQLite engine profiles.
+
+- ``basic``: a new connection per session (`NullPool`) with SQLite's
+  defaults.
+- ``tuned`` (default): for single-node installs and tests. File databases
+  keep `DATABASE_SQLITE_POOL_SIZE` pooled connections, and every connection
+  is configured on connect:
+
+  - ``journal_mode=WAL``: readers do not block the writer and vice versa;
+  - ``synchronous=NORMAL``: no fsync per commit (safe with WAL);
+  - ``mmap_size`` and ``cache_size``: fewer read syscalls and page misses;
+  - ``busy_timeout``: wait for locks instead of failing at once.
+
+  SQLite allows one writer at a time. Rather than have connections spin in
+  SQLite's busy handler (each blocking its aiosqlite thread), a connection
+  takes the engine's writer lock before its first INSERT / UPDATE /
+  DELETE and releases it when it is returned to the pool, so writers
+  queue on the event loop.
+
+In-memory databases use a single shared connection (`StaticPool`) in both
+profiles, since each new connection would see an empty database.
+"""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.util import await_only
+
+from app.core.config import settings
+from app.db.pool import AdaptiveQueuePool
+
+# Connection info key set while the connection holds the writer lock
+WRITER = "sqlite_writer"
+
+# Statements for which SQLite takes the write lock
+_WRITES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def is_memory_database(url: str) -> bool:
+    """Whether a SQLite URL points to an in-memory database."""
+    path = url.split("://", 1)[-1].lstrip("/")
+    return path in ("", ":memory:") or "mode=memory" in url
+
+
+def sqlite_engine_config(url: str) -> dict[str, Any]:
+    """Get the pool configuration of a SQLite engine.
+
+    Args:
+        url: SQLite database URL.
+
+    Returns:
+        dict: Engine configuration parameters.
+    """
+    config: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if is_memory_database(url):
+        config["poolclass"] = StaticPool
+    elif settings.DATABASE_SQLITE_PROFILE == "tuned":
+        config["poolclass"] = AdaptiveQueuePool
+        config["pool_size"] = settings.DATABASE_SQLITE_POOL_SIZE
+        config["max_overflow"] = 0
+        config["pool_timeout"] = settings.DATABASE_POOL_TIMEOUT
+    else:
+        config["poolclass"] = NullPool
+    return config
+
+
+def tune_sqlite(engine: AsyncEngine) -> None:
+    """Apply the tuned profile to a SQLite engine.
+
+    Args:
+        engine: SQLite engine; ignored for the basic profile.
+    """
+    if settings.DATABASE_SQLITE_PROFILE != "tuned":
+        return
+
+    pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": settings.DATABASE_SQLITE_MMAP_SIZE,
+        "cache_size": -settings.DATABASE_SQLITE_CACHE_SIZE_KB,
+        "busy_timeout": settings.DATABASE_SQLITE_BUSY_TIMEOUT,
+        "temp_store": "MEMORY",
+    }
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        """Configure a new connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+    # A shared in-memory connection has no concurrent writers
+    if isinstance(engine.pool, StaticPool):
+        return
+    writer_lock = asyncio.Lock()
+    lock_timeout = settings.DATABASE_SQLITE_BUSY_TIMEOUT / 1000
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def take_writer_lock(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Wait for the writer lock before a connection's first write."""
+        if conn.info.get(WRITER) or not statement.lstrip()[:7].upper().startswith(_WRITES):
+            return
+        try:
+            await_only(asyncio.wait_for(writer_lock.acquire(), lock_timeout))
+        except TimeoutError as e:
+            raise OperationalError(statement, parameters, Exception("database is locked")) from e
+        conn.info[WRITER] = True
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def release_writer_lock(dbapi_connection: Any, connection_record: Any) -> None:
+        """Release the writer lock once the connection's transaction ended."""
+        if connection_record.info.pop(WRITER, False):
+            writer_lock.release()
@@ -0,0 +1,101 @@
+"""Statement cache instrumentation.
+
+SQLAlchemy caches the SQL compiled for each statement structure in the
+engine's compiled cache (`DATABASE_QUERY_CACHE_SIZE` entries), keyed by the
+statement's cache key, and asyncpg keeps up to
+`DATABASE_PREPARED_STATEMENT_CACHE_SIZE` server-side prepared statements
+per connection, keyed by the SQL text. A hit on both skips SQL compilation
+in Python and parsing/planning on the server.
+
+`StatementCacheStats` counts hits and misses of both caches for every
+statement sent to the database; the readiness report includes the totals
+(see `app.core.health`). A low compiled hit rate usually means statements
+embed literal values instead of bind parameters, or the cache is too small
+for the number of distinct queries.
+"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.schemas.common import StatementCacheStatus
+
+
+def _rate(hits: int, misses: int) -> float | None:
+    """Hit rate, or None before the first lookup."""
+    total = hits + misses
+    return round(hits / total, 3) if total else None
+
+
+class StatementCacheStats:
+    """Hit and miss counters of the compiled SQL and prepared statement caches."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        self.compiled_hits = 0
+        self.compiled_misses = 0
+        self.prepared_hits = 0
+        self.prepared_misses = 0
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Count the cache lookups of every statement an engine executes.
+
+        Args:
+            engine: Engine to instrument.
+        """
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Record the cache lookups of one statement."""
+        if context is not None:
+            if context.cache_hit is Dialect.CACHE_HIT:
+                self.compiled_hits += 1
+            elif context.cache_hit is Dialect.CACHE_MISS:
+                self.compiled_misses += 1
+
+        # Only the asyncpg adapter keeps a prepared statement cache
+        cache = getattr(conn.connection.dbapi_connection, "_prepared_statement_cache", None)
+        if cache is not None:
+            if statement in cache:
+                self.prepared_hits += 1
+            else:
+                self.prepared_misses += 1
+
+    def status(self, engine: AsyncEngine) -> StatementCacheStatus:
+        """Report the counters and the fill level of an engine's compiled cache.
+
+        Args:
+            engine: Engine whose compiled cache to report.
+
+        Returns:
+            Cache usage and hit rates.
+        """
+        compiled_cache = engine.sync_engine._compiled_cache
+        return StatementCacheStatus(
+            compiled_entries=len(compiled_cache) if compiled_cache is not None else 0,
+            compiled_capacity=compiled_cache.capacity if compiled_cache is not None else 0,
+            compiled_hits=self.compiled_hits,
+            compiled_misses=self.compiled_misses,
+            compiled_hit_rate=_rate(self.compiled_hits, self.compiled_misses),
+            prepared_hits=self.prepared_hits,
+            prepared_misses=self.prepared_misses,
+            prepared_hit_rate=_rate(self.prepared_hits, self.prepared_misses),
+        )
+
+
+statement_cache_stats = StatementCacheStats()
@@ -0,0 +1,205 @@
+"""Statement timeouts and cancellation of a request's queries.
+
+Every statement runs under a timeout, so a runaway search or report
+cannot hold a pool connection indefinitely:
+
+- PostgreSQL connections get `DATABASE_STATEMENT_TIMEOUT` as their
+  ``statement_timeout`` server setting; routes with their own timeout
+  (`DATABASE_ROUTE_STATEMENT_TIMEOUTS`) issue ``SET LOCAL
+  statement_timeout`` when their transaction begins.
+- SQLite connections get a progress handler interrupting the statement
+  once its deadline has passed.
+
+`app.api.routing.DBRoute` sets the timeout of each request, answers
+timeouts with 504, and cancels the request's queries when the client
+disconnects (`interrupt_request_queries`; PostgreSQL queries are cancelled
+by asyncpg when the awaiting task is cancelled).
+"""
+
+import math
+import sqlite3
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.util import await_only
+
+from app.core.config import settings
+
+# Connection info key of the deadline cell read by the SQLite progress handler
+DEADLINE = "statement_deadline"
+
+# SQLite virtual machine instructions between deadline checks
+PROGRESS_INTERVAL = 1000
+
+# SQLSTATE of a query cancelled by statement_timeout or a cancel request
+QUERY_CANCELED = "57014"
+
+
+class RequestQueries:
+    """Statement timeout and SQLite deadline cells of one request."""
+
+    def __init__(self, timeout: Optional[float]) -> None:
+        """Initialize the state.
+
+        Args:
+            timeout: Statement timeout in seconds; None for the default.
+        """
+        self.timeout = timeout
+        # Deadline cells by id (cells are lists, compared by value)
+        self.cells: dict[int, list[float]] = {}
+
+
+_request_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries",
+    default=None,
+)
+
+
+def route_statement_timeout(path: str) -> Optional[float]:
+    """Get the statement timeout configured for a route.
+
+    Args:
+        path: Route path; the longest matching prefix of
+            `DATABASE_ROUTE_STATEMENT_TIMEOUTS` wins.
+
+    Returns:
+        Timeout in seconds, or None to use `DATABASE_STATEMENT_TIMEOUT`.
+    """
+    matches = [
+        prefix for prefix in settings.DATABASE_ROUTE_STATEMENT_TIMEOUTS if path.startswith(prefix)
+    ]
+    if not matches:
+        return None
+    return settings.DATABASE_ROUTE_STATEMENT_TIMEOUTS[max(matches, key=len)]
+
+
+def statement_timeout() -> float:
+    """Get the statement timeout of the current request in seconds (0: none)."""
+    state = _request_queries.get()
+    if state is None or state.timeout is None:
+        return settings.DATABASE_STATEMENT_TIMEOUT
+    return state.timeout
+
+
+def start_request_queries(timeout: Optional[float]) -> Token:
+    """Start tracking the queries of a request.
+
+    Args:
+        timeout: Statement timeout of the request; None for the default.
+
+    Returns:
+        Token for `end_request_queries`.
+    """
+    return _request_queries.set(RequestQueries(timeout))
+
+
+def end_request_queries(token: Token) -> None:
+    """Stop tracking the queries of a request."""
+    _request_queries.reset(token)
+
+
+def interrupt_request_queries() -> None:
+    """Interrupt the SQLite statements running for the current request."""
+    state = _request_queries.get()
+    if state is not None:
+        for cell in state.cells.values():
+            cell[0] = -math.inf
+
+
+def is_statement_timeout(error: DBAPIError) -> bool:
+    """Whether a database error is a statement timeout or cancellation.
+
+    Args:
+        error: Error raised by SQLAlchemy.
+
+    Returns:
+        True for PostgreSQL's query_canceled and SQLite's interrupt.
+    """
+    if getattr(error.orig, "sqlstate", None) == QUERY_CANCELED:
+        return True
+    return isinstance(error.orig, sqlite3.OperationalError) and str(error.orig) == "interrupted"
+
+
+def _install_progress_handler(dbapi_connection: Any, connection_record: Any) -> None:
+    """Interrupt SQLite statements running past their deadline."""
+    cell = [math.inf]
+    await_only(
+        dbapi_connection.driver_connection.set_progress_handler(
+            lambda: time.monotonic() > cell[0],
+            PROGRESS_INTERVAL,
+        )
+    )
+    connection_record.info[DEADLINE] = cell
+
+
+def _start_deadline(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Arm the deadline of a SQLite statement."""
+    cell = conn.info.get(DEADLINE)
+    if cell is None:
+        return
+    timeout = statement_timeout()
+    cell[0] = time.monotonic() + timeout if timeout > 0 else math.inf
+    state = _request_queries.get()
+    if state is not None:
+        state.cells[id(cell)] = cell
+
+
+def _clear_deadline(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Disarm the deadline once a SQLite statement finished."""
+    cell = conn.info.get(DEADLINE)
+    if cell is not None:
+        cell[0] = math.inf
+
+
+def enforce_statement_timeouts(engine: AsyncEngine) -> None:
+    """Enforce statement timeouts on an engine.
+
+    PostgreSQL engines get their default timeout from `get_engine_config`;
+    SQLite engines get a progress handler here.
+
+    Args:
+        engine: Engine to instrument.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    event.listen(engine.sync_engine, "connect", _install_progress_handler)
+    event.listen(engine.sync_engine, "before_cursor_execute", _start_deadline)
+    event.listen(engine.sync_engine, "after_cursor_execute", _clear_deadline)
+
+
+@event.listens_for(Session, "after_begin")
+def _set_local_timeout(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    """Apply a route's own statement timeout to a PostgreSQL transaction."""
+    state = _request_queries.get()
+    if (
+        state is None
+        or state.timeout is None
+        or state.timeout == settings.DATABASE_STATEMENT_TIMEOUT
+        or connection.dialect.name != "postgresql"
+    ):
+        return
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(state.timeout * 1000)}")
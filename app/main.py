@@ -8,14 +8,16 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import ORJSONResponse
 
 from app.api.errors.http_error import http_error_handler, validation_error_handler
 from app.api.v1.router import router as api_v1_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.events import lifespan
 from app.core.logging import setup_logging
+from app.core.profiling import SlowRequestMiddleware
+from app.core.rate_limit import RateLimitMiddleware
 
 # Setup logging
 setup_logging()
@@ -32,6 +34,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Add rate limiting (inside CORS so 429 responses carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -41,8 +46,15 @@ app.add_middleware(
     allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
-# Add Gzip middleware for response compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add response compression (zstd / brotli / gzip, negotiated per request)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    thread_min_size=settings.COMPRESSION_THREAD_MIN_SIZE,
+)
+
+# Capture profiles and SQL traces of slow requests (outermost, times everything)
+app.add_middleware(SlowRequestMiddleware)
 
 # Add error handlers
 from fastapi.exceptions import RequestValidationError
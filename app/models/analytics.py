@@ -0,0 +1,160 @@
+"""
+Purchasing analytics rollup models.
+Bảng tổng hợp chi phí mua hàng, cập nhật tăng dần khi phiếu giao hàng được xác nhận.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, IDMixin, TimestampMixin
+
+
+class DailySpendRollup(Base, IDMixin, TimestampMixin):
+    """Daily spend rollup - Chi phí theo ngày / nhà cung cấp / nhà hàng / sản phẩm.
+
+    Attributes:
+        id: Primary key
+        spend_date: Ngày giao hàng
+        supplier_id: ID nhà cung cấp
+        restaurant_id: ID nhà hàng nhận hàng
+        product_id: ID sản phẩm Aladdin
+        quantity: Tổng số lượng (đơn vị chuẩn)
+        amount: Tổng thành tiền
+        line_count: Số dòng phiếu giao hàng đã cộng dồn
+
+    Business Rules:
+        - (spend_date, supplier_id, restaurant_id, product_id) là duy nhất
+    """
+    __tablename__ = "spend_daily_rollups"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "spend_date",
+            "supplier_id",
+            "restaurant_id",
+            "product_id",
+            name="uq_spend_daily_rollups_key",
+        ),
+        Index("ix_spend_daily_rollups_restaurant_date", "restaurant_id", "spend_date"),
+        Index("ix_spend_daily_rollups_supplier_date", "supplier_id", "spend_date"),
+    )
+
+    spend_date: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Ngày giao hàng"
+    )
+
+    supplier_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ID nhà cung cấp"
+    )
+
+    # Chưa có bảng restaurants; khóa ngoại sẽ được thêm cùng bảng đó
+    restaurant_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID nhà hàng nhận hàng"
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="ID sản phẩm Aladdin"
+    )
+
+    quantity: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4),
+        default=0,
+        nullable=False,
+        comment="Tổng số lượng (đơn vị chuẩn)"
+    )
+
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(18, 2),
+        default=0,
+        nullable=False,
+        comment="Tổng thành tiền"
+    )
+
+    line_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Số dòng phiếu giao hàng"
+    )
+
+
+class MonthlySupplierSpendRollup(Base, IDMixin, TimestampMixin):
+    """Monthly supplier spend rollup - Chi phí theo tháng / nhà cung cấp / nhà hàng.
+
+    Attributes:
+        id: Primary key
+        month: Ngày đầu tháng
+        supplier_id: ID nhà cung cấp
+        restaurant_id: ID nhà hàng nhận hàng
+        amount: Tổng thành tiền
+        line_count: Số dòng phiếu giao hàng
+        delivery_count: Số phiếu giao hàng
+
+    Business Rules:
+        - (month, supplier_id, restaurant_id) là duy nhất
+    """
+    __tablename__ = "spend_monthly_supplier_rollups"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "month",
+            "supplier_id",
+            "restaurant_id",
+            name="uq_spend_monthly_supplier_rollups_key",
+        ),
+        Index("ix_spend_monthly_supplier_rollups_supplier_month", "supplier_id", "month"),
+    )
+
+    month: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Ngày đầu tháng"
+    )
+
+    supplier_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ID nhà cung cấp"
+    )
+
+    restaurant_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID nhà hàng nhận hàng"
+    )
+
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(18, 2),
+        default=0,
+        nullable=False,
+        comment="Tổng thành tiền"
+    )
+
+    line_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Số dòng phiếu giao hàng"
+    )
+
+    delivery_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Số phiếu giao hàng"
+    )
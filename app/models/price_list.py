@@ -0,0 +1,191 @@
+"""
+Supplier price list models.
+Bảng giá thỏa thuận với nhà cung cấp, có hiệu lực theo thời gian.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, IDMixin, TimestampMixin
+
+
+class SupplierPriceList(Base, IDMixin, TimestampMixin):
+    """Supplier price list model - Bảng giá nhà cung cấp.
+
+    Attributes:
+        id: Primary key
+        supplier_id: ID nhà cung cấp
+        code: Mã bảng giá (unique theo nhà cung cấp)
+        name: Tên bảng giá
+        valid_from: Ngày bắt đầu hiệu lực
+        valid_to: Ngày hết hiệu lực (NULL: không thời hạn)
+        is_active: Trạng thái hoạt động
+        note: Ghi chú
+
+    Business Rules:
+        - (supplier_id, code) là duy nhất
+        - Khi nhiều bảng giá cùng hiệu lực, bảng có valid_from mới nhất được dùng
+    """
+    __tablename__ = "supplier_price_lists"
+
+    __table_args__ = (
+        UniqueConstraint("supplier_id", "code", name="uq_supplier_price_lists_supplier_code"),
+    )
+
+    supplier_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="ID nhà cung cấp"
+    )
+
+    code: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Mã bảng giá"
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        comment="Tên bảng giá"
+    )
+
+    valid_from: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Ngày bắt đầu hiệu lực"
+    )
+
+    valid_to: Mapped[Optional[date]] = mapped_column(
+        Date,
+        nullable=True,
+        comment="Ngày hết hiệu lực (NULL: không thời hạn)"
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        comment="Trạng thái hoạt động"
+    )
+
+    note: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Ghi chú"
+    )
+
+    # Relationships
+    items: Mapped[list["SupplierPriceListItem"]] = relationship(
+        "SupplierPriceListItem",
+        back_populates="price_list",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<SupplierPriceList(id={self.id}, supplier_id={self.supplier_id}, "
+            f"code='{self.code}', valid_from={self.valid_from})>"
+        )
+
+
+class SupplierPriceListItem(Base, IDMixin, TimestampMixin):
+    """Supplier price list item model - Giá của một sản phẩm trong bảng giá.
+
+    valid_from/valid_to được sao chép từ bảng giá để tra giá tại một ngày
+    chỉ cần đọc một bảng qua index (supplier_product_id, valid_from).
+
+    Attributes:
+        id: Primary key
+        price_list_id: ID bảng giá
+        supplier_product_id: ID sản phẩm của supplier
+        price: Đơn giá theo đơn vị tính của supplier
+        valid_from: Ngày bắt đầu hiệu lực (theo bảng giá)
+        valid_to: Ngày hết hiệu lực (theo bảng giá)
+        is_active: Trạng thái hoạt động (theo bảng giá)
+    """
+    __tablename__ = "supplier_price_list_items"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "price_list_id",
+            "supplier_product_id",
+            name="uq_supplier_price_list_items_list_product",
+        ),
+        Index(
+            "ix_supplier_price_list_items_product_valid_from",
+            "supplier_product_id",
+            "valid_from",
+        ),
+    )
+
+    price_list_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("supplier_price_lists.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="ID bảng giá"
+    )
+
+    supplier_product_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("supplier_products.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ID sản phẩm của supplier"
+    )
+
+    price: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        comment="Đơn giá theo đơn vị tính của supplier"
+    )
+
+    valid_from: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Ngày bắt đầu hiệu lực (theo bảng giá)"
+    )
+
+    valid_to: Mapped[Optional[date]] = mapped_column(
+        Date,
+        nullable=True,
+        comment="Ngày hết hiệu lực (theo bảng giá)"
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        comment="Trạng thái hoạt động (theo bảng giá)"
+    )
+
+    # Relationships
+    price_list: Mapped["SupplierPriceList"] = relationship(
+        "SupplierPriceList",
+        back_populates="items",
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<SupplierPriceListItem(id={self.id}, price_list_id={self.price_list_id}, "
+            f"supplier_product_id={self.supplier_product_id}, price={self.price})>"
+        )
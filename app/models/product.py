@@ -0,0 +1,328 @@
+"""
+Product catalog models.
+Danh mục sản phẩm chuẩn của Aladdin và mapping sản phẩm của từng nhà cung cấp.
+"""
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, IDMixin, TimestampMixin
+
+if TYPE_CHECKING:
+    from app.models.supplier import Supplier
+
+
+class ProductCategory(Base, IDMixin, TimestampMixin):
+    """Product category model - Danh mục sản phẩm.
+
+    Attributes:
+        id: Primary key
+        code: Mã danh mục (unique)
+        name: Tên danh mục
+        description: Mô tả danh mục
+        is_active: Trạng thái hoạt động
+    """
+    __tablename__ = "product_categories"
+
+    code: Mapped[str] = mapped_column(
+        String(50),
+        unique=True,
+        nullable=False,
+        index=True,
+        comment="Mã danh mục"
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        comment="Tên danh mục"
+    )
+
+    description: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Mô tả danh mục"
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        comment="Trạng thái hoạt động"
+    )
+
+    # Relationships
+    products: Mapped[list["Product"]] = relationship(
+        "Product",
+        back_populates="category",
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ProductCategory(id={self.id}, code='{self.code}')>"
+
+
+class Product(Base, IDMixin, TimestampMixin):
+    """Product model - Sản phẩm chuẩn của Aladdin.
+
+    Mỗi nhà cung cấp đặt tên và đóng gói khác nhau; tất cả đều được
+    quy về một sản phẩm chuẩn với một đơn vị tính chuẩn (`unit`).
+
+    Attributes:
+        id: Primary key
+        code: Mã sản phẩm Aladdin (unique)
+        name: Tên sản phẩm
+        category_id: ID danh mục
+        unit: Đơn vị tính chuẩn (kg, lít, cái, ...)
+        description: Mô tả
+        specifications: Thông số kỹ thuật
+        is_active: Trạng thái hoạt động
+    """
+    __tablename__ = "products"
+
+    code: Mapped[str] = mapped_column(
+        String(50),
+        unique=True,
+        nullable=False,
+        index=True,
+        comment="Mã sản phẩm Aladdin (unique)"
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        index=True,
+        comment="Tên sản phẩm"
+    )
+
+    category_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("product_categories.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+        comment="ID danh mục sản phẩm"
+    )
+
+    unit: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Đơn vị tính chuẩn (kg, lít, cái, ...)"
+    )
+
+    description: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Mô tả sản phẩm"
+    )
+
+    specifications: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Thông số kỹ thuật (JSON string)"
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        index=True,
+        comment="Trạng thái hoạt động"
+    )
+
+    # Relationships
+    category: Mapped["ProductCategory"] = relationship(
+        "ProductCategory",
+        back_populates="products",
+        lazy="selectin"
+    )
+
+    supplier_products: Mapped[list["SupplierProduct"]] = relationship(
+        "SupplierProduct",
+        back_populates="product",
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Product(id={self.id}, code='{self.code}', unit='{self.unit}')>"
+
+
+class SupplierProduct(Base, IDMixin, TimestampMixin):
+    """Supplier product model - Mapping sản phẩm giữa Aladdin và nhà cung cấp.
+
+    Một dòng phiếu giao hàng (`iit_code`, `iit_uom`) của nhà cung cấp
+    được quy về sản phẩm chuẩn qua bảng này.
+
+    Attributes:
+        id: Primary key
+        supplier_id: ID nhà cung cấp
+        product_id: ID sản phẩm Aladdin
+        supplier_product_code: Mã sản phẩm của supplier (iit_code)
+        supplier_product_name: Tên sản phẩm của supplier (iit_name)
+        supplier_unit: Đơn vị tính của supplier (iit_uom)
+        conversion_rate: 1 supplier_unit = conversion_rate * product.unit.
+            NULL nghĩa là tra bảng unit_conversions.
+        price: Giá mặc định
+        min_order_quantity: Số lượng đặt hàng tối thiểu
+        is_active: Trạng thái hoạt động
+
+    Business Rules:
+        - (supplier_id, supplier_product_code) là duy nhất
+    """
+    __tablename__ = "supplier_products"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "supplier_id",
+            "supplier_product_code",
+            name="uq_supplier_products_supplier_code",
+        ),
+    )
+
+    supplier_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="ID nhà cung cấp"
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("products.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+        comment="ID sản phẩm Aladdin"
+    )
+
+    supplier_product_code: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Mã sản phẩm của supplier (iit_code)"
+    )
+
+    supplier_product_name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Tên sản phẩm của supplier (iit_name)"
+    )
+
+    supplier_unit: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Đơn vị tính của supplier (iit_uom)"
+    )
+
+    conversion_rate: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(12, 4),
+        nullable=True,
+        comment="1 supplier_unit = rate * đơn vị chuẩn; NULL: tra unit_conversions"
+    )
+
+    price: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(15, 2),
+        nullable=True,
+        comment="Giá mặc định"
+    )
+
+    min_order_quantity: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(12, 4),
+        nullable=True,
+        comment="Số lượng đặt hàng tối thiểu"
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        comment="Trạng thái hoạt động"
+    )
+
+    # Relationships
+    supplier: Mapped["Supplier"] = relationship(
+        "Supplier",
+        back_populates="supplier_products",
+    )
+
+    product: Mapped["Product"] = relationship(
+        "Product",
+        back_populates="supplier_products",
+        lazy="selectin"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<SupplierProduct(id={self.id}, supplier_id={self.supplier_id}, "
+            f"code='{self.supplier_product_code}', product_id={self.product_id})>"
+        )
+
+
+class UnitConversion(Base, IDMixin, TimestampMixin):
+    """Unit conversion model - Quy đổi đơn vị tính.
+
+    1 from_unit = factor * to_unit. Dòng có product_id áp dụng riêng cho
+    sản phẩm đó (VD: 1 thùng nước mắm = 12 chai), dòng không có product_id
+    là quy đổi chung (VD: 1 kg = 1000 g).
+
+    Attributes:
+        id: Primary key
+        product_id: Sản phẩm áp dụng (NULL: áp dụng chung)
+        from_unit: Đơn vị nguồn
+        to_unit: Đơn vị đích
+        factor: Hệ số quy đổi
+    """
+    __tablename__ = "unit_conversions"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id",
+            "from_unit",
+            "to_unit",
+            name="uq_unit_conversions_product_units",
+        ),
+        Index("ix_unit_conversions_units", "from_unit", "to_unit"),
+    )
+
+    product_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=True,
+        comment="Sản phẩm áp dụng (NULL: quy đổi chung)"
+    )
+
+    from_unit: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Đơn vị nguồn"
+    )
+
+    to_unit: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Đơn vị đích"
+    )
+
+    factor: Mapped[Decimal] = mapped_column(
+        Numeric(12, 4),
+        nullable=False,
+        comment="1 from_unit = factor * to_unit"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<UnitConversion(product_id={self.product_id}, "
+            f"1 {self.from_unit} = {self.factor} {self.to_unit})>"
+        )
@@ -11,8 +11,8 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base, AuditMixin, SoftDeleteMixin
 
 if TYPE_CHECKING:
+    from app.models.product import SupplierProduct
     from app.models.user import User
-    # from app.models.product import Product
     # from app.models.procurement_request import ProcurementRequest
 
 
@@ -52,7 +52,7 @@ class Supplier(Base, SoftDeleteMixin, AuditMixin):
     
     Relationships:
         users: List of users working for this supplier
-        products: List of products supplied by this supplier
+        supplier_products: Product mappings (mã, tên, đơn vị của supplier)
         procurement_requests: List of YCMSs for this supplier
     
     Business Rules:
@@ -160,11 +160,12 @@ class Supplier(Base, SoftDeleteMixin, AuditMixin):
         lazy="selectin"
     )
     
-    # products: Mapped[list["Product"]] = relationship(
-    #     "Product",
-    #     back_populates="supplier",
-    #     lazy="selectin"
-    # )
+    # Not eagerly loaded: a supplier can map thousands of products and
+    # lookups go through the in-memory catalog index instead.
+    supplier_products: Mapped[list["SupplierProduct"]] = relationship(
+        "SupplierProduct",
+        back_populates="supplier",
+    )
     
     # procurement_requests: Mapped[list["ProcurementRequest"]] = relationship(
     #     "ProcurementRequest",
@@ -0,0 +1,169 @@
+"""
+Purchasing analytics repositories.
+Data access layer cho các bảng tổng hợp chi phí mua hàng.
+"""
+
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analytics import DailySpendRollup, MonthlySupplierSpendRollup
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.repositories.base import BaseRepository
+
+
+class SpendRollupRepository(BaseRepository[DailySpendRollup]):
+    """Repository for spend rollup tables.
+
+    Writes are additive upserts so confirming a delivery note touches one
+    row per (day, supplier, restaurant, product) instead of recomputing
+    totals from detail lines.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(DailySpendRollup, db)
+
+    def _insert(self, model: Any) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
+    async def add_daily(self, rows: list[dict[str, Any]]) -> None:
+        """Add quantities and amounts to daily rollup rows.
+
+        Args:
+            rows: Dicts with spend_date, supplier_id, restaurant_id,
+                product_id, quantity, amount and line_count deltas
+        """
+        if not rows:
+            return
+        table = DailySpendRollup.__table__
+        stmt = self._insert(DailySpendRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["spend_date", "supplier_id", "restaurant_id", "product_id"],
+            set_={
+                "quantity": table.c.quantity + stmt.excluded.quantity,
+                "amount": table.c.amount + stmt.excluded.amount,
+                "line_count": table.c.line_count + stmt.excluded.line_count,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def add_monthly(self, row: dict[str, Any]) -> None:
+        """Add amounts to one monthly supplier rollup row.
+
+        Args:
+            row: Dict with month, supplier_id, restaurant_id, amount,
+                line_count and delivery_count deltas
+        """
+        table = MonthlySupplierSpendRollup.__table__
+        stmt = self._insert(MonthlySupplierSpendRollup).values(row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["month", "supplier_id", "restaurant_id"],
+            set_={
+                "amount": table.c.amount + stmt.excluded.amount,
+                "line_count": table.c.line_count + stmt.excluded.line_count,
+                "delivery_count": table.c.delivery_count + stmt.excluded.delivery_count,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def spend_by_supplier_by_month(
+        self,
+        month_from: date,
+        month_to: date,
+        supplier_id: Optional[int] = None,
+        restaurant_id: Optional[int] = None,
+    ) -> list[Any]:
+        """Sum spend per supplier per month from the monthly rollup.
+
+        Args:
+            month_from: First month (first day of month)
+            month_to: Last month (first day of month)
+            supplier_id: Optional supplier filter
+            restaurant_id: Optional restaurant filter
+
+        Returns:
+            List of rows (month, supplier_id, supplier_code, supplier_name,
+            amount, line_count, delivery_count)
+        """
+        rollup = MonthlySupplierSpendRollup
+        stmt = (
+            select(
+                rollup.month,
+                rollup.supplier_id,
+                Supplier.code.label("supplier_code"),
+                Supplier.name.label("supplier_name"),
+                func.sum(rollup.amount).label("amount"),
+                func.sum(rollup.line_count).label("line_count"),
+                func.sum(rollup.delivery_count).label("delivery_count"),
+            )
+            .join(Supplier, Supplier.id == rollup.supplier_id)
+            .where(rollup.month >= month_from, rollup.month <= month_to)
+            .group_by(rollup.month, rollup.supplier_id, Supplier.code, Supplier.name)
+            .order_by(rollup.month, func.sum(rollup.amount).desc())
+        )
+        if supplier_id is not None:
+            stmt = stmt.where(rollup.supplier_id == supplier_id)
+        if restaurant_id is not None:
+            stmt = stmt.where(rollup.restaurant_id == restaurant_id)
+        stmt = self._scoped(stmt, rollup.supplier_id)
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def top_products(
+        self,
+        restaurant_id: int,
+        date_from: date,
+        date_to: date,
+        limit: int = 10,
+    ) -> list[Any]:
+        """Rank products of a restaurant by spend from the daily rollup.
+
+        Args:
+            restaurant_id: Restaurant ID
+            date_from: First day (inclusive)
+            date_to: Last day (inclusive)
+            limit: Number of products to return
+
+        Returns:
+            List of rows (product_id, product_code, product_name,
+            product_unit, quantity, amount, line_count)
+        """
+        rollup = DailySpendRollup
+        amount = func.sum(rollup.amount).label("amount")
+        stmt = (
+            select(
+                rollup.product_id,
+                Product.code.label("product_code"),
+                Product.name.label("product_name"),
+                Product.unit.label("product_unit"),
+                func.sum(rollup.quantity).label("quantity"),
+                amount,
+                func.sum(rollup.line_count).label("line_count"),
+            )
+            .join(Product, Product.id == rollup.product_id)
+            .where(
+                rollup.restaurant_id == restaurant_id,
+                rollup.spend_date >= date_from,
+                rollup.spend_date <= date_to,
+            )
+            .group_by(rollup.product_id, Product.code, Product.name, Product.unit)
+            .order_by(amount.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(self._scoped(stmt))
+        return list(result.all())
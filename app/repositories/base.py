@@ -2,18 +2,31 @@
 
 This module provides a generic repository pattern implementation that can be
 inherited by specific repositories to get common CRUD functionality.
+
+The hottest lookups (`get`, `get_by_code`, `get_by_email`) run prebuilt
+statements with bind parameters (`_cached_statement`), so a call neither
+builds a new `select()` nor recomputes its cache key, and the identical SQL
+hits SQLAlchemy's compiled cache and asyncpg's prepared statement cache.
 """
 
-from typing import Any, Generic, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
 
-from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy import Select, bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.scope import get_supplier_scope
 from app.models.base import Base
 
 # Type variable for model class
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Bind parameter of the supplier scope in cached statements
+SCOPE_PARAM = "scope_supplier_id"
+
+# Prebuilt statements by (repository class, model, name, scoped)
+_statements: dict[tuple[Any, ...], Select] = {}
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository providing common CRUD operations.
@@ -21,6 +34,11 @@ class BaseRepository(Generic[ModelType]):
     This generic repository can be inherited by specific repositories
     to get basic CRUD operations for free.
     
+    Queries on models with a `supplier_id` column are automatically
+    restricted to the current supplier scope (see `app.core.scope`).
+    Repositories whose model identifies the supplier by another column
+    override `supplier_scope_column`.
+    
     Example:
         ```python
         class UserRepository(BaseRepository[User]):
@@ -39,6 +57,68 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
+    # Column compared with the supplier scope; None disables scoping
+    supplier_scope_column: Optional[str] = "supplier_id"
+    
+    def _scoped(self, query: Any, column: Any = None) -> Any:
+        """Restrict a statement to the current supplier scope.
+        
+        Args:
+            query: Select, update or delete statement.
+            column: Supplier column to filter on; defaults to the model's
+                `supplier_scope_column`.
+            
+        Returns:
+            Statement with the scope condition, or unchanged if the request
+            is unrestricted or the model has no supplier column.
+        """
+        supplier_id = get_supplier_scope()
+        if supplier_id is None:
+            return query
+        column = column if column is not None else self._scope_column()
+        if column is None:
+            return query
+        return query.where(column == supplier_id)
+    
+    def _scope_column(self) -> Any:
+        """Get the model's supplier scope column, or None if it has none."""
+        if self.supplier_scope_column is None:
+            return None
+        return getattr(self.model, self.supplier_scope_column, None)
+    
+    def _cached_statement(
+        self,
+        name: str,
+        build: Callable[[], Select],
+        *,
+        scoped: bool = True,
+    ) -> tuple[Select, dict[str, Any]]:
+        """Get a prebuilt statement and the parameters of the supplier scope.
+        
+        `build` runs once per repository class and scope variant; it must
+        use `bindparam()` for every value, which the caller passes on
+        execution. Reusing the statement object skips building it and
+        computing its cache key on every call.
+        
+        Args:
+            name: Name of the statement within the repository.
+            build: Function building the statement.
+            scoped: Restrict the statement to the current supplier scope.
+            
+        Returns:
+            Tuple of (statement, scope parameters to execute it with).
+        """
+        supplier_id = get_supplier_scope() if scoped else None
+        column = self._scope_column() if supplier_id is not None else None
+        key = (type(self), self.model, name, column is not None)
+        statement = _statements.get(key)
+        if statement is None:
+            statement = build()
+            if column is not None:
+                statement = statement.where(column == bindparam(SCOPE_PARAM))
+            _statements[key] = statement
+        return statement, {SCOPE_PARAM: supplier_id} if column is not None else {}
+    
     async def get(self, id: int) -> ModelType | None:
         """Get a single record by ID.
         
@@ -48,11 +128,82 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Model instance or None if not found.
         """
-        result = await self.db.execute(
-            select(self.model).where(self.model.id == id)
+        statement, params = self._cached_statement(
+            "get", lambda: select(self.model).where(self.model.id == bindparam("id"))
         )
+        result = await self.db.execute(statement, {**params, "id": id})
         return result.scalar_one_or_none()
     
+    async def get_many(self, ids: Sequence[int]) -> tuple[list[ModelType], list[int]]:
+        """Get many records by ID with one IN query.
+        
+        Args:
+            ids: Record IDs; duplicates are ignored.
+            
+        Returns:
+            Tuple of (records in the order of `ids`, IDs not found).
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return [], []
+        result = await self.db.execute(
+            self._scoped(select(self.model).where(self.model.id.in_(unique_ids)))
+        )
+        by_id = {obj.id: obj for obj in result.scalars().all()}
+        found = [by_id[id] for id in unique_ids if id in by_id]
+        missing = [id for id in unique_ids if id not in by_id]
+        return found, missing
+    
+    async def get_fields(self, id: int, fields: Sequence[str]) -> Optional[dict[str, Any]]:
+        """Get selected columns of a single record by ID.
+        
+        Only the named columns are selected, so wide Text columns that the
+        caller does not need are never read or transferred.
+        
+        Args:
+            id: Record ID.
+            fields: Column names.
+            
+        Returns:
+            Dict of column values, or None if not found.
+        """
+        result = await self.db.execute(
+            self._scoped(
+                select(*(getattr(self.model, f) for f in fields)).where(self.model.id == id)
+            )
+        )
+        row = result.one_or_none()
+        return dict(row._mapping) if row is not None else None
+    
+    async def fetch_fields(
+        self,
+        query: Select,
+        fields: Sequence[str],
+        *,
+        order_by: Any = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Run a filtered query selecting only some columns.
+        
+        Args:
+            query: Select over the model, with filters but without paging.
+            fields: Column names.
+            order_by: Column to order by (defaults to ID).
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+            
+        Returns:
+            List of dicts of column values.
+        """
+        result = await self.db.execute(
+            query.with_only_columns(*(getattr(self.model, f) for f in fields))
+            .order_by(order_by if order_by is not None else self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in result]
+    
     async def get_multi(
         self,
         *,
@@ -71,7 +222,7 @@ class BaseRepository(Generic[ModelType]):
             Tuple of (list of records, total count).
         """
         # Build base query
-        query = select(self.model)
+        query = self._scoped(select(self.model))
         
         # Add ordering
         if order_by is not None:
@@ -80,7 +231,7 @@ class BaseRepository(Generic[ModelType]):
             query = query.order_by(self.model.id)
         
         # Get total count
-        count_query = select(func.count()).select_from(self.model)
+        count_query = self._scoped(select(func.count()).select_from(self.model))
         total = await self.db.scalar(count_query) or 0
         
         # Add pagination
@@ -145,10 +296,57 @@ class BaseRepository(Generic[ModelType]):
             True if deleted, False if not found.
         """
         result = await self.db.execute(
-            delete(self.model).where(self.model.id == id)
+            self._scoped(delete(self.model).where(self.model.id == id))
         )
         return result.rowcount > 0
     
+    async def get_version(self, id: int) -> Optional[datetime]:
+        """Get the updated_at of a record without loading it.
+        
+        Args:
+            id: Record ID.
+            
+        Returns:
+            Last update timestamp, or None if not found.
+        """
+        return await self.db.scalar(
+            self._scoped(select(self.model.updated_at).where(self.model.id == id))
+        )
+    
+    async def get_query_version(self, query: Select) -> tuple[Optional[datetime], int]:
+        """Get (max(updated_at), count) of the rows a query selects.
+        
+        Any insert, update or delete among those rows changes the pair, so
+        it identifies a version of a list result.
+        
+        Args:
+            query: Select over the model, with filters but without paging.
+            
+        Returns:
+            Tuple of (latest update timestamp or None, row count).
+        """
+        rows = query.subquery()
+        result = await self.db.execute(
+            select(func.max(rows.c.updated_at), func.count()).select_from(rows)
+        )
+        latest, count = result.one()
+        return latest, count
+    
+    async def get_table_version(self) -> tuple[Optional[datetime], int]:
+        """Get (max(updated_at), count) of the whole table.
+        
+        Not scoped: process-wide snapshots compare it with the version they
+        loaded to notice writes made by other workers.
+        
+        Returns:
+            Tuple of (latest update timestamp or None, row count).
+        """
+        result = await self.db.execute(
+            select(func.max(self.model.updated_at), func.count()).select_from(self.model)
+        )
+        latest, count = result.one()
+        return latest, count
+    
     async def exists(self, id: int) -> bool:
         """Check if a record exists.
         
@@ -159,7 +357,7 @@ class BaseRepository(Generic[ModelType]):
             True if exists, False otherwise.
         """
         result = await self.db.execute(
-            select(func.count()).where(self.model.id == id)
+            self._scoped(select(func.count()).where(self.model.id == id))
         )
         count = result.scalar_one()
         return count > 0
@@ -173,7 +371,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of records matching filters.
         """
-        query = select(func.count()).select_from(self.model)
+        query = self._scoped(select(func.count()).select_from(self.model))
         
         # Apply filters
         for key, value in filters.items():
@@ -217,7 +415,7 @@ class BaseRepository(Generic[ModelType]):
             return 0
         
         result = await self.db.execute(
-            update(self.model),
+            self._scoped(update(self.model)),
             updates,
         )
         return result.rowcount
@@ -235,7 +433,7 @@ class BaseRepository(Generic[ModelType]):
             return 0
         
         result = await self.db.execute(
-            delete(self.model).where(self.model.id.in_(ids))
+            self._scoped(delete(self.model).where(self.model.id.in_(ids)))
         )
         return result.rowcount
     
@@ -248,7 +446,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             SQLAlchemy Select query.
         """
-        query = select(self.model)
+        query = self._scoped(select(self.model))
         
         for key, value in filters.items():
             if hasattr(self.model, key):
@@ -0,0 +1,185 @@
+"""
+Supplier price list repositories.
+Data access layer cho SupplierPriceList và SupplierPriceListItem.
+"""
+
+from datetime import date
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.price_list import SupplierPriceList, SupplierPriceListItem
+from app.repositories.base import BaseRepository
+
+
+class SupplierPriceListRepository(BaseRepository[SupplierPriceList]):
+    """Repository for SupplierPriceList model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(SupplierPriceList, db)
+
+    async def get_by_code(self, supplier_id: int, code: str) -> Optional[SupplierPriceList]:
+        """Get price list by supplier and code.
+
+        Args:
+            supplier_id: Supplier ID
+            code: Price list code
+
+        Returns:
+            SupplierPriceList if found, None otherwise
+        """
+        statement, params = self._cached_statement(
+            "get_by_code",
+            lambda: select(SupplierPriceList).where(
+                SupplierPriceList.supplier_id == bindparam("supplier_id"),
+                SupplierPriceList.code == bindparam("code"),
+            ),
+        )
+        result = await self.db.execute(
+            statement, {**params, "supplier_id": supplier_id, "code": code}
+        )
+        return result.scalar_one_or_none()
+
+    async def list_by_supplier(
+        self,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[SupplierPriceList], int]:
+        """List price lists of a supplier, newest first.
+
+        Args:
+            supplier_id: Supplier ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of price lists, total count)
+        """
+        total = await self.db.scalar(
+            self._scoped(select(func.count()).select_from(SupplierPriceList))
+            .where(SupplierPriceList.supplier_id == supplier_id)
+        ) or 0
+
+        result = await self.db.execute(
+            self._scoped(select(SupplierPriceList))
+            .where(SupplierPriceList.supplier_id == supplier_id)
+            .order_by(SupplierPriceList.valid_from.desc(), SupplierPriceList.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all()), total
+
+
+class SupplierPriceListItemRepository(BaseRepository[SupplierPriceListItem]):
+    """Repository for SupplierPriceListItem model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(SupplierPriceListItem, db)
+
+    async def sync_validity(
+        self,
+        price_list_id: int,
+        values: dict[str, Any],
+    ) -> None:
+        """Copy validity fields of a price list onto its items.
+
+        Args:
+            price_list_id: Price list ID
+            values: Subset of valid_from, valid_to and is_active
+        """
+        await self.db.execute(
+            update(SupplierPriceListItem)
+            .where(SupplierPriceListItem.price_list_id == price_list_id)
+            .values(**values)
+        )
+
+    async def resolve_prices(
+        self,
+        supplier_product_ids: Iterable[int],
+        on_date: date,
+    ) -> list[Any]:
+        """Resolve the price valid on a date for many supplier products.
+
+        One query over the (supplier_product_id, valid_from) index; when
+        several price lists are valid, the one that started last wins.
+
+        Args:
+            supplier_product_ids: Supplier product IDs (e.g. of one delivery note)
+            on_date: Delivery date
+
+        Returns:
+            List of rows (supplier_product_id, price_list_id, price,
+            valid_from, valid_to), at most one per supplier product
+        """
+        ids = list(set(supplier_product_ids))
+        if not ids:
+            return []
+
+        item = SupplierPriceListItem
+        ranked = (
+            select(
+                item.supplier_product_id,
+                item.price_list_id,
+                item.price,
+                item.valid_from,
+                item.valid_to,
+                func.row_number().over(
+                    partition_by=item.supplier_product_id,
+                    order_by=(item.valid_from.desc(), item.price_list_id.desc()),
+                ).label("rank"),
+            )
+            .where(
+                item.supplier_product_id.in_(ids),
+                item.valid_from <= on_date,
+                or_(item.valid_to.is_(None), item.valid_to >= on_date),
+                item.is_active == True,
+            )
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                ranked.c.supplier_product_id,
+                ranked.c.price_list_id,
+                ranked.c.price,
+                ranked.c.valid_from,
+                ranked.c.valid_to,
+            ).where(ranked.c.rank == 1)
+        )
+        return list(result.all())
+
+    async def get_active_rows(self, since: date) -> list[Any]:
+        """Load items of price lists still valid on or after a date.
+
+        Args:
+            since: Items whose validity ended before this date are skipped
+
+        Returns:
+            List of rows (supplier_product_id, price_list_id, price,
+            valid_from, valid_to)
+        """
+        item = SupplierPriceListItem
+        result = await self.db.execute(
+            select(
+                item.supplier_product_id,
+                item.price_list_id,
+                item.price,
+                item.valid_from,
+                item.valid_to,
+            ).where(
+                item.is_active == True,
+                or_(item.valid_to.is_(None), item.valid_to >= since),
+            )
+        )
+        return list(result.all())
@@ -0,0 +1,317 @@
+"""
+Product catalog repositories.
+Data access layer cho Product, ProductCategory, SupplierProduct và UnitConversion.
+"""
+
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product, ProductCategory, SupplierProduct, UnitConversion
+from app.models.supplier import Supplier
+from app.repositories.base import BaseRepository
+
+
+class ProductCategoryRepository(BaseRepository[ProductCategory]):
+    """Repository for ProductCategory model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(ProductCategory, db)
+
+    async def get_by_code(self, code: str) -> Optional[ProductCategory]:
+        """Get category by code.
+
+        Args:
+            code: Category code
+
+        Returns:
+            ProductCategory if found, None otherwise
+        """
+        statement, params = self._cached_statement(
+            "get_by_code",
+            lambda: select(ProductCategory).where(ProductCategory.code == bindparam("code")),
+        )
+        result = await self.db.execute(statement, {**params, "code": code})
+        return result.scalar_one_or_none()
+
+
+class ProductRepository(BaseRepository[Product]):
+    """Repository for Product model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(Product, db)
+
+    async def get_by_code(self, code: str) -> Optional[Product]:
+        """Get product by Aladdin product code.
+
+        Args:
+            code: Product code
+
+        Returns:
+            Product if found, None otherwise
+        """
+        statement, params = self._cached_statement(
+            "get_by_code",
+            lambda: select(Product).where(Product.code == bindparam("code")),
+        )
+        result = await self.db.execute(statement, {**params, "code": code})
+        return result.scalar_one_or_none()
+
+    def list_query(
+        self,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> Select:
+        """Build the filtered (unpaged) query behind `list_products`.
+
+        Args:
+            category_id: Optional category filter
+            is_active: Optional active status filter
+
+        Returns:
+            Select over matching products
+        """
+        filters: dict[str, Any] = {}
+        if category_id is not None:
+            filters["category_id"] = category_id
+        if is_active is not None:
+            filters["is_active"] = is_active
+        return self._build_query(**filters)
+
+    async def list_products(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> tuple[list[Product], int]:
+        """List products with optional filters.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category_id: Optional category filter
+            is_active: Optional active status filter
+
+        Returns:
+            Tuple of (list of products, total count)
+        """
+        query = self.list_query(category_id, is_active)
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        ) or 0
+
+        result = await self.db.execute(
+            query.order_by(Product.code).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all()), total
+
+    async def list_product_fields(
+        self,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List selected columns of products (sparse fieldsets).
+
+        Args:
+            fields: Column names to select
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category_id: Optional category filter
+            is_active: Optional active status filter
+
+        Returns:
+            Tuple of (list of column dicts, total count)
+        """
+        query = self.list_query(category_id, is_active)
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        ) or 0
+        rows = await self.fetch_fields(
+            query, fields, order_by=Product.code, skip=skip, limit=limit
+        )
+        return rows, total
+
+    async def get_match_rows(self) -> list[Any]:
+        """Load active products as flat rows for the fuzzy match index.
+
+        Returns:
+            List of rows (id, code, name, unit)
+        """
+        result = await self.db.execute(
+            select(Product.id, Product.code, Product.name, Product.unit)
+            .where(Product.is_active == True)
+        )
+        return list(result.all())
+
+
+class SupplierProductRepository(BaseRepository[SupplierProduct]):
+    """Repository for SupplierProduct model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(SupplierProduct, db)
+
+    async def get_by_supplier_code(
+        self,
+        supplier_id: int,
+        supplier_product_code: str,
+    ) -> Optional[SupplierProduct]:
+        """Get mapping by supplier and supplier's own product code.
+
+        Args:
+            supplier_id: Supplier ID
+            supplier_product_code: Supplier product code (iit_code)
+
+        Returns:
+            SupplierProduct if found, None otherwise
+        """
+        result = await self.db.execute(
+            self._scoped(select(SupplierProduct).where(
+                SupplierProduct.supplier_id == supplier_id,
+                SupplierProduct.supplier_product_code == supplier_product_code,
+            ))
+        )
+        return result.scalar_one_or_none()
+
+    async def list_by_supplier(
+        self,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[SupplierProduct]:
+        """List product mappings of a supplier.
+
+        Args:
+            supplier_id: Supplier ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of supplier products
+        """
+        result = await self.db.execute(
+            self._scoped(select(SupplierProduct))
+            .where(SupplierProduct.supplier_id == supplier_id)
+            .order_by(SupplierProduct.supplier_product_code)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def filter_ids_for_supplier(
+        self,
+        supplier_id: int,
+        supplier_product_ids: list[int],
+    ) -> set[int]:
+        """Return the subset of IDs that belong to a supplier.
+
+        Args:
+            supplier_id: Supplier ID
+            supplier_product_ids: Candidate supplier product IDs
+
+        Returns:
+            IDs mapped for this supplier
+        """
+        result = await self.db.execute(
+            self._scoped(select(SupplierProduct.id).where(
+                SupplierProduct.supplier_id == supplier_id,
+                SupplierProduct.id.in_(supplier_product_ids),
+            ))
+        )
+        return set(result.scalars().all())
+
+    async def get_active_mapping_rows(self) -> list[Any]:
+        """Load every active mapping as flat rows for the catalog index.
+
+        One query joins supplier_products with suppliers and products so
+        the index can be rebuilt without per-row lookups. Not scoped: the
+        index is shared by all requests.
+
+        Returns:
+            List of rows with supplier, mapping and product columns
+        """
+        stmt = (
+            select(
+                SupplierProduct.id.label("supplier_product_id"),
+                SupplierProduct.supplier_id,
+                Supplier.code.label("supplier_code"),
+                SupplierProduct.supplier_product_code,
+                SupplierProduct.supplier_unit,
+                SupplierProduct.conversion_rate,
+                Product.id.label("product_id"),
+                Product.code.label("product_code"),
+                Product.name.label("product_name"),
+                Product.unit.label("product_unit"),
+            )
+            .join(Supplier, Supplier.id == SupplierProduct.supplier_id)
+            .join(Product, Product.id == SupplierProduct.product_id)
+            .where(
+                SupplierProduct.is_active == True,
+                Product.is_active == True,
+                Supplier.deleted_at.is_(None),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def get_alias_rows(self) -> list[Any]:
+        """Load names of active mappings as aliases for the fuzzy match index.
+
+        Not scoped: the index is shared by all requests.
+
+        Returns:
+            List of rows (product_id, supplier_product_name)
+        """
+        result = await self.db.execute(
+            select(SupplierProduct.product_id, SupplierProduct.supplier_product_name)
+            .where(SupplierProduct.is_active == True)
+            .distinct()
+        )
+        return list(result.all())
+
+
+class UnitConversionRepository(BaseRepository[UnitConversion]):
+    """Repository for UnitConversion model."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            db: Database session.
+        """
+        super().__init__(UnitConversion, db)
+
+    async def get_all_rows(self) -> list[Any]:
+        """Load all conversion rules as flat rows for the catalog index.
+
+        Returns:
+            List of rows (product_id, from_unit, to_unit, factor)
+        """
+        result = await self.db.execute(
+            select(
+                UnitConversion.product_id,
+                UnitConversion.from_unit,
+                UnitConversion.to_unit,
+                UnitConversion.factor,
+            )
+        )
+        return list(result.all())
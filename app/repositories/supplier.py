@@ -3,9 +3,9 @@ Supplier repository.
 Data access layer cho Supplier operations.
 """
 
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.supplier import Supplier
@@ -17,8 +17,14 @@ class SupplierRepository(BaseRepository[Supplier]):
     
     Provides data access methods specific to Supplier operations.
     Inherits CRUD operations from BaseRepository.
+    
+    Supplier users are scoped on the primary key: they only see their
+    own supplier. Uniqueness checks (`exists_by_*`) are not scoped since
+    they guard global constraints.
     """
     
+    supplier_scope_column = "id"
+    
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session.
         
@@ -36,11 +42,14 @@ class SupplierRepository(BaseRepository[Supplier]):
         Returns:
             Supplier if found, None otherwise
         """
-        stmt = select(Supplier).where(
-            Supplier.code == code,
-            Supplier.is_deleted == False
+        stmt, params = self._cached_statement(
+            "get_by_code",
+            lambda: select(Supplier).where(
+                Supplier.code == bindparam("code"),
+                Supplier.deleted_at.is_(None)
+            ),
         )
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt, {**params, "code": code})
         return result.scalar_one_or_none()
     
     async def get_by_email(self, email: str) -> Optional[Supplier]:
@@ -52,11 +61,15 @@ class SupplierRepository(BaseRepository[Supplier]):
         Returns:
             Supplier if found, None otherwise
         """
-        stmt = select(Supplier).where(
-            Supplier.email == email.lower(),
-            Supplier.is_deleted == False
+        stmt, params = self._cached_statement(
+            "get_by_email",
+            lambda: select(Supplier).where(
+                Supplier.email == bindparam("email"),
+                Supplier.deleted_at.is_(None)
+            ),
+            scoped=False,
         )
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt, {**params, "email": email.lower()})
         return result.scalar_one_or_none()
     
     async def get_by_tax_code(self, tax_code: str) -> Optional[Supplier]:
@@ -70,9 +83,9 @@ class SupplierRepository(BaseRepository[Supplier]):
         """
         stmt = select(Supplier).where(
             Supplier.tax_code == tax_code,
-            Supplier.is_deleted == False
+            Supplier.deleted_at.is_(None)
         )
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
     async def get_active(self, skip: int = 0, limit: int = 100) -> list[Supplier]:
@@ -85,21 +98,88 @@ class SupplierRepository(BaseRepository[Supplier]):
         Returns:
             List of active suppliers
         """
-        stmt = select(Supplier).where(
+        stmt = self._scoped(select(Supplier).where(
             Supplier.is_active == True,
-            Supplier.is_deleted == False
-        ).offset(skip).limit(limit)
+            Supplier.deleted_at.is_(None)
+        )).offset(skip).limit(limit)
         
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def list_query(self, is_active: Optional[bool] = None) -> Select:
+        """Build the filtered (unpaged) query behind `list_suppliers`.
+        
+        Args:
+            is_active: Optional active status filter
+            
+        Returns:
+            Select over non-deleted suppliers visible to the current scope
+        """
+        stmt = self._scoped(select(Supplier).where(Supplier.deleted_at.is_(None)))
+        if is_active is not None:
+            stmt = stmt.where(Supplier.is_active == is_active)
+        return stmt
+    
+    async def list_suppliers(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None
+    ) -> tuple[list[Supplier], int]:
+        """List non-deleted suppliers visible to the current scope.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            is_active: Optional active status filter
+            
+        Returns:
+            Tuple of (list of suppliers, total count)
+        """
+        stmt = self.list_query(is_active)
+        total = await self.db.scalar(
+            select(func.count()).select_from(stmt.subquery())
+        ) or 0
+        
+        result = await self.db.execute(
+            stmt.order_by(Supplier.code).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all()), total
+    
+    async def list_supplier_fields(
+        self,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List selected columns of suppliers (sparse fieldsets).
+        
+        Args:
+            fields: Column names to select
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            is_active: Optional active status filter
+            
+        Returns:
+            Tuple of (list of column dicts, total count)
+        """
+        stmt = self.list_query(is_active)
+        total = await self.db.scalar(
+            select(func.count()).select_from(stmt.subquery())
+        ) or 0
+        rows = await self.fetch_fields(
+            stmt, fields, order_by=Supplier.code, skip=skip, limit=limit
+        )
+        return rows, total
+    
     async def search_by_name(
         self,
         search_term: str,
         skip: int = 0,
         limit: int = 100
     ) -> list[Supplier]:
-        """Search suppliers by name.
+        """Search suppliers by name or code.
         
         Args:
             search_term: Search term for name
@@ -109,12 +189,13 @@ class SupplierRepository(BaseRepository[Supplier]):
         Returns:
             List of matching suppliers
         """
-        stmt = select(Supplier).where(
-            Supplier.name.ilike(f"%{search_term}%"),
-            Supplier.is_deleted == False
-        ).offset(skip).limit(limit)
+        pattern = f"%{search_term}%"
+        stmt = self._scoped(select(Supplier).where(
+            or_(Supplier.name.ilike(pattern), Supplier.code.ilike(pattern)),
+            Supplier.deleted_at.is_(None)
+        )).offset(skip).limit(limit)
         
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
     async def exists_by_code(self, code: str, exclude_id: Optional[int] = None) -> bool:
@@ -129,13 +210,13 @@ class SupplierRepository(BaseRepository[Supplier]):
         """
         stmt = select(Supplier).where(
             Supplier.code == code,
-            Supplier.is_deleted == False
+            Supplier.deleted_at.is_(None)
         )
         
         if exclude_id is not None:
             stmt = stmt.where(Supplier.id != exclude_id)
         
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
     
     async def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
@@ -150,13 +231,13 @@ class SupplierRepository(BaseRepository[Supplier]):
         """
         stmt = select(Supplier).where(
             Supplier.email == email.lower(),
-            Supplier.is_deleted == False
+            Supplier.deleted_at.is_(None)
         )
         
         if exclude_id is not None:
             stmt = stmt.where(Supplier.id != exclude_id)
         
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
     
     async def exists_by_tax_code(
@@ -178,11 +259,11 @@ class SupplierRepository(BaseRepository[Supplier]):
         
         stmt = select(Supplier).where(
             Supplier.tax_code == tax_code,
-            Supplier.is_deleted == False
+            Supplier.deleted_at.is_(None)
         )
         
         if exclude_id is not None:
             stmt = stmt.where(Supplier.id != exclude_id)
         
-        result = await self.session.execute(stmt)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
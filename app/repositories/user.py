@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from fastapi_users.db import SQLAlchemyUserDatabase
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -34,9 +34,12 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found.
         """
-        result = await self.db.execute(
-            select(User).where(User.email == email)
+        statement, params = self._cached_statement(
+            "get_by_email",
+            lambda: select(User).where(User.email == bindparam("email")),
+            scoped=False,
         )
+        result = await self.db.execute(statement, {**params, "email": email})
         return result.scalar_one_or_none()
     
     async def get_by_oauth(
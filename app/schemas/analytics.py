@@ -0,0 +1,53 @@
+"""
+Purchasing analytics schemas.
+Pydantic schemas cho báo cáo chi phí mua hàng.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class SpendDeliveryLine(BaseSchema):
+    """Confirmed delivery line, already mapped to a canonical product."""
+
+    product_id: int = Field(..., description="ID sản phẩm Aladdin")
+    quantity: Decimal = Field(..., description="Số lượng theo đơn vị chuẩn")
+    amount: Decimal = Field(..., description="Thành tiền")
+
+
+class SpendDeliveryRecord(BaseSchema):
+    """Confirmed delivery note to add to (or remove from) the rollups."""
+
+    supplier_id: int = Field(..., description="ID nhà cung cấp")
+    restaurant_id: int = Field(..., description="ID nhà hàng nhận hàng")
+    delivery_date: date = Field(..., description="Ngày giao hàng")
+    lines: list[SpendDeliveryLine] = Field(..., min_length=1, max_length=1000)
+    reverse: bool = Field(False, description="Trừ phiếu khỏi tổng hợp (hủy xác nhận)")
+
+
+class SupplierMonthlySpend(BaseSchema):
+    """Spend of one supplier in one month."""
+
+    month: date = Field(..., description="Ngày đầu tháng")
+    supplier_id: int
+    supplier_code: str
+    supplier_name: str
+    amount: Decimal = Field(..., description="Tổng thành tiền")
+    line_count: int
+    delivery_count: int
+
+
+class ProductSpend(BaseSchema):
+    """Spend on one product."""
+
+    product_id: int
+    product_code: str
+    product_name: str
+    product_unit: str
+    quantity: Decimal = Field(..., description="Tổng số lượng (đơn vị chuẩn)")
+    amount: Decimal = Field(..., description="Tổng thành tiền")
+    line_count: int
@@ -1,8 +1,10 @@
 """Common schemas used across the application."""
 
-from typing import Any, Generic, TypeVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Generic, Literal, TypeVar
 
-from pydantic import Field
+from pydantic import BaseModel, Field, create_model
 
 from app.schemas.base import BaseSchema
 
@@ -20,6 +22,55 @@ class HealthCheck(BaseSchema):
     cache: str | None = Field(None, description="Cache status")
 
 
+class DependencyStatus(BaseSchema):
+    """Result of probing one dependency."""
+    
+    status: Literal["ok", "error", "timeout"] = Field(..., description="Probe outcome")
+    latency_ms: float = Field(..., description="Probe duration in milliseconds")
+    detail: str | None = Field(None, description="Error message when the probe failed")
+
+
+class PoolStatus(BaseSchema):
+    """Connection pool usage of this worker."""
+    
+    size: int = Field(..., description="Configured pool size")
+    checked_out: int = Field(..., description="Connections in use")
+    capacity: int = Field(..., description="Pool size plus max overflow")
+    saturation: float = Field(..., description="checked_out / capacity")
+    checkouts: int | None = Field(None, description="Checkouts since startup")
+    avg_wait_ms: float | None = Field(None, description="Average checkout wait")
+    max_wait_ms: float | None = Field(None, description="Longest checkout wait")
+    resizes: int | None = Field(None, description="Adaptive pool size changes")
+
+
+class StatementCacheStatus(BaseSchema):
+    """Compiled SQL and prepared statement cache usage of this worker."""
+    
+    compiled_entries: int = Field(..., description="Statements in the compiled SQL cache")
+    compiled_capacity: int = Field(..., description="DATABASE_QUERY_CACHE_SIZE")
+    compiled_hits: int = Field(..., description="Statements executed with cached SQL")
+    compiled_misses: int = Field(..., description="Statements compiled and cached")
+    compiled_hit_rate: float | None = Field(None, description="Compiled cache hit rate")
+    prepared_hits: int = Field(..., description="Statements reusing a prepared statement")
+    prepared_misses: int = Field(..., description="Statements prepared on the server")
+    prepared_hit_rate: float | None = Field(
+        None, description="Prepared statement cache hit rate (asyncpg only)"
+    )
+
+
+class ReadinessCheck(BaseSchema):
+    """Readiness probe response schema."""
+    
+    status: Literal["ready", "not_ready"] = Field(..., description="Whether to route traffic here")
+    checked_at: datetime = Field(..., description="When the dependencies were probed")
+    database: DependencyStatus = Field(..., description="Database probe")
+    cache: DependencyStatus | None = Field(None, description="Shared cache probe, if configured")
+    pool: PoolStatus | None = Field(None, description="Pool usage (None without pooling)")
+    statement_cache: StatementCacheStatus | None = Field(
+        None, description="Statement cache usage (None when the database is not initialized)"
+    )
+
+
 class Message(BaseSchema):
     """Simple message response schema."""
     
@@ -84,3 +135,40 @@ class PaginatedResponse(BaseSchema, Generic[T]):
             bool: True if there are more items, False otherwise
         """
         return self.skip + self.limit < self.total
+
+
+
+class BatchResponse(BaseSchema, Generic[T]):
+    """Response of a batch read by IDs (`?ids=1,2,3`).
+    
+    Attributes:
+        items: Found items, in the order the IDs were requested
+        missing: Requested IDs that do not exist or are not visible
+    """
+    
+    items: list[T] = Field(..., description="Found items in request order")
+    missing: list[int] = Field(default_factory=list, description="IDs not found")
+
+
+@lru_cache(maxsize=256)
+def sparse_model(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Build a response schema holding a subset of another schema's fields.
+    
+    Used for sparse fieldsets (`?fields=id,code,name`): the subset keeps the
+    types and descriptions of the full schema, so values serialize the same.
+    
+    Args:
+        schema: Full response schema
+        fields: Field names to keep, in output order
+        
+    Returns:
+        Schema class (cached per schema and field tuple)
+    """
+    return create_model(
+        f"{schema.__name__}Sparse",
+        __base__=BaseSchema,
+        **{
+            name: (schema.model_fields[name].annotation, schema.model_fields[name])
+            for name in fields
+        },
+    )
@@ -0,0 +1,124 @@
+"""
+Supplier price list schemas.
+Pydantic schemas cho bảng giá nhà cung cấp và kiểm tra giá phiếu giao hàng.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import Field, field_validator, model_validator
+
+from app.schemas.base import BaseSchema
+
+
+class SupplierPriceListItemCreate(BaseSchema):
+    """Schema for one price in a new price list."""
+
+    supplier_product_id: int = Field(..., description="ID sản phẩm của supplier")
+    price: Decimal = Field(..., ge=0, description="Đơn giá theo đơn vị tính của supplier")
+
+
+class SupplierPriceListItemRead(SupplierPriceListItemCreate):
+    """Schema for reading price list item."""
+
+    id: int = Field(..., description="Price list item ID")
+
+
+class SupplierPriceListCreate(BaseSchema):
+    """Schema for creating price list."""
+
+    supplier_id: int = Field(..., description="ID nhà cung cấp")
+    code: str = Field(..., min_length=1, max_length=50, description="Mã bảng giá")
+    name: str = Field(..., min_length=1, max_length=200, description="Tên bảng giá")
+    valid_from: date = Field(..., description="Ngày bắt đầu hiệu lực")
+    valid_to: Optional[date] = Field(None, description="Ngày hết hiệu lực")
+    is_active: bool = Field(default=True, description="Trạng thái hoạt động")
+    note: Optional[str] = Field(None, description="Ghi chú")
+    items: list[SupplierPriceListItemCreate] = Field(
+        ..., min_length=1, max_length=10000, description="Danh sách giá"
+    )
+
+    @field_validator("code")
+    @classmethod
+    def validate_code(cls, v: str) -> str:
+        """Normalize price list code to uppercase."""
+        return v.strip().upper()
+
+    @model_validator(mode="after")
+    def validate_period(self) -> "SupplierPriceListCreate":
+        """Ensure valid_to is not before valid_from and items are unique."""
+        if self.valid_to is not None and self.valid_to < self.valid_from:
+            raise ValueError("valid_to must not be before valid_from")
+        ids = [item.supplier_product_id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each supplier product may appear only once per price list")
+        return self
+
+
+class SupplierPriceListUpdate(BaseSchema):
+    """Schema for updating price list. All fields are optional."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=200, description="Tên bảng giá")
+    valid_to: Optional[date] = Field(None, description="Ngày hết hiệu lực")
+    is_active: Optional[bool] = Field(None, description="Trạng thái hoạt động")
+    note: Optional[str] = Field(None, description="Ghi chú")
+
+
+class SupplierPriceListRead(BaseSchema):
+    """Schema for reading price list."""
+
+    id: int = Field(..., description="Price list ID")
+    supplier_id: int = Field(..., description="ID nhà cung cấp")
+    code: str = Field(..., description="Mã bảng giá")
+    name: str = Field(..., description="Tên bảng giá")
+    valid_from: date = Field(..., description="Ngày bắt đầu hiệu lực")
+    valid_to: Optional[date] = Field(None, description="Ngày hết hiệu lực")
+    is_active: bool = Field(..., description="Trạng thái hoạt động")
+    note: Optional[str] = Field(None, description="Ghi chú")
+    items: list[SupplierPriceListItemRead] = Field(default_factory=list)
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
+class DeliveryPriceLine(BaseSchema):
+    """Delivery note line to validate against agreed prices."""
+
+    iit_code: str = Field(..., min_length=1, description="Mã sản phẩm của supplier")
+    quantity: Decimal = Field(..., description="Số lượng theo đơn vị của supplier")
+    price: Decimal = Field(..., description="Đơn giá trên phiếu")
+    money: Optional[Decimal] = Field(None, description="Thành tiền trên phiếu")
+
+
+class DeliveryPriceValidationRequest(BaseSchema):
+    """Delivery note to validate."""
+
+    supplier_code: str = Field(..., min_length=1, description="Mã nhà cung cấp")
+    delivery_date: date = Field(..., description="Ngày giao hàng")
+    lines: list[DeliveryPriceLine] = Field(..., min_length=1, max_length=1000)
+    tolerance: Decimal = Field(
+        Decimal("0"), ge=0, description="Chênh lệch cho phép trên đơn giá/thành tiền"
+    )
+
+
+PriceCheckStatus = Literal["ok", "price_mismatch", "money_mismatch", "no_price", "unmapped"]
+
+
+class DeliveryPriceLineResult(BaseSchema):
+    """Validation result of one delivery line."""
+
+    iit_code: str
+    status: PriceCheckStatus
+    supplier_product_id: Optional[int] = None
+    price_list_id: Optional[int] = None
+    agreed_price: Optional[Decimal] = Field(None, description="Giá thỏa thuận")
+    price: Decimal = Field(..., description="Đơn giá trên phiếu")
+    price_difference: Optional[Decimal] = Field(None, description="Đơn giá phiếu - giá thỏa thuận")
+    expected_money: Optional[Decimal] = Field(None, description="Số lượng x giá thỏa thuận")
+
+
+class DeliveryPriceValidationResponse(BaseSchema):
+    """Validation result of a delivery note, in line order."""
+
+    is_valid: bool = Field(..., description="Tất cả dòng đều hợp lệ")
+    lines: list[DeliveryPriceLineResult] = Field(default_factory=list)
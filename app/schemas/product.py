@@ -0,0 +1,224 @@
+"""
+Product catalog schemas.
+Pydantic schemas cho ProductCategory, Product, SupplierProduct và UnitConversion.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import Field, field_validator
+
+from app.schemas.base import BaseSchema
+
+
+class ProductCategoryCreate(BaseSchema):
+    """Schema for creating product category."""
+
+    code: str = Field(..., min_length=1, max_length=50, description="Mã danh mục")
+    name: str = Field(..., min_length=1, max_length=200, description="Tên danh mục")
+    description: Optional[str] = Field(None, description="Mô tả danh mục")
+    is_active: bool = Field(default=True, description="Trạng thái hoạt động")
+
+    @field_validator("code")
+    @classmethod
+    def validate_code(cls, v: str) -> str:
+        """Normalize category code to uppercase."""
+        return v.strip().upper()
+
+
+class ProductCategoryRead(ProductCategoryCreate):
+    """Schema for reading product category."""
+
+    id: int = Field(..., description="Category ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
+class ProductBase(BaseSchema):
+    """Base product schema với shared fields."""
+
+    code: str = Field(..., min_length=1, max_length=50, description="Mã sản phẩm Aladdin")
+    name: str = Field(..., min_length=1, max_length=200, description="Tên sản phẩm")
+    category_id: int = Field(..., description="ID danh mục")
+    unit: str = Field(..., min_length=1, max_length=50, description="Đơn vị tính chuẩn")
+    description: Optional[str] = Field(None, description="Mô tả sản phẩm")
+    specifications: Optional[str] = Field(None, description="Thông số kỹ thuật")
+    is_active: bool = Field(default=True, description="Trạng thái hoạt động")
+
+
+class ProductCreate(ProductBase):
+    """Schema for creating product."""
+
+    @field_validator("code")
+    @classmethod
+    def validate_code(cls, v: str) -> str:
+        """Normalize product code to uppercase."""
+        return v.strip().upper()
+
+
+class ProductUpdate(BaseSchema):
+    """Schema for updating product. All fields are optional."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=200, description="Tên sản phẩm")
+    category_id: Optional[int] = Field(None, description="ID danh mục")
+    unit: Optional[str] = Field(None, min_length=1, max_length=50, description="Đơn vị tính chuẩn")
+    description: Optional[str] = Field(None, description="Mô tả sản phẩm")
+    specifications: Optional[str] = Field(None, description="Thông số kỹ thuật")
+    is_active: Optional[bool] = Field(None, description="Trạng thái hoạt động")
+
+
+class ProductRead(ProductBase):
+    """Schema for reading product."""
+
+    id: int = Field(..., description="Product ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
+class SupplierProductBase(BaseSchema):
+    """Base supplier product schema với shared fields."""
+
+    supplier_id: int = Field(..., description="ID nhà cung cấp")
+    product_id: int = Field(..., description="ID sản phẩm Aladdin")
+    supplier_product_code: str = Field(
+        ..., min_length=1, max_length=100, description="Mã sản phẩm của supplier (iit_code)"
+    )
+    supplier_product_name: str = Field(
+        ..., min_length=1, max_length=255, description="Tên sản phẩm của supplier (iit_name)"
+    )
+    supplier_unit: str = Field(
+        ..., min_length=1, max_length=50, description="Đơn vị tính của supplier (iit_uom)"
+    )
+    conversion_rate: Optional[Decimal] = Field(
+        None,
+        gt=0,
+        description="1 supplier_unit = rate * đơn vị chuẩn; bỏ trống để tra bảng quy đổi",
+    )
+    price: Optional[Decimal] = Field(None, ge=0, description="Giá mặc định")
+    min_order_quantity: Optional[Decimal] = Field(
+        None, ge=0, description="Số lượng đặt hàng tối thiểu"
+    )
+    is_active: bool = Field(default=True, description="Trạng thái hoạt động")
+
+
+class SupplierProductCreate(SupplierProductBase):
+    """Schema for creating supplier product mapping."""
+
+
+class SupplierProductUpdate(BaseSchema):
+    """Schema for updating supplier product mapping. All fields are optional."""
+
+    product_id: Optional[int] = Field(None, description="ID sản phẩm Aladdin")
+    supplier_product_name: Optional[str] = Field(
+        None, min_length=1, max_length=255, description="Tên sản phẩm của supplier"
+    )
+    supplier_unit: Optional[str] = Field(
+        None, min_length=1, max_length=50, description="Đơn vị tính của supplier"
+    )
+    conversion_rate: Optional[Decimal] = Field(None, gt=0, description="Tỷ lệ quy đổi")
+    price: Optional[Decimal] = Field(None, ge=0, description="Giá mặc định")
+    min_order_quantity: Optional[Decimal] = Field(
+        None, ge=0, description="Số lượng đặt hàng tối thiểu"
+    )
+    is_active: Optional[bool] = Field(None, description="Trạng thái hoạt động")
+
+
+class SupplierProductRead(SupplierProductBase):
+    """Schema for reading supplier product mapping."""
+
+    id: int = Field(..., description="Supplier product ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
+class UnitConversionCreate(BaseSchema):
+    """Schema for creating unit conversion rule."""
+
+    product_id: Optional[int] = Field(None, description="Sản phẩm áp dụng (bỏ trống: chung)")
+    from_unit: str = Field(..., min_length=1, max_length=50, description="Đơn vị nguồn")
+    to_unit: str = Field(..., min_length=1, max_length=50, description="Đơn vị đích")
+    factor: Decimal = Field(..., gt=0, description="1 from_unit = factor * to_unit")
+
+
+class UnitConversionRead(UnitConversionCreate):
+    """Schema for reading unit conversion rule."""
+
+    id: int = Field(..., description="Unit conversion ID")
+
+
+class SupplierItemResolveRequest(BaseSchema):
+    """Batch of supplier item codes to resolve (e.g. one delivery note)."""
+
+    supplier_code: str = Field(..., min_length=1, description="Mã nhà cung cấp")
+    iit_codes: list[str] = Field(
+        ..., min_length=1, max_length=1000, description="Mã sản phẩm của supplier"
+    )
+
+
+class SupplierItemMapping(BaseSchema):
+    """Resolved supplier item mapping."""
+
+    iit_code: str = Field(..., description="Mã sản phẩm của supplier")
+    supplier_product_id: int = Field(..., description="Supplier product ID")
+    product_id: int = Field(..., description="ID sản phẩm Aladdin")
+    product_code: str = Field(..., description="Mã sản phẩm Aladdin")
+    product_name: str = Field(..., description="Tên sản phẩm Aladdin")
+    product_unit: str = Field(..., description="Đơn vị tính chuẩn")
+    supplier_unit: str = Field(..., description="Đơn vị tính của supplier")
+    conversion_factor: Optional[Decimal] = Field(
+        None, description="1 supplier_unit = factor * đơn vị chuẩn"
+    )
+
+
+class SupplierItemResolveResponse(BaseSchema):
+    """Result of resolving a batch of supplier items."""
+
+    mapped: list[SupplierItemMapping] = Field(default_factory=list)
+    unmapped: list[str] = Field(default_factory=list, description="Mã chưa được mapping")
+
+
+class ProductMatchLine(BaseSchema):
+    """Supplier item line to match against the catalog."""
+
+    iit_code: Optional[str] = Field(None, description="Mã sản phẩm của supplier")
+    iit_name: str = Field(..., min_length=1, description="Tên sản phẩm của supplier")
+
+
+class ProductMatchRequest(BaseSchema):
+    """Batch of supplier item lines to match (e.g. one delivery note)."""
+
+    supplier_code: Optional[str] = Field(
+        None, description="Mã nhà cung cấp; khi có, dòng đã mapping sẽ được bỏ qua"
+    )
+    lines: list[ProductMatchLine] = Field(..., min_length=1, max_length=1000)
+    top_k: int = Field(5, ge=1, le=20, description="Số ứng viên tối đa mỗi dòng")
+    min_score: float = Field(0.2, ge=0, le=1, description="Điểm tương đồng tối thiểu")
+
+
+class ProductMatchCandidate(BaseSchema):
+    """Candidate canonical product for a supplier item."""
+
+    product_id: int = Field(..., description="ID sản phẩm Aladdin")
+    product_code: str = Field(..., description="Mã sản phẩm Aladdin")
+    product_name: str = Field(..., description="Tên sản phẩm Aladdin")
+    product_unit: str = Field(..., description="Đơn vị tính chuẩn")
+    score: float = Field(..., description="Độ tương đồng (0-1)")
+    matched_name: str = Field(..., description="Tên đã khớp (tên chuẩn hoặc tên supplier)")
+
+
+class ProductMatchResult(BaseSchema):
+    """Match result of one supplier item line."""
+
+    iit_code: Optional[str] = None
+    iit_name: str
+    mapping: Optional[SupplierItemMapping] = Field(
+        None, description="Mapping hiện có (nếu dòng đã được mapping)"
+    )
+    candidates: list[ProductMatchCandidate] = Field(default_factory=list)
+
+
+class ProductMatchResponse(BaseSchema):
+    """Match results in request line order."""
+
+    results: list[ProductMatchResult] = Field(default_factory=list)
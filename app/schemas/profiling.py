@@ -0,0 +1,40 @@
+"""
+Profiling schemas.
+Hồ sơ hiệu năng: các request chậm và truy vấn SQL của chúng.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class SlowRequestQuery(BaseSchema):
+    """SQL statement run by a slow request."""
+
+    statement: str = Field(..., description="Statement text (no parameters)")
+    duration_ms: float = Field(..., description="Execution time in milliseconds")
+    error: Optional[str] = Field(None, description="Exception type if the statement failed")
+
+
+class SlowRequestSummary(BaseSchema):
+    """Slow request capture, without its profile."""
+
+    id: int = Field(..., description="Capture ID (per worker)")
+    method: str
+    path: str
+    status_code: Optional[int] = Field(None, description="Response status, if any was sent")
+    duration_ms: float = Field(..., description="Time to handle the request")
+    started_at: datetime
+    query_count: int = Field(..., description="SQL statements run")
+    query_ms: float = Field(..., description="Time spent in the recorded statements")
+
+
+class SlowRequestDetail(SlowRequestSummary):
+    """Slow request capture with its SQL trace and profile."""
+
+    queries: list[SlowRequestQuery]
+    dropped_queries: int = Field(..., description="Statements beyond the trace limit")
+    profile: dict[str, Any] = Field(..., description="speedscope profile")
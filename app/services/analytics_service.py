@@ -0,0 +1,173 @@
+"""
+Purchasing analytics service.
+Business logic layer cho tổng hợp và báo cáo chi phí mua hàng.
+"""
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.analytics import SpendRollupRepository
+from app.schemas.analytics import (
+    ProductSpend,
+    SpendDeliveryLine,
+    SpendDeliveryRecord,
+    SupplierMonthlySpend,
+)
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing a date."""
+    return value.replace(day=1)
+
+
+class SpendAnalyticsService:
+    """Service maintaining and querying the spend rollups.
+
+    Reports read only the rollup tables; detail lines are never scanned.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+        self.repository = SpendRollupRepository(session)
+
+    async def apply_confirmed_delivery(
+        self,
+        supplier_id: int,
+        restaurant_id: int,
+        delivery_date: date,
+        lines: Iterable[SpendDeliveryLine],
+        reverse: bool = False,
+    ) -> None:
+        """Add a confirmed delivery note to the rollups.
+
+        Does not commit: call it inside the transaction that confirms the
+        delivery note so the rollups and the note status change together.
+
+        Args:
+            supplier_id: Supplier ID
+            restaurant_id: Restaurant ID
+            delivery_date: Delivery date
+            lines: Delivery lines mapped to canonical products
+            reverse: Subtract the note instead (e.g. confirmation cancelled)
+        """
+        sign = -1 if reverse else 1
+        totals: dict[int, list] = defaultdict(lambda: [Decimal(0), Decimal(0), 0])
+        for line in lines:
+            total = totals[line.product_id]
+            total[0] += line.quantity
+            total[1] += line.amount
+            total[2] += 1
+        if not totals:
+            return
+
+        await self.repository.add_daily([
+            {
+                "spend_date": delivery_date,
+                "supplier_id": supplier_id,
+                "restaurant_id": restaurant_id,
+                "product_id": product_id,
+                "quantity": sign * quantity,
+                "amount": sign * amount,
+                "line_count": sign * line_count,
+            }
+            for product_id, (quantity, amount, line_count) in totals.items()
+        ])
+        await self.repository.add_monthly({
+            "month": month_start(delivery_date),
+            "supplier_id": supplier_id,
+            "restaurant_id": restaurant_id,
+            "amount": sign * sum(t[1] for t in totals.values()),
+            "line_count": sign * sum(t[2] for t in totals.values()),
+            "delivery_count": sign,
+        })
+
+    async def record_confirmed_delivery(self, data: SpendDeliveryRecord) -> None:
+        """Apply a confirmed delivery note in the request's unit of work.
+
+        Args:
+            data: Confirmed delivery note
+        """
+        await self.apply_confirmed_delivery(
+            data.supplier_id,
+            data.restaurant_id,
+            data.delivery_date,
+            data.lines,
+            reverse=data.reverse,
+        )
+        await self.session.flush()
+
+    async def spend_by_supplier_by_month(
+        self,
+        date_from: date,
+        date_to: date,
+        supplier_id: Optional[int] = None,
+        restaurant_id: Optional[int] = None,
+    ) -> list[SupplierMonthlySpend]:
+        """Spend per supplier per month.
+
+        Args:
+            date_from: Any day in the first month
+            date_to: Any day in the last month
+            supplier_id: Optional supplier filter
+            restaurant_id: Optional restaurant filter
+
+        Returns:
+            Monthly spend rows ordered by month, then amount descending
+
+        Raises:
+            HTTPException: If the period is invalid
+        """
+        self._check_period(date_from, date_to)
+        rows = await self.repository.spend_by_supplier_by_month(
+            month_start(date_from),
+            month_start(date_to),
+            supplier_id=supplier_id,
+            restaurant_id=restaurant_id,
+        )
+        return [SupplierMonthlySpend.model_validate(row) for row in rows]
+
+    async def top_products(
+        self,
+        restaurant_id: int,
+        date_from: date,
+        date_to: date,
+        limit: int = 10,
+    ) -> list[ProductSpend]:
+        """Products with the highest spend of a restaurant.
+
+        Args:
+            restaurant_id: Restaurant ID
+            date_from: First day (inclusive)
+            date_to: Last day (inclusive)
+            limit: Number of products to return
+
+        Returns:
+            Product spend rows ordered by amount descending
+
+        Raises:
+            HTTPException: If the period is invalid
+        """
+        self._check_period(date_from, date_to)
+        rows = await self.repository.top_products(
+            restaurant_id, date_from, date_to, limit=limit
+        )
+        return [ProductSpend.model_validate(row) for row in rows]
+
+    @staticmethod
+    def _check_period(date_from: date, date_to: date) -> None:
+        """Raise 400 if date_from is after date_to."""
+        if date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_from must not be after date_to"
+            )
@@ -0,0 +1,252 @@
+"""
+In-memory product catalog index.
+
+Maps (supplier_code, iit_code) -> canonical product + unit conversion factor
+so that matching delivery note lines against the catalog is a dict lookup
+instead of one query per line. The index is loaded once at startup and
+rebuilt lazily on the next lookup after it has been invalidated, or after
+another worker changed the catalog (see `DatabaseSnapshot`).
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.core.scope import get_supplier_scope
+from app.repositories.product import (
+    ProductRepository,
+    SupplierProductRepository,
+    UnitConversionRepository,
+)
+from app.repositories.supplier import SupplierRepository
+from app.services.snapshot import DatabaseSnapshot
+
+logger = get_logger(__name__)
+
+
+def normalize_code(value: str) -> str:
+    """Normalize a supplier or item code for use as an index key."""
+    return value.strip().upper()
+
+
+def normalize_unit(value: str) -> str:
+    """Normalize a unit of measure for use as an index key."""
+    return value.strip().lower()
+
+
+async def check_supplier_code(session: AsyncSession, supplier_code: str) -> None:
+    """Reject a supplier code outside the current supplier scope.
+
+    The index and the active price cache hold every supplier's rows, so
+    lookups by supplier code bypass the repository scope. Supplier users
+    may only pass their own code; other codes are reported as missing,
+    like any other scoped miss.
+
+    Args:
+        session: Database session of the request
+        supplier_code: Supplier code from the request
+
+    Raises:
+        HTTPException: If the code is not the scoped supplier's code
+    """
+    supplier_id = get_supplier_scope()
+    if supplier_id is None:
+        return
+    supplier = await SupplierRepository(session).get(supplier_id)
+    if supplier is None or normalize_code(supplier.code) != normalize_code(supplier_code):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Supplier with code '{supplier_code}' not found"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ProductMapping:
+    """Resolved mapping of a supplier item to a canonical product.
+
+    Attributes:
+        supplier_product_id: SupplierProduct primary key
+        supplier_id: Supplier ID
+        supplier_code: Supplier code
+        supplier_product_code: Supplier's item code (iit_code)
+        supplier_unit: Supplier's unit of measure (iit_uom)
+        product_id: Canonical product ID
+        product_code: Canonical product code
+        product_name: Canonical product name
+        product_unit: Canonical unit of measure
+        conversion_factor: 1 supplier_unit = factor * product_unit,
+            None if no conversion rule is known
+    """
+
+    supplier_product_id: int
+    supplier_id: int
+    supplier_code: str
+    supplier_product_code: str
+    supplier_unit: str
+    product_id: int
+    product_code: str
+    product_name: str
+    product_unit: str
+    conversion_factor: Optional[Decimal]
+
+
+class ProductMappingIndex(DatabaseSnapshot):
+    """Process-local index of supplier item mappings.
+
+    Reads are plain dict lookups and never touch the database once the
+    index is loaded. Writers call `invalidate()` after committing a change
+    to products, supplier products, unit conversions or supplier codes;
+    the next `ensure_loaded()` rebuilds the index with two queries.
+    """
+
+    def __init__(self, check_interval: Optional[float] = None) -> None:
+        """Initialize an empty, unloaded index.
+
+        Args:
+            check_interval: Seconds between version checks (see DatabaseSnapshot)
+        """
+        super().__init__(check_interval)
+        self._mappings: dict[tuple[str, str], ProductMapping] = {}
+        self._conversions: dict[tuple[Optional[int], str, str], Decimal] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed supplier item mappings."""
+        return len(self._mappings)
+
+    async def version(self, session: AsyncSession) -> Any:
+        """Versions of the products, supplier products, unit conversions and suppliers."""
+        return (
+            await ProductRepository(session).get_table_version(),
+            await SupplierProductRepository(session).get_table_version(),
+            await UnitConversionRepository(session).get_table_version(),
+            await SupplierRepository(session).get_table_version(),
+        )
+
+    async def _rebuild(self, session: AsyncSession) -> None:
+        """Rebuild the index from the database.
+
+        Args:
+            session: Database session used for the rebuild queries
+        """
+        conversion_rows = await UnitConversionRepository(session).get_all_rows()
+        mapping_rows = await SupplierProductRepository(session).get_active_mapping_rows()
+
+        conversions: dict[tuple[Optional[int], str, str], Decimal] = {}
+        for row in conversion_rows:
+            key = (row.product_id, normalize_unit(row.from_unit), normalize_unit(row.to_unit))
+            conversions[key] = Decimal(row.factor)
+
+        mappings: dict[tuple[str, str], ProductMapping] = {}
+        for row in mapping_rows:
+            if row.conversion_rate is not None:
+                factor: Optional[Decimal] = Decimal(row.conversion_rate)
+            else:
+                factor = self._find_factor(
+                    conversions, row.product_id, row.supplier_unit, row.product_unit
+                )
+            mapping = ProductMapping(
+                supplier_product_id=row.supplier_product_id,
+                supplier_id=row.supplier_id,
+                supplier_code=row.supplier_code,
+                supplier_product_code=row.supplier_product_code,
+                supplier_unit=row.supplier_unit,
+                product_id=row.product_id,
+                product_code=row.product_code,
+                product_name=row.product_name,
+                product_unit=row.product_unit,
+                conversion_factor=factor,
+            )
+            key = (normalize_code(row.supplier_code), normalize_code(row.supplier_product_code))
+            mappings[key] = mapping
+
+        self._mappings = mappings
+        self._conversions = conversions
+
+        logger.info(
+            f"Product mapping index loaded: {len(mappings)} mappings, "
+            f"{len(conversions)} unit conversions"
+        )
+
+    def lookup(self, supplier_code: str, iit_code: str) -> Optional[ProductMapping]:
+        """Resolve one supplier item to its canonical product.
+
+        Args:
+            supplier_code: Supplier code
+            iit_code: Supplier's item code
+
+        Returns:
+            ProductMapping if the item is mapped, None otherwise
+        """
+        return self._mappings.get((normalize_code(supplier_code), normalize_code(iit_code)))
+
+    def lookup_many(
+        self,
+        supplier_code: str,
+        iit_codes: Iterable[str],
+    ) -> dict[str, Optional[ProductMapping]]:
+        """Resolve a batch of items from one supplier (e.g. a delivery note).
+
+        Args:
+            supplier_code: Supplier code
+            iit_codes: Supplier item codes
+
+        Returns:
+            Dict keyed by the given item codes; unmapped codes map to None
+        """
+        supplier_key = normalize_code(supplier_code)
+        mappings = self._mappings
+        return {
+            code: mappings.get((supplier_key, normalize_code(code)))
+            for code in iit_codes
+        }
+
+    def conversion_factor(
+        self,
+        product_id: Optional[int],
+        from_unit: str,
+        to_unit: str,
+    ) -> Optional[Decimal]:
+        """Get the factor converting `from_unit` to `to_unit`.
+
+        Product-specific rules win over generic ones; the inverse of a
+        known rule is used when only the opposite direction is defined.
+
+        Args:
+            product_id: Product the quantity belongs to (None: generic only)
+            from_unit: Source unit
+            to_unit: Target unit
+
+        Returns:
+            Factor such that 1 from_unit = factor * to_unit, or None
+        """
+        return self._find_factor(self._conversions, product_id, from_unit, to_unit)
+
+    @staticmethod
+    def _find_factor(
+        conversions: dict[tuple[Optional[int], str, str], Decimal],
+        product_id: Optional[int],
+        from_unit: str,
+        to_unit: str,
+    ) -> Optional[Decimal]:
+        """Look up a conversion factor in a conversion table."""
+        source = normalize_unit(from_unit)
+        target = normalize_unit(to_unit)
+        if source == target:
+            return Decimal(1)
+
+        for owner in (product_id, None) if product_id is not None else (None,):
+            factor = conversions.get((owner, source, target))
+            if factor is not None:
+                return factor
+            inverse = conversions.get((owner, target, source))
+            if inverse:
+                return Decimal(1) / inverse
+        return None
+
+
+# Process-wide index shared by all requests of this worker
+product_mapping_index = ProductMappingIndex()
@@ -0,0 +1,50 @@
+"""
+Per-request DataLoaders.
+Gom các lookup theo ID trong một request thành một truy vấn IN.
+"""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dataloader import DataLoader
+from app.models.supplier import Supplier
+from app.models.user import User
+from app.repositories.base import BaseRepository
+from app.repositories.supplier import SupplierRepository
+from app.repositories.user import UserRepository
+
+
+def _by_id(repository: BaseRepository) -> Any:
+    """Batch load function resolving IDs with `BaseRepository.get_many`."""
+
+    async def batch_load(ids: list[int]) -> dict[int, Any]:
+        found, _ = await repository.get_many(ids)
+        return {obj.id: obj for obj in found}
+
+    return batch_load
+
+
+class Loaders:
+    """DataLoaders of one request, sharing its database session.
+
+    Obtain it with the `get_loaders` dependency; FastAPI caches it per
+    request, so every lookup made while handling the request is batched
+    and cached together. Rows are subject to the request's supplier scope.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Create loaders bound to a session.
+
+        Args:
+            session: Request database session
+        """
+        # One AsyncSession cannot run two queries at once
+        lock = asyncio.Lock()
+        self.suppliers: DataLoader[int, Supplier] = DataLoader(
+            _by_id(SupplierRepository(session)), lock=lock
+        )
+        self.users: DataLoader[int, User] = DataLoader(
+            _by_id(UserRepository(session)), lock=lock
+        )
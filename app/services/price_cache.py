@@ -0,0 +1,154 @@
+"""
+In-process cache of currently active supplier price lists.
+
+Holds every price list item whose validity has not ended before
+`today - PRICE_CACHE_WINDOW_DAYS`. For delivery dates inside that window
+the cache is authoritative: an item valid on such a date either is in the
+cache or does not exist. Older dates fall back to the indexed query.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.repositories.price_list import (
+    SupplierPriceListItemRepository,
+    SupplierPriceListRepository,
+)
+from app.services.snapshot import DatabaseSnapshot
+
+logger = get_logger(__name__)
+
+PRICE_CACHE_WINDOW_DAYS = 90
+
+
+@dataclass(frozen=True, slots=True)
+class PriceEntry:
+    """Agreed price of a supplier product in one price list.
+
+    Attributes:
+        supplier_product_id: SupplierProduct ID
+        price_list_id: Price list the price comes from
+        price: Unit price in the supplier's unit
+        valid_from: First day the price applies
+        valid_to: Last day the price applies, None if open-ended
+    """
+
+    supplier_product_id: int
+    price_list_id: int
+    price: Decimal
+    valid_from: date
+    valid_to: Optional[date]
+
+    def covers(self, on_date: date) -> bool:
+        """Whether the price applies on a date."""
+        return self.valid_from <= on_date and (self.valid_to is None or self.valid_to >= on_date)
+
+
+class ActivePriceCache(DatabaseSnapshot):
+    """Process-local cache of active price list items.
+
+    Writers call `invalidate()` after committing a price list change, and
+    price list changes made on other workers are picked up at the next
+    version check (see DatabaseSnapshot). The cache also reloads itself
+    once per day so the window follows `today`.
+    """
+
+    def __init__(
+        self,
+        window_days: int = PRICE_CACHE_WINDOW_DAYS,
+        check_interval: Optional[float] = None,
+    ) -> None:
+        """Initialize an empty, unloaded cache.
+
+        Args:
+            window_days: How far back from today the cache is authoritative
+            check_interval: Seconds between version checks (see DatabaseSnapshot)
+        """
+        super().__init__(check_interval)
+        self.window_days = window_days
+        self._entries: dict[int, list[PriceEntry]] = {}
+        self._horizon: Optional[date] = None
+        self._loaded_on: Optional[date] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the cache holds a current snapshot for today."""
+        return super().is_loaded and self._loaded_on == date.today()
+
+    async def version(self, session: AsyncSession) -> Any:
+        """Versions of the price list and price list item tables."""
+        return (
+            await SupplierPriceListRepository(session).get_table_version(),
+            await SupplierPriceListItemRepository(session).get_table_version(),
+        )
+
+    async def _rebuild(self, session: AsyncSession) -> None:
+        """Reload active price list items from the database.
+
+        Args:
+            session: Database session used for the reload query
+        """
+        today = date.today()
+        horizon = today - timedelta(days=self.window_days)
+
+        rows = await SupplierPriceListItemRepository(session).get_active_rows(horizon)
+
+        entries: dict[int, list[PriceEntry]] = defaultdict(list)
+        for row in rows:
+            entries[row.supplier_product_id].append(
+                PriceEntry(
+                    supplier_product_id=row.supplier_product_id,
+                    price_list_id=row.price_list_id,
+                    price=row.price,
+                    valid_from=row.valid_from,
+                    valid_to=row.valid_to,
+                )
+            )
+        # Newest price list first, same order as the resolve query
+        for prices in entries.values():
+            prices.sort(key=lambda e: (e.valid_from, e.price_list_id), reverse=True)
+
+        self._entries = dict(entries)
+        self._horizon = horizon
+        self._loaded_on = today
+
+        logger.info(f"Active price cache loaded: {len(rows)} prices since {horizon}")
+
+    def covers(self, on_date: date) -> bool:
+        """Whether lookups for a date can be answered from the cache."""
+        return self._horizon is not None and on_date >= self._horizon
+
+    def lookup_many(
+        self,
+        supplier_product_ids: Iterable[int],
+        on_date: date,
+    ) -> dict[int, PriceEntry]:
+        """Resolve prices valid on a date.
+
+        Only meaningful when `covers(on_date)` is true.
+
+        Args:
+            supplier_product_ids: Supplier product IDs
+            on_date: Delivery date
+
+        Returns:
+            Dict of supplier_product_id -> price; products without a valid
+            price are omitted
+        """
+        prices: dict[int, PriceEntry] = {}
+        for supplier_product_id in supplier_product_ids:
+            for entry in self._entries.get(supplier_product_id, ()):
+                if entry.covers(on_date):
+                    prices[supplier_product_id] = entry
+                    break
+        return prices
+
+
+# Process-wide cache shared by all requests of this worker
+active_price_cache = ActivePriceCache()
@@ -0,0 +1,302 @@
+"""
+Supplier price list service.
+Business logic layer cho bảng giá nhà cung cấp và kiểm tra giá phiếu giao hàng.
+"""
+
+from datetime import date
+from typing import Iterable
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import after_commit
+from app.models.price_list import SupplierPriceList, SupplierPriceListItem
+from app.repositories.price_list import (
+    SupplierPriceListItemRepository,
+    SupplierPriceListRepository,
+)
+from app.repositories.product import SupplierProductRepository
+from app.repositories.supplier import SupplierRepository
+from app.schemas.price_list import (
+    DeliveryPriceLineResult,
+    DeliveryPriceValidationRequest,
+    DeliveryPriceValidationResponse,
+    SupplierPriceListCreate,
+    SupplierPriceListUpdate,
+)
+from app.services.catalog_index import check_supplier_code, product_mapping_index
+from app.services.price_cache import PriceEntry, active_price_cache
+
+# Fields of a price list that are copied onto its items
+_ITEM_VALIDITY_FIELDS = ("valid_to", "is_active")
+
+
+class PriceListService:
+    """Service for supplier price list business logic.
+
+    Writes are flushed into the request's unit of work; the in-process
+    active price cache is invalidated once it commits.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+        self.repository = SupplierPriceListRepository(session)
+        self.item_repository = SupplierPriceListItemRepository(session)
+        self.supplier_product_repository = SupplierProductRepository(session)
+        self.supplier_repository = SupplierRepository(session)
+
+    async def create_price_list(self, data: SupplierPriceListCreate) -> SupplierPriceList:
+        """Create price list with its items.
+
+        Args:
+            data: Price list data from request
+
+        Returns:
+            Created price list
+
+        Raises:
+            HTTPException: If supplier not found, code exists or an item
+                does not belong to the supplier
+        """
+        if not await self.supplier_repository.get(data.supplier_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Supplier with ID {data.supplier_id} not found"
+            )
+        if await self.repository.get_by_code(data.supplier_id, data.code):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Price list with code '{data.code}' already exists for this supplier"
+            )
+
+        item_ids = [item.supplier_product_id for item in data.items]
+        owned = await self.supplier_product_repository.filter_ids_for_supplier(
+            data.supplier_id, item_ids
+        )
+        foreign = sorted(set(item_ids) - owned)
+        if foreign:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Supplier products {foreign} do not belong to supplier {data.supplier_id}"
+            )
+
+        price_list = SupplierPriceList(**data.model_dump(exclude={"items"}))
+        price_list.items = [
+            SupplierPriceListItem(
+                supplier_product_id=item.supplier_product_id,
+                price=item.price,
+                valid_from=data.valid_from,
+                valid_to=data.valid_to,
+                is_active=data.is_active,
+            )
+            for item in data.items
+        ]
+        self.session.add(price_list)
+        await self.session.flush()
+        await self.session.refresh(price_list)
+        after_commit(self.session, active_price_cache.invalidate)
+        return price_list
+
+    async def get_price_list(self, price_list_id: int) -> SupplierPriceList:
+        """Get price list by ID.
+
+        Args:
+            price_list_id: Price list ID
+
+        Returns:
+            Price list with items
+
+        Raises:
+            HTTPException: If price list not found
+        """
+        price_list = await self.repository.get(price_list_id)
+        if not price_list:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Price list with ID {price_list_id} not found"
+            )
+        return price_list
+
+    async def list_price_lists(
+        self,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[SupplierPriceList], int]:
+        """List price lists of a supplier.
+
+        Args:
+            supplier_id: Supplier ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of price lists, total count)
+        """
+        return await self.repository.list_by_supplier(supplier_id, skip=skip, limit=limit)
+
+    async def update_price_list(
+        self,
+        price_list_id: int,
+        data: SupplierPriceListUpdate,
+    ) -> SupplierPriceList:
+        """Update price list; validity changes are copied onto its items.
+
+        Args:
+            price_list_id: Price list ID
+            data: Fields to update
+
+        Returns:
+            Updated price list
+
+        Raises:
+            HTTPException: If price list not found or period is invalid
+        """
+        price_list = await self.get_price_list(price_list_id)
+        update_data = data.model_dump(exclude_unset=True)
+        valid_to = update_data.get("valid_to")
+        if valid_to is not None and valid_to < price_list.valid_from:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="valid_to must not be before valid_from"
+            )
+
+        validity = {k: v for k, v in update_data.items() if k in _ITEM_VALIDITY_FIELDS}
+        if validity:
+            await self.item_repository.sync_validity(price_list_id, validity)
+
+        price_list = await self.repository.update(price_list_id, update_data)
+        await self.session.flush()
+        await self.session.refresh(price_list, ["items"])
+        after_commit(self.session, active_price_cache.invalidate)
+        return price_list
+
+    async def delete_price_list(self, price_list_id: int) -> bool:
+        """Delete price list and its items.
+
+        Args:
+            price_list_id: Price list ID
+
+        Returns:
+            True if deleted
+
+        Raises:
+            HTTPException: If price list not found
+        """
+        price_list = await self.get_price_list(price_list_id)
+        await self.session.delete(price_list)
+        await self.session.flush()
+        after_commit(self.session, active_price_cache.invalidate)
+        return True
+
+    async def resolve_prices(
+        self,
+        supplier_product_ids: Iterable[int],
+        on_date: date,
+    ) -> dict[int, PriceEntry]:
+        """Resolve the agreed prices valid on a date.
+
+        Recent dates are answered from the active price cache; older dates
+        use one indexed query.
+
+        Args:
+            supplier_product_ids: Supplier product IDs
+            on_date: Delivery date
+
+        Returns:
+            Dict of supplier_product_id -> price entry
+        """
+        ids = list(supplier_product_ids)
+        await active_price_cache.ensure_loaded(self.session)
+        if active_price_cache.covers(on_date):
+            return active_price_cache.lookup_many(ids, on_date)
+
+        rows = await self.item_repository.resolve_prices(ids, on_date)
+        return {
+            row.supplier_product_id: PriceEntry(
+                supplier_product_id=row.supplier_product_id,
+                price_list_id=row.price_list_id,
+                price=row.price,
+                valid_from=row.valid_from,
+                valid_to=row.valid_to,
+            )
+            for row in rows
+        }
+
+    async def validate_delivery_prices(
+        self,
+        data: DeliveryPriceValidationRequest,
+    ) -> DeliveryPriceValidationResponse:
+        """Validate the prices of a delivery note against agreed prices.
+
+        Args:
+            data: Delivery note lines
+
+        Returns:
+            Per-line results in request order
+
+        Raises:
+            HTTPException: If the supplier is outside the caller's scope
+        """
+        await check_supplier_code(self.session, data.supplier_code)
+        await product_mapping_index.ensure_loaded(self.session)
+        mappings = product_mapping_index.lookup_many(
+            data.supplier_code, [line.iit_code for line in data.lines]
+        )
+        prices = await self.resolve_prices(
+            {m.supplier_product_id for m in mappings.values() if m is not None},
+            data.delivery_date,
+        )
+
+        results: list[DeliveryPriceLineResult] = []
+        for line in data.lines:
+            mapping = mappings.get(line.iit_code)
+            if mapping is None:
+                results.append(
+                    DeliveryPriceLineResult(iit_code=line.iit_code, status="unmapped", price=line.price)
+                )
+                continue
+
+            entry = prices.get(mapping.supplier_product_id)
+            if entry is None:
+                results.append(
+                    DeliveryPriceLineResult(
+                        iit_code=line.iit_code,
+                        status="no_price",
+                        supplier_product_id=mapping.supplier_product_id,
+                        price=line.price,
+                    )
+                )
+                continue
+
+            difference = line.price - entry.price
+            expected_money = line.quantity * entry.price
+            if abs(difference) > data.tolerance:
+                line_status = "price_mismatch"
+            elif line.money is not None and abs(line.money - expected_money) > data.tolerance:
+                line_status = "money_mismatch"
+            else:
+                line_status = "ok"
+
+            results.append(
+                DeliveryPriceLineResult(
+                    iit_code=line.iit_code,
+                    status=line_status,
+                    supplier_product_id=mapping.supplier_product_id,
+                    price_list_id=entry.price_list_id,
+                    agreed_price=entry.price,
+                    price=line.price,
+                    price_difference=difference,
+                    expected_money=expected_money,
+                )
+            )
+
+        return DeliveryPriceValidationResponse(
+            is_valid=all(r.status == "ok" for r in results),
+            lines=results,
+        )
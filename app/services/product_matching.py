@@ -0,0 +1,276 @@
+"""
+Fuzzy product matching for unmapped supplier items.
+
+Keeps a character n-gram TF-IDF index over canonical product names (and
+the supplier item names already mapped to them) in memory. Names are
+Vietnamese-normalized first, so "NƯỚC MẮM Phú Quốc" and "nuoc mam phu quoc"
+produce the same n-grams. Queries only score documents that share at least
+one n-gram with the query, which keeps top-k lookups in the millisecond
+range for catalogs of tens of thousands of names.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.repositories.product import ProductRepository, SupplierProductRepository
+from app.services.snapshot import DatabaseSnapshot
+
+logger = get_logger(__name__)
+
+NGRAM_SIZE = 3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_vietnamese(text: str) -> str:
+    """Normalize Vietnamese text for matching.
+
+    Lowercases, maps đ -> d, strips tone and vowel marks and collapses
+    punctuation into single spaces.
+
+    Args:
+        text: Raw product name
+
+    Returns:
+        ASCII, lowercase, space-separated text
+    """
+    text = text.lower().replace("đ", "d")
+    text = unicodedata.normalize("NFD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> Counter[str]:
+    """Count padded character n-grams of each word in normalized text.
+
+    Args:
+        text: Normalized text
+        n: N-gram size
+
+    Returns:
+        Counter of n-grams
+    """
+    grams: Counter[str] = Counter()
+    for word in text.split():
+        padded = f" {word} "
+        if len(padded) <= n:
+            grams[padded] += 1
+            continue
+        for i in range(len(padded) - n + 1):
+            grams[padded[i:i + n]] += 1
+    return grams
+
+
+@dataclass(frozen=True, slots=True)
+class MatchCandidate:
+    """A candidate canonical product for a supplier item name.
+
+    Attributes:
+        product_id: Canonical product ID
+        product_code: Canonical product code
+        product_name: Canonical product name
+        product_unit: Canonical unit of measure
+        score: Cosine similarity in [0, 1]
+        matched_name: Indexed name that produced the score
+    """
+
+    product_id: int
+    product_code: str
+    product_name: str
+    product_unit: str
+    score: float
+    matched_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Document:
+    """Indexed name pointing to a canonical product."""
+
+    product_id: int
+    name: str
+
+
+class ProductMatchIndex(DatabaseSnapshot):
+    """In-memory TF-IDF index over product names.
+
+    Like the catalog mapping index, it is loaded once and rebuilt lazily
+    after `invalidate()` is called by catalog writes, or after another
+    worker changed products or supplier products.
+    """
+
+    def __init__(self, check_interval: Optional[float] = None) -> None:
+        """Initialize an empty, unloaded index.
+
+        Args:
+            check_interval: Seconds between version checks (see DatabaseSnapshot)
+        """
+        super().__init__(check_interval)
+        self._documents: list[_Document] = []
+        self._products: dict[int, tuple[str, str, str]] = {}
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        self._idf: dict[str, float] = {}
+
+    async def version(self, session: AsyncSession) -> Any:
+        """Versions of the products and supplier products tables."""
+        return (
+            await ProductRepository(session).get_table_version(),
+            await SupplierProductRepository(session).get_table_version(),
+        )
+
+    async def _rebuild(self, session: AsyncSession) -> None:
+        """Rebuild the index from active products and their supplier aliases.
+
+        Args:
+            session: Database session used for the rebuild queries
+        """
+        product_rows = await ProductRepository(session).get_match_rows()
+        alias_rows = await SupplierProductRepository(session).get_alias_rows()
+
+        products = {row.id: (row.code, row.name, row.unit) for row in product_rows}
+        names: list[tuple[int, str]] = [(row.id, row.name) for row in product_rows]
+        names.extend(
+            (row.product_id, row.supplier_product_name)
+            for row in alias_rows
+            if row.product_id in products
+        )
+        self.build(products, names)
+
+        logger.info(
+            f"Product match index loaded: {len(products)} products, "
+            f"{len(self._documents)} names, {len(self._postings)} n-grams"
+        )
+
+    def build(
+        self,
+        products: dict[int, tuple[str, str, str]],
+        names: Iterable[tuple[int, str]],
+    ) -> None:
+        """Build the index from in-memory data.
+
+        Args:
+            products: product_id -> (code, name, unit)
+            names: (product_id, name) pairs to index; a product may have
+                several names (canonical name plus supplier aliases)
+        """
+        documents: list[_Document] = []
+        doc_grams: list[Counter[str]] = []
+        seen: set[tuple[int, str]] = set()
+        for product_id, name in names:
+            normalized = normalize_vietnamese(name)
+            if not normalized or (product_id, normalized) in seen:
+                continue
+            seen.add((product_id, normalized))
+            documents.append(_Document(product_id=product_id, name=name))
+            doc_grams.append(char_ngrams(normalized))
+
+        document_frequency: Counter[str] = Counter()
+        for grams in doc_grams:
+            document_frequency.update(grams.keys())
+
+        total = len(documents)
+        idf = {
+            gram: math.log((1 + total) / (1 + df)) + 1.0
+            for gram, df in document_frequency.items()
+        }
+
+        postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for doc_id, grams in enumerate(doc_grams):
+            weights = {gram: (1 + math.log(tf)) * idf[gram] for gram, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for gram, weight in weights.items():
+                postings[gram].append((doc_id, weight / norm))
+
+        self._documents = documents
+        self._products = dict(products)
+        self._postings = dict(postings)
+        self._idf = idf
+
+    def match(self, name: str, top_k: int = 5, min_score: float = 0.0) -> list[MatchCandidate]:
+        """Find the canonical products most similar to a supplier item name.
+
+        Args:
+            name: Supplier item name (iit_name)
+            top_k: Maximum number of distinct products to return
+            min_score: Minimum cosine similarity
+
+        Returns:
+            Candidates ordered by descending score
+        """
+        grams = char_ngrams(normalize_vietnamese(name))
+        weights = {
+            gram: (1 + math.log(tf)) * self._idf[gram]
+            for gram, tf in grams.items()
+            if gram in self._idf
+        }
+        if not weights:
+            return []
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+
+        scores: dict[int, float] = defaultdict(float)
+        for gram, weight in weights.items():
+            query_weight = weight / norm
+            for doc_id, doc_weight in self._postings[gram]:
+                scores[doc_id] += query_weight * doc_weight
+
+        # Best-scoring name per product
+        best: dict[int, tuple[float, int]] = {}
+        for doc_id, score in scores.items():
+            product_id = self._documents[doc_id].product_id
+            if product_id not in best or score > best[product_id][0]:
+                best[product_id] = (score, doc_id)
+
+        top = heapq.nlargest(top_k, best.items(), key=lambda item: item[1][0])
+        candidates: list[MatchCandidate] = []
+        for product_id, (score, doc_id) in top:
+            if score < min_score:
+                continue
+            code, product_name, unit = self._products[product_id]
+            candidates.append(
+                MatchCandidate(
+                    product_id=product_id,
+                    product_code=code,
+                    product_name=product_name,
+                    product_unit=unit,
+                    score=round(min(score, 1.0), 4),
+                    matched_name=self._documents[doc_id].name,
+                )
+            )
+        return candidates
+
+    def match_many(
+        self,
+        names: Iterable[str],
+        top_k: int = 5,
+        min_score: float = 0.0,
+    ) -> dict[str, list[MatchCandidate]]:
+        """Match a batch of names, computing each distinct name once.
+
+        Args:
+            names: Supplier item names
+            top_k: Maximum number of candidates per name
+            min_score: Minimum cosine similarity
+
+        Returns:
+            Dict keyed by the given names
+        """
+        results: dict[str, list[MatchCandidate]] = {}
+        for name in names:
+            if name not in results:
+                results[name] = self.match(name, top_k=top_k, min_score=min_score)
+        return results
+
+    def get_product(self, product_id: int) -> Optional[tuple[str, str, str]]:
+        """Get (code, name, unit) of an indexed product."""
+        return self._products.get(product_id)
+
+
+# Process-wide index shared by all requests of this worker
+product_match_index = ProductMatchIndex()
@@ -0,0 +1,573 @@
+"""
+Product catalog service.
+Business logic layer cho danh mục sản phẩm và mapping sản phẩm nhà cung cấp.
+"""
+
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import make_etag
+from app.db.session import after_commit
+from app.models.product import Product, ProductCategory, SupplierProduct, UnitConversion
+from app.repositories.product import (
+    ProductCategoryRepository,
+    ProductRepository,
+    SupplierProductRepository,
+    UnitConversionRepository,
+)
+from app.repositories.supplier import SupplierRepository
+from app.schemas.product import (
+    ProductCategoryCreate,
+    ProductCreate,
+    ProductMatchCandidate,
+    ProductMatchLine,
+    ProductMatchResponse,
+    ProductMatchResult,
+    ProductUpdate,
+    SupplierItemMapping,
+    SupplierItemResolveResponse,
+    SupplierProductCreate,
+    SupplierProductUpdate,
+    UnitConversionCreate,
+)
+from app.services.catalog_index import (
+    ProductMapping,
+    check_supplier_code,
+    product_mapping_index,
+)
+from app.services.product_matching import product_match_index
+
+
+class ProductService:
+    """Service for product catalog business logic.
+
+    Writes are flushed into the request's unit of work. Every write that
+    can change a supplier item mapping invalidates the in-memory catalog
+    index once it commits; writes that change product or supplier item
+    names also invalidate the fuzzy match index.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+        self.category_repository = ProductCategoryRepository(session)
+        self.repository = ProductRepository(session)
+        self.supplier_product_repository = SupplierProductRepository(session)
+        self.unit_conversion_repository = UnitConversionRepository(session)
+        self.supplier_repository = SupplierRepository(session)
+
+    # Categories
+
+    async def create_category(self, data: ProductCategoryCreate) -> ProductCategory:
+        """Create product category.
+
+        Args:
+            data: Category data from request
+
+        Returns:
+            Created category
+
+        Raises:
+            HTTPException: If category code already exists
+        """
+        if await self.category_repository.get_by_code(data.code):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Product category with code '{data.code}' already exists"
+            )
+
+        category = await self.category_repository.create(data.model_dump())
+        await self.session.flush()
+        return category
+
+    async def list_categories(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ProductCategory], int]:
+        """List product categories with pagination.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of categories, total count)
+        """
+        return await self.category_repository.get_multi(
+            skip=skip, limit=limit, order_by=ProductCategory.code
+        )
+
+    # Products
+
+    async def create_product(self, data: ProductCreate) -> Product:
+        """Create canonical product.
+
+        Args:
+            data: Product data from request
+
+        Returns:
+            Created product
+
+        Raises:
+            HTTPException: If code already exists or category not found
+        """
+        if await self.repository.get_by_code(data.code):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Product with code '{data.code}' already exists"
+            )
+        await self._ensure_category_exists(data.category_id)
+
+        product = await self.repository.create(data.model_dump())
+        await self.session.flush()
+        after_commit(self.session, product_match_index.invalidate)
+        return product
+
+    async def get_product(self, product_id: int) -> Product:
+        """Get product by ID.
+
+        Args:
+            product_id: Product ID
+
+        Returns:
+            Product
+
+        Raises:
+            HTTPException: If product not found
+        """
+        product = await self.repository.get(product_id)
+        if not product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with ID {product_id} not found"
+            )
+        return product
+
+    async def get_product_fields(
+        self,
+        product_id: int,
+        fields: tuple[str, ...],
+    ) -> dict[str, Any]:
+        """Get selected columns of a product (sparse fieldsets).
+
+        Args:
+            product_id: Product ID
+            fields: Column names to select
+
+        Returns:
+            Dict of column values
+
+        Raises:
+            HTTPException: If product not found
+        """
+        row = await self.repository.get_fields(product_id, fields)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with ID {product_id} not found"
+            )
+        return row
+
+    async def get_product_etag(
+        self,
+        product_id: int,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> Optional[str]:
+        """Get the ETag of a product from (id, updated_at).
+
+        Args:
+            product_id: Product ID
+            fields: Sparse fieldset of the representation, if any
+
+        Returns:
+            ETag, or None if the product does not exist
+        """
+        updated_at = await self.repository.get_version(product_id)
+        if updated_at is None:
+            return None
+        return make_etag("product", product_id, updated_at, fields)
+
+    async def list_products(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> tuple[list[Product], int]:
+        """List products with pagination and filters.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category_id: Optional category filter
+            is_active: Optional active status filter
+
+        Returns:
+            Tuple of (list of products, total count)
+        """
+        return await self.repository.list_products(
+            skip=skip, limit=limit, category_id=category_id, is_active=is_active
+        )
+
+    async def list_product_fields(
+        self,
+        fields: tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List selected columns of products (sparse fieldsets).
+
+        Args:
+            fields: Column names to select
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category_id: Optional category filter
+            is_active: Optional active status filter
+
+        Returns:
+            Tuple of (list of column dicts, total count)
+        """
+        return await self.repository.list_product_fields(
+            fields, skip=skip, limit=limit, category_id=category_id, is_active=is_active
+        )
+
+    async def list_products_etag(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> str:
+        """Get the ETag of a product list page from (max(updated_at), count).
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category_id: Optional category filter
+            is_active: Optional active status filter
+            fields: Sparse fieldset of the representation, if any
+
+        Returns:
+            ETag
+        """
+        latest, count = await self.repository.get_query_version(
+            self.repository.list_query(category_id, is_active)
+        )
+        return make_etag(
+            "products", latest, count, skip, limit, category_id, is_active, fields
+        )
+
+    async def update_product(self, product_id: int, data: ProductUpdate) -> Product:
+        """Update product.
+
+        Args:
+            product_id: Product ID
+            data: Fields to update
+
+        Returns:
+            Updated product
+
+        Raises:
+            HTTPException: If product or category not found
+        """
+        await self.get_product(product_id)
+        update_data = data.model_dump(exclude_unset=True)
+        if "category_id" in update_data:
+            await self._ensure_category_exists(update_data["category_id"])
+
+        product = await self.repository.update(product_id, update_data)
+        await self.session.flush()
+        after_commit(self.session, self._invalidate_catalog_indexes)
+        return product
+
+    # Supplier product mappings
+
+    async def create_supplier_product(self, data: SupplierProductCreate) -> SupplierProduct:
+        """Map a supplier item to a canonical product.
+
+        Args:
+            data: Mapping data from request
+
+        Returns:
+            Created supplier product mapping
+
+        Raises:
+            HTTPException: If supplier/product not found or mapping exists
+        """
+        if not await self.supplier_repository.get(data.supplier_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Supplier with ID {data.supplier_id} not found"
+            )
+        await self.get_product(data.product_id)
+
+        existing = await self.supplier_product_repository.get_by_supplier_code(
+            data.supplier_id, data.supplier_product_code
+        )
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Supplier product code '{data.supplier_product_code}' "
+                    f"is already mapped for this supplier"
+                )
+            )
+
+        supplier_product = await self.supplier_product_repository.create(data.model_dump())
+        await self.session.flush()
+        after_commit(self.session, self._invalidate_catalog_indexes)
+        return supplier_product
+
+    async def get_supplier_product(self, supplier_product_id: int) -> SupplierProduct:
+        """Get supplier product mapping by ID.
+
+        Args:
+            supplier_product_id: SupplierProduct ID
+
+        Returns:
+            SupplierProduct
+
+        Raises:
+            HTTPException: If mapping not found
+        """
+        supplier_product = await self.supplier_product_repository.get(supplier_product_id)
+        if not supplier_product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Supplier product with ID {supplier_product_id} not found"
+            )
+        return supplier_product
+
+    async def list_supplier_products(
+        self,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[SupplierProduct]:
+        """List product mappings of a supplier.
+
+        Args:
+            supplier_id: Supplier ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of supplier products
+        """
+        return await self.supplier_product_repository.list_by_supplier(
+            supplier_id, skip=skip, limit=limit
+        )
+
+    async def update_supplier_product(
+        self,
+        supplier_product_id: int,
+        data: SupplierProductUpdate,
+    ) -> SupplierProduct:
+        """Update supplier product mapping.
+
+        Args:
+            supplier_product_id: SupplierProduct ID
+            data: Fields to update
+
+        Returns:
+            Updated mapping
+
+        Raises:
+            HTTPException: If mapping or product not found
+        """
+        await self.get_supplier_product(supplier_product_id)
+        update_data = data.model_dump(exclude_unset=True)
+        if update_data.get("product_id") is not None:
+            await self.get_product(update_data["product_id"])
+
+        supplier_product = await self.supplier_product_repository.update(
+            supplier_product_id, update_data
+        )
+        await self.session.flush()
+        after_commit(self.session, self._invalidate_catalog_indexes)
+        return supplier_product
+
+    async def delete_supplier_product(self, supplier_product_id: int) -> bool:
+        """Delete supplier product mapping.
+
+        Args:
+            supplier_product_id: SupplierProduct ID
+
+        Returns:
+            True if deleted
+
+        Raises:
+            HTTPException: If mapping not found
+        """
+        await self.get_supplier_product(supplier_product_id)
+        deleted = await self.supplier_product_repository.delete(supplier_product_id)
+        await self.session.flush()
+        after_commit(self.session, self._invalidate_catalog_indexes)
+        return deleted
+
+    # Unit conversions
+
+    async def create_unit_conversion(self, data: UnitConversionCreate) -> UnitConversion:
+        """Create unit conversion rule.
+
+        Args:
+            data: Conversion rule from request
+
+        Returns:
+            Created conversion rule
+
+        Raises:
+            HTTPException: If product not found
+        """
+        if data.product_id is not None:
+            await self.get_product(data.product_id)
+
+        conversion = await self.unit_conversion_repository.create(data.model_dump())
+        await self.session.flush()
+        after_commit(self.session, product_mapping_index.invalidate)
+        return conversion
+
+    # Mapping resolution
+
+    async def resolve_supplier_items(
+        self,
+        supplier_code: str,
+        iit_codes: list[str],
+    ) -> SupplierItemResolveResponse:
+        """Resolve supplier item codes to canonical products.
+
+        Uses the in-memory catalog index; the database is only touched
+        when the index has to be (re)loaded.
+
+        Args:
+            supplier_code: Supplier code
+            iit_codes: Supplier item codes of e.g. one delivery note
+
+        Returns:
+            Mapped items and the list of unmapped codes
+
+        Raises:
+            HTTPException: If the supplier is outside the caller's scope
+        """
+        await check_supplier_code(self.session, supplier_code)
+        await product_mapping_index.ensure_loaded(self.session)
+
+        response = SupplierItemResolveResponse()
+        for code, mapping in product_mapping_index.lookup_many(supplier_code, iit_codes).items():
+            if mapping is None:
+                response.unmapped.append(code)
+                continue
+            response.mapped.append(self._to_item_mapping(code, mapping))
+        return response
+
+    async def match_supplier_items(
+        self,
+        lines: list[ProductMatchLine],
+        supplier_code: Optional[str] = None,
+        top_k: int = 5,
+        min_score: float = 0.0,
+    ) -> ProductMatchResponse:
+        """Suggest canonical products for a batch of supplier item lines.
+
+        Lines whose code is already mapped for the supplier are returned
+        with their mapping and no candidates; the remaining lines are
+        matched by name against the in-memory fuzzy index in one pass.
+
+        Args:
+            lines: Supplier item lines of e.g. one delivery note
+            supplier_code: Optional supplier code used to skip mapped lines
+            top_k: Maximum number of candidates per line
+            min_score: Minimum similarity score
+
+        Returns:
+            One result per line, in request order
+
+        Raises:
+            HTTPException: If the supplier is outside the caller's scope
+        """
+        mappings: dict[str, Optional[ProductMapping]] = {}
+        if supplier_code:
+            await check_supplier_code(self.session, supplier_code)
+            await product_mapping_index.ensure_loaded(self.session)
+            codes = [line.iit_code for line in lines if line.iit_code]
+            mappings = product_mapping_index.lookup_many(supplier_code, codes)
+
+        unmapped_names = [
+            line.iit_name for line in lines
+            if not (line.iit_code and mappings.get(line.iit_code))
+        ]
+        candidates_by_name = {}
+        if unmapped_names:
+            await product_match_index.ensure_loaded(self.session)
+            candidates_by_name = product_match_index.match_many(
+                unmapped_names, top_k=top_k, min_score=min_score
+            )
+
+        response = ProductMatchResponse()
+        for line in lines:
+            mapping = mappings.get(line.iit_code) if line.iit_code else None
+            if mapping is not None:
+                response.results.append(
+                    ProductMatchResult(
+                        iit_code=line.iit_code,
+                        iit_name=line.iit_name,
+                        mapping=self._to_item_mapping(line.iit_code, mapping),
+                    )
+                )
+                continue
+            response.results.append(
+                ProductMatchResult(
+                    iit_code=line.iit_code,
+                    iit_name=line.iit_name,
+                    candidates=[
+                        ProductMatchCandidate(
+                            product_id=c.product_id,
+                            product_code=c.product_code,
+                            product_name=c.product_name,
+                            product_unit=c.product_unit,
+                            score=c.score,
+                            matched_name=c.matched_name,
+                        )
+                        for c in candidates_by_name.get(line.iit_name, [])
+                    ],
+                )
+            )
+        return response
+
+    @staticmethod
+    def _to_item_mapping(code: str, mapping: ProductMapping) -> SupplierItemMapping:
+        """Convert an index entry to the response schema."""
+        return SupplierItemMapping(
+            iit_code=code,
+            supplier_product_id=mapping.supplier_product_id,
+            product_id=mapping.product_id,
+            product_code=mapping.product_code,
+            product_name=mapping.product_name,
+            product_unit=mapping.product_unit,
+            supplier_unit=mapping.supplier_unit,
+            conversion_factor=mapping.conversion_factor,
+        )
+
+    @staticmethod
+    def _invalidate_catalog_indexes() -> None:
+        """Invalidate both the mapping index and the fuzzy match index."""
+        product_mapping_index.invalidate()
+        product_match_index.invalidate()
+
+    async def _ensure_category_exists(self, category_id: int) -> None:
+        """Raise 400 if the category does not exist."""
+        if not await self.category_repository.get(category_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Product category with ID {category_id} not found"
+            )
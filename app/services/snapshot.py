@@ -0,0 +1,121 @@
+"""
+Process-wide in-memory snapshots of database tables.
+
+The catalog indexes and the active price cache keep a copy of a few tables
+in each worker. Writers on the same worker call `invalidate()` after
+committing, so the next `ensure_loaded()` rebuilds at once. Writes made by
+other workers are noticed by comparing `version()`, a cheap aggregate over
+the source tables, with the version of the loaded copy, at most every
+`SNAPSHOT_CHECK_SECONDS`. Checks and rebuilds always read from the primary:
+a lagging replica would hand back the rows the write just replaced.
+
+`updated_at` is set when a transaction writes, not when it commits, so a
+long transaction can commit rows older than the version already seen.
+Snapshots are therefore also rebuilt once they are
+`SNAPSHOT_MAX_AGE_SECONDS` old.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import primary_session
+
+
+class DatabaseSnapshot(ABC):
+    """Base class of in-memory copies of database rows.
+
+    Subclasses implement `version()` and `_rebuild()`.
+    """
+
+    def __init__(self, check_interval: Optional[float] = None) -> None:
+        """Initialize an empty, unloaded snapshot.
+
+        Args:
+            check_interval: Seconds between version checks; defaults to
+                `SNAPSHOT_CHECK_SECONDS`
+        """
+        self.check_interval = check_interval
+        self._loaded = False
+        self._generation = 0
+        self._version: Any = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the snapshot holds a current copy of the rows."""
+        return self._loaded
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next `ensure_loaded()` rebuilds it."""
+        self._generation += 1
+        self._loaded = False
+
+    @abstractmethod
+    async def version(self, session: AsyncSession) -> Any:
+        """Get a value that changes whenever the source rows change.
+
+        Args:
+            session: Database session used for the query
+        """
+
+    @abstractmethod
+    async def _rebuild(self, session: AsyncSession) -> None:
+        """Replace the in-memory copy with the current rows.
+
+        Args:
+            session: Database session used for the queries
+        """
+
+    def _check_due(self) -> bool:
+        """Whether the loaded version should be compared with the database."""
+        interval = (
+            self.check_interval
+            if self.check_interval is not None
+            else settings.SNAPSHOT_CHECK_SECONDS
+        )
+        return time.monotonic() - self._checked_at >= interval
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Load the snapshot if it is missing, invalidated or outdated.
+
+        Args:
+            session: The caller's session; replica sessions are not used
+        """
+        if self.is_loaded and not self._check_due():
+            return
+        async with self._lock:
+            if self.is_loaded and not self._check_due():
+                return
+            async with primary_session(session) as primary:
+                age = time.monotonic() - self._loaded_at
+                if self.is_loaded and age < settings.SNAPSHOT_MAX_AGE_SECONDS:
+                    version = await self.version(primary)
+                    self._checked_at = time.monotonic()
+                    if version == self._version:
+                        return
+                await self.load(primary)
+
+    async def load(self, session: AsyncSession) -> None:
+        """Rebuild the snapshot from the database.
+
+        The version is read before the rows, so a write landing in between
+        is picked up by the next check. If `invalidate()` is called while
+        the rebuild is running, the new copy is installed but the snapshot
+        stays stale so the next lookup picks up the concurrent change.
+
+        Args:
+            session: Database session used for the rebuild queries
+        """
+        generation = self._generation
+        version = await self.version(session)
+        await self._rebuild(session)
+        self._version = version
+        self._checked_at = self._loaded_at = time.monotonic()
+        self._loaded = generation == self._generation
@@ -3,14 +3,20 @@ Supplier service.
 Business logic layer cho Supplier operations.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached, get_cache
+from app.core.constants import CACHE_TTL_MEDIUM, CACHE_TTL_SHORT
+from app.core.etag import make_etag
+from app.core.singleflight import coalesce
+from app.db.session import after_commit
 from app.models.supplier import Supplier
 from app.repositories.supplier import SupplierRepository
-from app.schemas.supplier import SupplierCreate, SupplierUpdate
+from app.schemas.supplier import SupplierCreate, SupplierList, SupplierRead, SupplierUpdate
+from app.services.catalog_index import product_mapping_index
 
 
 class SupplierService:
@@ -18,6 +24,11 @@ class SupplierService:
     
     Handles validation, business rules, and orchestrates
     repository operations for suppliers.
+    
+    Read methods return schemas, are cached, and concurrent cache misses
+    for the same arguments share one query; writes invalidate the
+    "suppliers" (lists) and "supplier:{id}" (detail) cache tags once the
+    request's unit of work commits.
     """
     
     def __init__(self, session: AsyncSession):
@@ -75,15 +86,89 @@ class SupplierService:
             supplier.created_by = created_by
             supplier.updated_by = created_by
         
-        created_supplier = await self.repository.create(supplier)
-        await self.session.commit()
-        await self.session.refresh(created_supplier)
+        self.session.add(supplier)
+        await self.session.flush()
+        await self.session.refresh(supplier)
+        after_commit(self.session, get_cache().invalidate_tags, "suppliers")
         
-        return created_supplier
+        return supplier
     
-    async def get_supplier(self, supplier_id: int) -> Supplier:
+    @cached("supplier.get", ttl=CACHE_TTL_MEDIUM, tags=["supplier:{supplier_id}"])
+    @coalesce("supplier.get")
+    async def get_supplier(
+        self,
+        supplier_id: int,
+        version: Optional[str] = None
+    ) -> SupplierRead:
         """Get supplier by ID.
         
+        Args:
+            supplier_id: Supplier ID
+            version: Current ETag, if the caller has one. It is part of the
+                cache key, so an entry cached before a write on another
+                worker is never served under a newer ETag
+            
+        Returns:
+            Supplier details
+            
+        Raises:
+            HTTPException: If supplier not found
+        """
+        return SupplierRead.model_validate(await self._get_supplier_model(supplier_id))
+    
+    @cached("supplier.get_fields", ttl=CACHE_TTL_MEDIUM, tags=["supplier:{supplier_id}"])
+    @coalesce("supplier.get_fields")
+    async def get_supplier_fields(
+        self,
+        supplier_id: int,
+        fields: tuple[str, ...],
+        version: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Get selected columns of a supplier (sparse fieldsets).
+        
+        Args:
+            supplier_id: Supplier ID
+            fields: Column names to select
+            version: Current ETag, if the caller has one. It is part of the
+                cache key, so an entry cached before a write on another
+                worker is never served under a newer ETag
+            
+        Returns:
+            Dict of column values
+            
+        Raises:
+            HTTPException: If supplier not found
+        """
+        row = await self.repository.get_fields(supplier_id, fields)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Supplier with ID {supplier_id} not found"
+            )
+        return row
+    
+    async def get_supplier_etag(
+        self,
+        supplier_id: int,
+        fields: Optional[tuple[str, ...]] = None
+    ) -> Optional[str]:
+        """Get the ETag of a supplier from (id, updated_at).
+        
+        Args:
+            supplier_id: Supplier ID
+            fields: Sparse fieldset of the representation, if any
+            
+        Returns:
+            ETag, or None if the supplier does not exist
+        """
+        updated_at = await self.repository.get_version(supplier_id)
+        if updated_at is None:
+            return None
+        return make_etag("supplier", supplier_id, updated_at, fields)
+    
+    async def _get_supplier_model(self, supplier_id: int) -> Supplier:
+        """Load the supplier ORM object (uncached, for writes).
+        
         Args:
             supplier_id: Supplier ID
             
@@ -125,26 +210,82 @@ class SupplierService:
         
         return supplier
     
+    @cached("supplier.list", ttl=CACHE_TTL_SHORT, tags=["suppliers"])
+    @coalesce("supplier.list")
     async def list_suppliers(
         self,
         skip: int = 0,
         limit: int = 100,
-        active_only: bool = False
-    ) -> list[Supplier]:
+        is_active: Optional[bool] = None,
+        version: Optional[str] = None
+    ) -> tuple[list[SupplierList], int]:
         """List suppliers with pagination.
         
+        Supplier users only get their own supplier; the restriction is
+        applied in SQL by the repository scope.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
-            active_only: Only return active suppliers
+            is_active: Optional active status filter
+            version: Current ETag, if the caller has one. It is part of the
+                cache key, so an entry cached before a write on another
+                worker is never served under a newer ETag
             
         Returns:
-            List of suppliers
+            Tuple of (list of suppliers, total count)
         """
-        if active_only:
-            return await self.repository.get_active(skip, limit)
+        suppliers, total = await self.repository.list_suppliers(skip, limit, is_active)
+        return [SupplierList.model_validate(s) for s in suppliers], total
+    
+    @cached("supplier.list_fields", ttl=CACHE_TTL_SHORT, tags=["suppliers"])
+    @coalesce("supplier.list_fields")
+    async def list_supplier_fields(
+        self,
+        fields: tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        version: Optional[str] = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List selected columns of suppliers (sparse fieldsets).
         
-        return await self.repository.get_all(skip, limit)
+        Args:
+            fields: Column names to select
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            is_active: Optional active status filter
+            version: Current ETag, if the caller has one. It is part of the
+                cache key, so an entry cached before a write on another
+                worker is never served under a newer ETag
+            
+        Returns:
+            Tuple of (list of column dicts, total count)
+        """
+        return await self.repository.list_supplier_fields(fields, skip, limit, is_active)
+    
+    async def list_suppliers_etag(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        fields: Optional[tuple[str, ...]] = None
+    ) -> str:
+        """Get the ETag of a supplier list page from (max(updated_at), count).
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            is_active: Optional active status filter
+            fields: Sparse fieldset of the representation, if any
+            
+        Returns:
+            ETag
+        """
+        latest, count = await self.repository.get_query_version(
+            self.repository.list_query(is_active)
+        )
+        return make_etag("suppliers", latest, count, skip, limit, is_active, fields)
     
     async def search_suppliers(
         self,
@@ -184,7 +325,7 @@ class SupplierService:
             HTTPException: If supplier not found or validation fails
         """
         # Get existing supplier
-        supplier = await self.get_supplier(supplier_id)
+        supplier = await self._get_supplier_model(supplier_id)
         
         # Check code uniqueness if being updated
         if supplier_data.code and supplier_data.code != supplier.code:
@@ -217,8 +358,15 @@ class SupplierService:
             update_data["updated_by"] = updated_by
         
         updated_supplier = await self.repository.update(supplier_id, update_data)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(updated_supplier)
+        after_commit(
+            self.session, get_cache().invalidate_tags, "suppliers", f"supplier:{supplier_id}"
+        )
+        
+        # Supplier code is part of the catalog index key
+        if "code" in update_data:
+            after_commit(self.session, product_mapping_index.invalidate)
         
         return updated_supplier
     
@@ -242,7 +390,7 @@ class SupplierService:
             HTTPException: If supplier not found or cannot be deleted
         """
         # Get supplier
-        supplier = await self.get_supplier(supplier_id)
+        supplier = await self._get_supplier_model(supplier_id)
         
         # Check if can be deleted
         can_delete, reason = supplier.can_be_deleted()
@@ -256,9 +404,16 @@ class SupplierService:
         if hard_delete:
             success = await self.repository.delete(supplier_id)
         else:
-            success = await self.repository.soft_delete(supplier_id, deleted_by)
-        
-        await self.session.commit()
+            supplier.soft_delete()
+            if deleted_by is not None:
+                supplier.updated_by = deleted_by
+            success = True
+        
+        await self.session.flush()
+        after_commit(self.session, product_mapping_index.invalidate)
+        after_commit(
+            self.session, get_cache().invalidate_tags, "suppliers", f"supplier:{supplier_id}"
+        )
         
         return success
     
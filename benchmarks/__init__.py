@@ -0,0 +1,15 @@
+"""Benchmarks for the API hot paths.
+
+- ``benchmarks/test_*.py``: pytest-benchmark micro-benchmarks of the
+  repositories and the response serialization, on a seeded SQLite file::
+
+      pytest benchmarks --no-cov --benchmark-json=.benchmarks/micro.json
+
+- ``python -m benchmarks.load``: in-process ASGI load driver running the
+  whole application (startup, middleware, auth, database) against a
+  seeded database and reporting p50/p99 latency and throughput per
+  scenario as JSON; ``--compare`` prints the change from a previous run.
+
+The dataset (`benchmarks.dataset`) is generated deterministically, so two
+runs with the same size preset and database are comparable.
+"""
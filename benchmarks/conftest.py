@@ -0,0 +1,58 @@
+"""Benchmark fixtures: one seeded SQLite database per run.
+
+Set ``BENCH_SIZE`` (small, medium, full) to pick the dataset size.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.base import Base
+from benchmarks.dataset import SIZES, DatasetSize, seed
+
+
+@pytest.fixture(scope="session")
+def size() -> DatasetSize:
+    """Dataset size of this run."""
+    return SIZES[os.environ.get("BENCH_SIZE", "small")]
+
+
+@pytest.fixture(scope="session")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """Event loop the database is used from (benchmarks call it synchronously)."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(loop: asyncio.AbstractEventLoop) -> Callable[[Awaitable[Any]], Any]:
+    """Run a coroutine to completion on the benchmark loop."""
+    return loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def session(
+    tmp_path_factory: pytest.TempPathFactory,
+    size: DatasetSize,
+    run: Callable[[Awaitable[Any]], Any],
+) -> Generator[AsyncSession, None, None]:
+    """Session on a freshly seeded database file."""
+    path: Path = tmp_path_factory.mktemp("bench") / "bench.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    async def setup() -> AsyncSession:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = AsyncSession(engine, expire_on_commit=False)
+        await seed(session, size)
+        return session
+
+    session = run(setup())
+    yield session
+    run(session.close())
+    run(engine.dispose())
@@ -0,0 +1,178 @@
+"""Deterministic benchmark dataset.
+
+Suppliers and users are created with the bulk test factories
+(`tests.factories`); products and spend rows with chunked executemany
+inserts. The tree stores delivery notes only as their daily spend rollup
+rows, so each "delivery line" is one `DailySpendRollup` row for a distinct
+(day, restaurant, product) key, spread over two years.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from math import gcd
+from typing import Any, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analytics import DailySpendRollup, MonthlySupplierSpendRollup
+
+# Imported for their mappers, so every table exists and relationships resolve
+from app.models.item import Item  # noqa: F401
+from app.models.price_list import SupplierPriceList  # noqa: F401
+from app.models.product import Product, ProductCategory
+from app.models.user import UserRole
+from tests.factories import create_suppliers, create_users
+
+# First day of the seeded period
+START_DATE = date(2024, 1, 1)
+
+# Days covered by the spend rows
+DAYS = 730
+
+# Rows per INSERT round trip
+CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """Number of rows of each kind."""
+
+    restaurants: int
+    suppliers: int
+    products: int
+    users: int
+    delivery_lines: int
+
+
+SIZES = {
+    "small": DatasetSize(
+        restaurants=10, suppliers=200, products=200, users=20, delivery_lines=20_000
+    ),
+    "medium": DatasetSize(
+        restaurants=100, suppliers=2_000, products=2_000, users=200, delivery_lines=200_000
+    ),
+    "full": DatasetSize(
+        restaurants=100, suppliers=5_000, products=5_000, users=1_000, delivery_lines=2_000_000
+    ),
+}
+
+
+def supplier_of(product_id: int, size: DatasetSize) -> int:
+    """Supplier delivering a product (each product has one supplier)."""
+    return (product_id - 1) % size.suppliers + 1
+
+
+def _delivery_keys(size: DatasetSize) -> Iterator[tuple[int, int, int]]:
+    """Yield distinct (day, restaurant, product) keys spread over the key space.
+
+    Walks the key space with a stride coprime to its size, which visits
+    every key once in a scattered order.
+    """
+    total = DAYS * size.restaurants * size.products
+    if size.delivery_lines > total:
+        raise ValueError(f"At most {total} delivery lines fit this dataset size")
+    stride = 1_000_003
+    while gcd(stride, total) != 1:
+        stride += 2
+    for i in range(size.delivery_lines):
+        key = i * stride % total
+        key, product = divmod(key, size.products)
+        day, restaurant = divmod(key, size.restaurants)
+        yield day, restaurant + 1, product + 1
+
+
+async def _insert_chunks(session: AsyncSession, model: Any, rows: Iterator[dict]) -> int:
+    """Insert rows in chunks; returns the number of rows."""
+    count = 0
+    chunk: list[dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            await session.execute(insert(model), chunk)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        await session.execute(insert(model), chunk)
+        count += len(chunk)
+    return count
+
+
+async def seed(session: AsyncSession, size: DatasetSize) -> None:
+    """Fill an empty schema with the dataset and commit.
+
+    Args:
+        session: Session on the benchmark database.
+        size: Number of rows of each kind.
+    """
+    suppliers = await create_suppliers(session, size.suppliers)
+    await create_users(session, size.users)
+    await create_users(
+        session,
+        1,
+        start=0,
+        email="admin@aladdin.com",
+        role=UserRole.ALADDIN_ADMIN,
+        is_superuser=True,
+    )
+    await create_users(session, 1, start=size.users + 1, supplier=suppliers[0])
+
+    category = ProductCategory(code="BENCH", name="Thực phẩm")
+    session.add(category)
+    await session.flush()
+    await _insert_chunks(
+        session,
+        Product,
+        (
+            {
+                "code": f"SP{n:06d}",
+                "name": f"Sản phẩm {n}",
+                "category_id": category.id,
+                "unit": "kg",
+                "is_active": True,
+            }
+            for n in range(1, size.products + 1)
+        ),
+    )
+
+    monthly: dict[tuple[date, int, int], list] = {}
+
+    def daily_rows() -> Iterator[dict]:
+        for day, restaurant_id, product_id in _delivery_keys(size):
+            spend_date = START_DATE + timedelta(days=day)
+            supplier_id = supplier_of(product_id, size)
+            quantity = Decimal(product_id % 20 + 1)
+            amount = quantity * (1000 + product_id % 500 * 100)
+            totals = monthly.setdefault(
+                (spend_date.replace(day=1), supplier_id, restaurant_id), [Decimal(0), 0]
+            )
+            totals[0] += amount
+            totals[1] += 1
+            yield {
+                "spend_date": spend_date,
+                "supplier_id": supplier_id,
+                "restaurant_id": restaurant_id,
+                "product_id": product_id,
+                "quantity": quantity,
+                "amount": amount,
+                "line_count": 1,
+            }
+
+    await _insert_chunks(session, DailySpendRollup, daily_rows())
+    await _insert_chunks(
+        session,
+        MonthlySupplierSpendRollup,
+        (
+            {
+                "month": month,
+                "supplier_id": supplier_id,
+                "restaurant_id": restaurant_id,
+                "amount": amount,
+                "line_count": line_count,
+                "delivery_count": line_count,
+            }
+            for (month, supplier_id, restaurant_id), (amount, line_count) in monthly.items()
+        ),
+    )
+    await session.commit()
@@ -0,0 +1,75 @@
+"""
+Repository query benchmarks.
+"""
+
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.analytics import SpendRollupRepository
+from app.repositories.product import ProductRepository
+from app.repositories.supplier import SupplierRepository
+from benchmarks.dataset import DatasetSize
+
+Run = Callable[[Awaitable[Any]], Any]
+
+
+def test_supplier_get_by_code(benchmark, session: AsyncSession, run: Run):
+    repository = SupplierRepository(session)
+    supplier = benchmark(lambda: run(repository.get_by_code("SUP00042")))
+    assert supplier is not None
+
+
+def test_supplier_list_page(benchmark, session: AsyncSession, run: Run, size: DatasetSize):
+    repository = SupplierRepository(session)
+    skip = size.suppliers // 2
+    suppliers, total = benchmark(
+        lambda: run(repository.list_suppliers(skip=skip, limit=50, is_active=True))
+    )
+    assert total == size.suppliers and len(suppliers) == 50
+
+
+def test_supplier_list_fields_page(
+    benchmark, session: AsyncSession, run: Run, size: DatasetSize
+):
+    repository = SupplierRepository(session)
+    fields = ("id", "code", "name", "email", "phone", "is_active")
+    rows, total = benchmark(
+        lambda: run(repository.list_supplier_fields(fields, skip=size.suppliers // 2, limit=50))
+    )
+    assert total == size.suppliers and len(rows) == 50
+
+
+def test_supplier_search(benchmark, session: AsyncSession, run: Run):
+    repository = SupplierRepository(session)
+    suppliers = benchmark(lambda: run(repository.search_by_name("cung cấp 1", limit=20)))
+    assert suppliers
+
+
+def test_product_get(benchmark, session: AsyncSession, run: Run, size: DatasetSize):
+    repository = ProductRepository(session)
+
+    async def get() -> Any:
+        product = await repository.get(size.products // 2)
+        # Measure the query, not the identity map
+        session.expunge_all()
+        return product
+
+    assert benchmark(lambda: run(get())) is not None
+
+
+def test_spend_by_supplier_by_month(benchmark, session: AsyncSession, run: Run):
+    repository = SpendRollupRepository(session)
+    rows = benchmark(
+        lambda: run(repository.spend_by_supplier_by_month(date(2024, 1, 1), date(2024, 12, 1)))
+    )
+    assert rows
+
+
+def test_top_products(benchmark, session: AsyncSession, run: Run):
+    repository = SpendRollupRepository(session)
+    rows = benchmark(
+        lambda: run(repository.top_products(1, date(2024, 1, 1), date(2025, 12, 31)))
+    )
+    assert rows
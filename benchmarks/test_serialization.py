@@ -0,0 +1,51 @@
+"""
+Response serialization benchmarks: fast column rendering against Pydantic.
+"""
+
+from typing import Any, Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.serialization import column_plan, render_page
+from app.repositories.supplier import SupplierRepository
+from app.schemas.common import PaginatedResponse
+from app.schemas.supplier import SupplierList
+
+Run = Callable[[Awaitable[Any]], Any]
+
+
+@pytest.fixture(autouse=True)
+def no_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Measure the production path, without the Pydantic cross-check."""
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION_VERIFY", False)
+
+
+@pytest.fixture(scope="module")
+def page(session: AsyncSession, run: Run) -> tuple[list[dict], list[Any], int]:
+    """One page of 100 suppliers as column dicts and as ORM objects."""
+    repository = SupplierRepository(session)
+    plan = column_plan(SupplierList)
+    rows, total = run(repository.list_supplier_fields(plan.fields, limit=100))
+    suppliers, _ = run(repository.list_suppliers(limit=100))
+    return rows, suppliers, total
+
+
+def test_render_page_fast(benchmark, page: tuple[list[dict], list[Any], int]):
+    rows, _, total = page
+    plan = column_plan(SupplierList)
+    body = benchmark(render_page, plan, rows, total, 0, 100)
+    assert body.startswith(b'{"items":[')
+
+
+def test_render_page_pydantic(benchmark, page: tuple[list[dict], list[Any], int]):
+    _, suppliers, total = page
+
+    def render() -> bytes:
+        items = [SupplierList.model_validate(s) for s in suppliers]
+        return PaginatedResponse[SupplierList](
+            items=items, total=total, skip=0, limit=100
+        ).model_dump_json().encode()
+
+    assert benchmark(render).startswith(b'{"items":[')
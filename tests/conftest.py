@@ -1,21 +1,23 @@
 """Test configuration and fixtures."""
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import commit_session, get_db, get_read_db, needs_commit
 from app.main import app
 from app.models.base import Base
 from app.models.user import User, UserRole, UserType
+from tests.factories import create_suppliers, password_hash
 
 # Test database URL (SQLite in memory)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -29,50 +31,93 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
-@pytest_asyncio.fixture
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    # Create async engine
+@pytest.fixture(autouse=True)
+def reset_cache() -> Generator[None, None, None]:
+    """Give every test an empty cache with the in-memory shared tier."""
+    from app.core.cache import MemoryBackend, TieredCache, get_cache, set_cache
+
+    previous = get_cache()
+    set_cache(TieredCache(backend=MemoryBackend()))
+    yield
+    set_cache(previous)
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the API tests clear of rate limits."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def verify_fast_serialization(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check every fast-rendered response against the Pydantic path."""
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION_VERIFY", True)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the test database and its schema once per test run."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    
-    # Create tables
+
+    # The sqlite3 driver starts transactions lazily and never SAVEPOINTs;
+    # let SQLAlchemy emit BEGIN itself so nested transactions work
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin(conn: Connection) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Create session factory
-    async_session_maker = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    
-    # Yield session
-    async with async_session_maker() as session:
-        yield session
-    
-    # Drop tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+
+    yield engine
+
     await engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def test_db(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session.
+
+    The test runs inside a transaction that is rolled back afterwards;
+    commits in the session only release a SAVEPOINT, so every test starts
+    from the empty schema without rebuilding it.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        await transaction.rollback()
+
+
 @pytest.fixture
 def client(test_db: AsyncSession) -> Generator[TestClient, None, None]:
     """Create test client with database override."""
-    
+
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield test_db
-    
+        if needs_commit(test_db):
+            await commit_session(test_db)
+
     app.dependency_overrides[get_db] = override_get_db
-    
+    app.dependency_overrides[get_read_db] = override_get_db
+
     with TestClient(app) as test_client:
         yield test_client
-    
+
     app.dependency_overrides.clear()
 
 
@@ -81,27 +126,55 @@ async def async_client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, Non
     """Create async test client."""
     from httpx import ASGITransport
     from app.api.deps import get_db_session
-    
+
     async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield test_db
-    
+        if needs_commit(test_db):
+            await commit_session(test_db)
+
     # Override get_db_session directly
     app.dependency_overrides[get_db_session] = override_get_db_session
-    
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def api(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """Async client authenticated as an unscoped Aladdin user.
+
+    Bypasses token authentication so endpoint tests do not depend on the
+    auth flow.
+    """
+    from types import SimpleNamespace
+
+    from httpx import ASGITransport
+
+    from app.api.deps import get_current_active_user
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        yield test_db
+        if needs_commit(test_db):
+            await commit_session(test_db)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=1)
+
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
-    
+
     app.dependency_overrides.clear()
 
 
 @pytest_asyncio.fixture
 async def sample_aladdin_admin(test_db: AsyncSession) -> User:
     """Create sample Aladdin admin user for testing."""
-    from app.core.security import get_password_hash
-    
     user = User(
         email="admin@aladdin.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash(),
         user_type=UserType.ALADDIN,
         role=UserRole.ALADDIN_ADMIN,
         first_name="Admin",
@@ -109,22 +182,20 @@ async def sample_aladdin_admin(test_db: AsyncSession) -> User:
         is_active=True,
         is_verified=True,
     )
-    
+
     test_db.add(user)
     await test_db.commit()
     await test_db.refresh(user)
-    
+
     return user
 
 
 @pytest_asyncio.fixture
 async def sample_aladdin_staff(test_db: AsyncSession) -> User:
     """Create sample Aladdin staff user for testing."""
-    from app.core.security import get_password_hash
-    
     user = User(
         email="staff@aladdin.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash(),
         user_type=UserType.ALADDIN,
         role=UserRole.ALADDIN_STAFF,
         first_name="Staff",
@@ -132,22 +203,20 @@ async def sample_aladdin_staff(test_db: AsyncSession) -> User:
         is_active=True,
         is_verified=True,
     )
-    
+
     test_db.add(user)
     await test_db.commit()
     await test_db.refresh(user)
-    
+
     return user
 
 
 @pytest_asyncio.fixture
 async def sample_supplier_admin(test_db: AsyncSession, sample_supplier) -> User:
     """Create sample supplier admin user for testing."""
-    from app.core.security import get_password_hash
-    
     user = User(
         email="supplier@example.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash(),
         user_type=UserType.SUPPLIER,
         role=UserRole.SUPPLIER_ADMIN,
         first_name="Supplier",
@@ -156,11 +225,11 @@ async def sample_supplier_admin(test_db: AsyncSession, sample_supplier) -> User:
         is_active=True,
         is_verified=True,
     )
-    
+
     test_db.add(user)
     await test_db.commit()
     await test_db.refresh(user)
-    
+
     return user
 
 
@@ -176,7 +245,7 @@ async def auth_headers_aladdin_admin(
             "password": "password123",
         },
     )
-    
+
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
 
@@ -193,7 +262,7 @@ async def auth_headers_supplier_admin(
             "password": "password123",
         },
     )
-    
+
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
 
@@ -202,7 +271,7 @@ async def auth_headers_supplier_admin(
 async def sample_supplier(test_db: AsyncSession):
     """Create sample supplier for testing."""
     from app.models.supplier import Supplier
-    
+
     supplier = Supplier(
         code="SUP001",
         name="Test Supplier Co., Ltd.",
@@ -216,49 +285,40 @@ async def sample_supplier(test_db: AsyncSession):
         description="A test supplier for unit testing",
         is_active=True,
     )
-    
+
     test_db.add(supplier)
     await test_db.commit()
     await test_db.refresh(supplier)
-    
+
     return supplier
 
 
 @pytest_asyncio.fixture
 async def multiple_suppliers(test_db: AsyncSession):
     """Create multiple suppliers for pagination testing."""
-    from app.models.supplier import Supplier
-    
-    suppliers = []
-    for i in range(1, 11):  # Create 10 suppliers
-        supplier = Supplier(
-            code=f"SUP{i+100:03d}",
-            name=f"Supplier {i}",
-            email=f"supplier{i}@example.com",
-            phone=f"012345678{i}",
-            tax_code=f"TAX{i:09d}" if i % 2 == 0 else None,
-            address=f"{i} Test Street",
-            contact_person=f"Contact {i}",
-            contact_phone=f"098765432{i}",
-            contact_email=f"contact{i}@supplier{i}.com",
-            is_active=i % 2 == 1,  # Odd numbers are active
-        )
-        test_db.add(supplier)
-        suppliers.append(supplier)
-    
+    suppliers = await create_suppliers(
+        test_db,
+        10,
+        code=lambda i: f"SUP{i+100:03d}",
+        name=lambda i: f"Supplier {i}",
+        phone=lambda i: f"012345678{i}",
+        tax_code=lambda i: f"TAX{i:09d}" if i % 2 == 0 else None,
+        address=lambda i: f"{i} Test Street",
+        contact_person=lambda i: f"Contact {i}",
+        contact_phone=lambda i: f"098765432{i}",
+        contact_email=lambda i: f"contact{i}@supplier{i}.com",
+        is_active=lambda i: i % 2 == 1,  # Odd numbers are active
+    )
     await test_db.commit()
-    for supplier in suppliers:
-        await test_db.refresh(supplier)
-    
+
     return suppliers
 
 
 @pytest_asyncio.fixture
 async def sample_supplier_with_users(test_db: AsyncSession):
     """Create supplier with associated users for deletion testing."""
-    from app.core.security import get_password_hash
     from app.models.supplier import Supplier
-    
+
     supplier = Supplier(
         code="SUP200",
         name="Supplier with Users",
@@ -267,11 +327,11 @@ async def sample_supplier_with_users(test_db: AsyncSession):
     )
     test_db.add(supplier)
     await test_db.flush()
-    
+
     # Create a user for this supplier
     user = User(
         email="user@supplier200.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash(),
         user_type=UserType.SUPPLIER,
         role=UserRole.SUPPLIER_ADMIN,
         first_name="Supplier",
@@ -281,11 +341,11 @@ async def sample_supplier_with_users(test_db: AsyncSession):
         is_verified=True,
     )
     test_db.add(user)
-    
+
     await test_db.commit()
     await test_db.refresh(supplier)
     await test_db.refresh(user)
-    
+
     return supplier
 
 
@@ -293,18 +353,18 @@ async def sample_supplier_with_users(test_db: AsyncSession):
 async def inactive_supplier(test_db: AsyncSession):
     """Create inactive supplier for activation testing."""
     from app.models.supplier import Supplier
-    
+
     supplier = Supplier(
         code="SUP999",
         name="Inactive Supplier",
         email="inactive@supplier.com",
         is_active=False,
     )
-    
+
     test_db.add(supplier)
     await test_db.commit()
     await test_db.refresh(supplier)
-    
+
     return supplier
 
 
@@ -315,7 +375,7 @@ async def admin_token_headers(
 ) -> dict[str, str]:
     """Get authentication headers for admin user."""
     from app.core.security import create_access_token
-    
+
     token = create_access_token(subject=sample_aladdin_admin.id)
     return {"Authorization": f"Bearer {token}"}
 
@@ -327,6 +387,6 @@ async def user_token_headers(
 ) -> dict[str, str]:
     """Get authentication headers for regular user."""
     from app.core.security import create_access_token
-    
+
     token = create_access_token(subject=sample_aladdin_staff.id)
     return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,106 @@
+"""
+Tests for batch reads by ID and request-scoped DataLoaders.
+"""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dataloader import DataLoader
+from app.core.scope import supplier_scope
+from app.models.supplier import Supplier
+from app.repositories.supplier import SupplierRepository
+from app.services.loaders import Loaders
+
+
+class TestGetMany:
+    """Test BaseRepository.get_many."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_reports_missing(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Records come back in request order; unknown IDs are reported."""
+        ids = [multiple_suppliers[3].id, 999999, multiple_suppliers[0].id, multiple_suppliers[3].id]
+        found, missing = await SupplierRepository(test_db).get_many(ids)
+        assert [s.id for s in found] == [multiple_suppliers[3].id, multiple_suppliers[0].id]
+        assert missing == [999999]
+
+    @pytest.mark.asyncio
+    async def test_out_of_scope_ids_are_missing(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Rows of other suppliers are reported as missing."""
+        own, other = multiple_suppliers[0], multiple_suppliers[1]
+        with supplier_scope(own.id):
+            found, missing = await SupplierRepository(test_db).get_many([own.id, other.id])
+        assert [s.id for s in found] == [own.id]
+        assert missing == [other.id]
+
+
+class TestDataLoader:
+    """Test batching and caching of the DataLoader."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_batched(self):
+        """Loads in the same tick share one batch call; repeats are cached."""
+        calls: list[list[int]] = []
+
+        async def batch_load(keys: list[int]) -> dict[int, str]:
+            calls.append(keys)
+            return {k: f"v{k}" for k in keys if k != 3}
+
+        loader = DataLoader(batch_load)
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+        assert results == ["v1", "v2", "v1"]
+        assert await loader.load_many([2, 3]) == ["v2", None]
+        assert calls == [[1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_supplier_loader_uses_one_query(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Lookups from concurrent tasks resolve with one IN query."""
+        loaders = Loaders(test_db)
+        results = await asyncio.gather(*(loaders.suppliers.load(s.id) for s in multiple_suppliers))
+        assert [s.code for s in results] == [s.code for s in multiple_suppliers]
+        assert loaders.suppliers.batches == 1
+
+
+class TestBatchEndpoint:
+    """Test GET /suppliers?ids=."""
+
+    @pytest.mark.asyncio
+    async def test_batch_read(
+        self,
+        api: AsyncClient,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Suppliers come back in request order with missing IDs."""
+        ids = [multiple_suppliers[2].id, 999999, multiple_suppliers[1].id]
+        response = await api.get(
+            "/api/v1/suppliers", params={"ids": ",".join(map(str, ids)), "fields": "code"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [
+                {"id": multiple_suppliers[2].id, "code": multiple_suppliers[2].code},
+                {"id": multiple_suppliers[1].id, "code": multiple_suppliers[1].code},
+            ],
+            "missing": [999999],
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalid_ids(self, api: AsyncClient):
+        """Non-integer or too many IDs are rejected."""
+        assert (await api.get("/api/v1/suppliers", params={"ids": "1,x"})).status_code == 400
+        too_many = ",".join(str(i) for i in range(1, 102))
+        assert (await api.get("/api/v1/suppliers", params={"ids": too_many})).status_code == 400
@@ -0,0 +1,47 @@
+"""
+Tests for the load driver of the benchmark suite.
+"""
+
+from collections import Counter
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.dataset import DatasetSize
+from benchmarks.load import SCENARIOS, compare, percentile, run_scenario, summarize
+from tests.factories import create_suppliers
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summary_and_comparison():
+    summary = summarize([0.001, 0.002, 0.004], Counter({200: 2, 500: 1}), errors=1, elapsed=0.5)
+    assert summary["requests"] == 3 and summary["errors"] == 1
+    assert summary["throughput_rps"] == 6.0
+    assert (summary["p50_ms"], summary["max_ms"]) == (2.0, 4.0)
+
+    faster = {**summary, "p50_ms": 1.0}
+    table = compare({"scenarios": {"x": faster}}, {"scenarios": {"x": summary}})
+    assert "-50%" in table
+
+
+async def test_run_scenario_against_the_api(api: AsyncClient, test_db: AsyncSession):
+    """The driver sends every request and counts only unexpected statuses as errors."""
+    await create_suppliers(test_db, 60)
+    await test_db.commit()
+    size = DatasetSize(restaurants=1, suppliers=60, products=1, users=1, delivery_lines=0)
+    scenario = next(s for s in SCENARIOS if s.name == "supplier_list")
+
+    # One request at a time: every request shares the test session
+    result = await run_scenario(api, scenario, size, requests=12, concurrency=1)
+
+    assert result["requests"] == 12
+    assert result["errors"] == 0
+    assert result["statuses"] == {"200": 12}
+    assert 0 < result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
@@ -0,0 +1,155 @@
+"""
+Tests for the two-tier service cache.
+"""
+
+import time
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import (
+    LocalCache,
+    MemoryBackend,
+    TieredCache,
+    get_cache,
+    init_cache,
+    make_key,
+    set_cache,
+)
+from app.core.config import settings
+from app.core.constants import CACHE_TTL_SHORT
+from app.core.scope import supplier_scope
+from app.db.session import commit_session
+from app.models.supplier import Supplier
+from app.schemas.supplier import SupplierRead, SupplierUpdate
+from app.services.supplier_service import SupplierService
+
+
+class TestLocalCache:
+    """Test the in-process LRU tier."""
+
+    def test_lru_eviction_and_tags(self):
+        """Least recently used entries go first; tags drop their entries."""
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1, ttl=60, tags=["t1"])
+        cache.set("b", 2, ttl=60, tags=["t2"])
+        assert cache.get("a") == (True, 1)
+
+        cache.set("c", 3, ttl=60, tags=["t1"])
+        assert cache.get("b") == (False, None)
+
+        cache.invalidate_tags(["t1"])
+        assert len(cache) == 0
+
+    def test_expired_entry_is_a_miss(self):
+        """Entries past their TTL are not returned."""
+        cache = LocalCache()
+        cache.set("a", 1, ttl=0)
+        assert cache.get("a") == (False, None)
+
+
+class TestTieredCache:
+    """Test L1 + L2 behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_hit_is_deserialized(self):
+        """An entry written by another worker is read back from L2 as a schema."""
+        backend = MemoryBackend()
+        adapter = TypeAdapter(tuple[list[int], int])
+        writer = TieredCache(backend=backend)
+        reader = TieredCache(backend=backend)
+
+        await writer.set("k", ([1, 2], 2), adapter, ttl=60, tags=("t",))
+        assert await reader.get("k", adapter, 60, ("t",)) == (True, ([1, 2], 2))
+
+        await writer.invalidate_tags("t")
+        reader.local.clear()
+        assert await reader.get("k", adapter, 60, ("t",)) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers_l1(self):
+        """Invalidating on one worker drops the entry from every worker's L1."""
+        backend = MemoryBackend()
+        adapter = TypeAdapter(int)
+        writer = TieredCache(backend=backend)
+        reader = TieredCache(backend=backend)
+        await reader.set("k", 1, adapter, ttl=300, tags=("t",))
+
+        await writer.invalidate_tags("t")
+        assert reader.local.get("k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_local_ttl_is_always_capped(self):
+        """Without a shared tier L1 entries still expire after CACHE_TTL_SHORT."""
+        cache = TieredCache()
+        await cache.set("k", 1, TypeAdapter(int), ttl=3600, tags=())
+        expires_at = cache.local._entries["k"][0]
+        assert expires_at - time.monotonic() <= CACHE_TTL_SHORT
+
+    @pytest.mark.asyncio
+    async def test_workers_without_shared_tier_disable_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Several workers need a shared tier to invalidate each other."""
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+        previous = get_cache()
+        try:
+            monkeypatch.setattr(settings, "WORKERS", 4)
+            await init_cache()
+            assert not get_cache().enabled
+
+            monkeypatch.setattr(settings, "WORKERS", 1)
+            await init_cache()
+            assert get_cache().enabled
+        finally:
+            set_cache(previous)
+
+    def test_key_depends_on_scope(self):
+        """Different principals never share a key."""
+        with supplier_scope(1):
+            scoped = make_key("supplier.get", {"supplier_id": 5})
+        assert make_key("supplier.get", {"supplier_id": 5}) != scoped
+
+
+class TestCachedSupplierService:
+    """Test the cached read methods of SupplierService."""
+
+    @pytest.mark.asyncio
+    async def test_get_supplier_is_cached_until_update(
+        self,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+    ):
+        """Repeated reads hit the cache; an update invalidates the entry."""
+        service = SupplierService(test_db)
+        cache = get_cache()
+
+        first = await service.get_supplier(sample_supplier.id)
+        second = await service.get_supplier(sample_supplier.id)
+        assert isinstance(first, SupplierRead)
+        assert second is first
+        assert cache.hits == 1
+
+        await service.update_supplier(sample_supplier.id, SupplierUpdate(name="Renamed"))
+        await commit_session(test_db)
+        assert (await service.get_supplier(sample_supplier.id)).name == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_list_served_from_cache_until_invalidated(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """List pages are served from cache until their tag is invalidated."""
+        service = SupplierService(test_db)
+        _, total = await service.list_suppliers()
+        assert total == len(multiple_suppliers)
+
+        test_db.add(Supplier(code="SUP999", name="Out of band", email="oob@example.com", is_active=True))
+        await test_db.commit()
+        assert (await service.list_suppliers())[1] == total
+
+        await get_cache().invalidate_tags("suppliers")
+        assert (await service.list_suppliers())[1] == total + 1
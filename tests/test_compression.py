@@ -0,0 +1,103 @@
+"""
+Tests for the response compression middleware.
+"""
+
+import orjson
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, _gzip, is_compressible, negotiate
+
+PAYLOAD = orjson.dumps(
+    [{"id": i, "code": f"SUP{i:03d}", "name": "Nhà cung cấp"} for i in range(200)]
+)
+
+
+async def json_endpoint(request):
+    return Response(PAYLOAD, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+async def small_endpoint(request):
+    return Response(b'{"ok":true}', media_type="application/json")
+
+
+async def image_endpoint(request):
+    return Response(PAYLOAD, media_type="image/png")
+
+
+async def stream_endpoint(request):
+    async def chunks():
+        yield PAYLOAD
+        yield PAYLOAD
+
+    return StreamingResponse(chunks(), media_type="text/csv")
+
+
+def make_client(**options) -> AsyncClient:
+    """Client for a small app wrapped in the middleware."""
+    app = Starlette(routes=[
+        Route("/json", json_endpoint),
+        Route("/small", small_endpoint),
+        Route("/image", image_endpoint),
+        Route("/stream", stream_endpoint),
+    ])
+    wrapped = CompressionMiddleware(app, encoders={"gzip": _gzip}, **options)
+    return AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test")
+
+
+class TestNegotiation:
+    """Test Accept-Encoding negotiation."""
+
+    def test_prefers_client_weights_then_server_order(self):
+        """q-values win; ties go to the server's preferred encoding."""
+        encoders = {"zstd": _gzip, "br": _gzip, "gzip": _gzip}
+        assert negotiate("gzip, br, zstd", encoders) == "zstd"
+        assert negotiate("gzip, br;q=0.5", encoders) == "gzip"
+        assert negotiate("*", encoders) == "zstd"
+        assert negotiate("br;q=0, gzip;q=0", encoders) is None
+        assert negotiate("identity", encoders) is None
+        assert negotiate("br", {"gzip": _gzip}) is None
+
+    def test_compressible_types(self):
+        """Already compressed media types are skipped."""
+        assert is_compressible("application/json")
+        assert is_compressible("text/csv; charset=utf-8")
+        assert is_compressible("image/svg+xml")
+        assert not is_compressible("image/png")
+        assert not is_compressible("application/zip")
+
+
+class TestMiddleware:
+    """Test which responses get compressed."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("thread_min_size", [0, 10 * 1024 * 1024])
+    async def test_large_json_is_compressed(self, thread_min_size: int):
+        """JSON above the minimum size is gzipped, inline or in a thread."""
+        async with make_client(thread_min_size=thread_min_size) as client:
+            response = await client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(PAYLOAD)
+        assert response.content == PAYLOAD
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/small", "/image", "/stream"])
+    async def test_skipped_responses(self, path: str):
+        """Small, already compressed and streamed bodies pass through."""
+        async with make_client() as client:
+            response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_client_without_support(self):
+        """Clients that accept no supported coding get the plain body."""
+        async with make_client() as client:
+            response = await client.get("/json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == PAYLOAD
@@ -0,0 +1,95 @@
+"""
+Tests for ETag / If-None-Match conditional GETs.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import etag_matches, make_etag
+from app.models.supplier import Supplier
+
+
+def test_etag_matching():
+    """If-None-Match uses weak comparison and accepts lists and '*'."""
+    etag = make_etag("supplier", 1, "2024-01-01")
+    assert etag.startswith('W/"')
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'W/"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+class TestConditionalSupplierGets:
+    """Test 304 responses on supplier endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_detail_not_modified_until_updated(
+        self,
+        api: AsyncClient,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+    ):
+        """The detail ETag follows updated_at."""
+        url = f"/api/v1/suppliers/{sample_supplier.id}"
+        first = await api.get(url)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await api.get(url, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+        sample_supplier.updated_at = sample_supplier.updated_at.replace(year=2100)
+        await test_db.commit()
+        third = await api.get(url, headers={"If-None-Match": etag})
+        assert third.status_code == 200
+        assert third.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_list_etag_changes_with_rows(
+        self,
+        api: AsyncClient,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Adding a row or changing the page changes the list ETag."""
+        first = await api.get("/api/v1/suppliers", params={"limit": 5})
+        etag = first.headers["etag"]
+        assert (
+            await api.get("/api/v1/suppliers", params={"limit": 5}, headers={"If-None-Match": etag})
+        ).status_code == 304
+        assert (
+            await api.get("/api/v1/suppliers", params={"limit": 6}, headers={"If-None-Match": etag})
+        ).status_code == 200
+
+        test_db.add(Supplier(code="SUP999", name="New", email="new@example.com", is_active=True))
+        await test_db.commit()
+        assert (
+            await api.get("/api/v1/suppliers", params={"limit": 5}, headers={"If-None-Match": etag})
+        ).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_etag_never_paired_with_stale_cached_body(
+        self,
+        api: AsyncClient,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+    ):
+        """A write this worker's cache did not see still changes the body with the ETag."""
+        url = f"/api/v1/suppliers/{sample_supplier.id}"
+        first = await api.get(url)
+        assert first.json()["name"] == sample_supplier.name
+
+        # Written by another worker: no invalidation reaches this cache
+        sample_supplier.name = "Renamed elsewhere"
+        sample_supplier.updated_at = sample_supplier.updated_at.replace(year=2100)
+        await test_db.commit()
+
+        second = await api.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 200
+        assert second.json()["name"] == "Renamed elsewhere"
+        third = await api.get(url, headers={"If-None-Match": second.headers["etag"]})
+        assert third.status_code == 304
@@ -0,0 +1,46 @@
+"""
+Tests for the transactional database fixture and the bulk factories.
+"""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import verify_password
+from app.models.supplier import Supplier
+from app.models.user import User, UserType
+from tests.factories import DEFAULT_PASSWORD, create_suppliers, create_users
+
+
+async def test_committed_rows_are_visible_within_the_test(test_db: AsyncSession):
+    """Commits release a savepoint; the rows stay readable until the test ends."""
+    await create_suppliers(test_db, 3)
+    await test_db.commit()
+    assert await test_db.scalar(select(func.count()).select_from(Supplier)) == 3
+
+
+async def test_each_test_starts_empty(test_db: AsyncSession):
+    """Rows committed by the previous test were rolled back."""
+    assert await test_db.scalar(select(func.count()).select_from(Supplier)) == 0
+
+
+async def test_rollback_keeps_earlier_commits(test_db: AsyncSession):
+    """A rollback in the test only undoes work since the last commit."""
+    await create_suppliers(test_db, 1)
+    await test_db.commit()
+    await create_suppliers(test_db, 1, start=2)
+    await test_db.rollback()
+    assert await test_db.scalar(select(func.count()).select_from(Supplier)) == 1
+
+
+async def test_bulk_factories(test_db: AsyncSession):
+    """Thousands of rows are created in one statement per factory call."""
+    suppliers = await create_suppliers(test_db, 2000, is_active=lambda n: n % 2 == 0)
+    users = await create_users(test_db, 500, supplier=suppliers[0])
+    await test_db.commit()
+
+    assert [s.code for s in suppliers[:2]] == ["SUP00001", "SUP00002"]
+    assert [s.is_active for s in suppliers[:2]] == [False, True]
+    assert all(u.supplier_id == suppliers[0].id for u in users)
+    assert users[0].user_type == UserType.SUPPLIER
+    assert verify_password(DEFAULT_PASSWORD, users[0].hashed_password)
+    assert await test_db.scalar(select(func.count()).select_from(User)) == 500
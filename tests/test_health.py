@@ -1,6 +1,17 @@
 """Test health check endpoints."""
 
+import asyncio
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.health import HealthMonitor, health_monitor
 
 
 def test_health_check(client: TestClient) -> None:
@@ -29,3 +40,69 @@ def test_root_endpoint(client: TestClient) -> None:
     data = response.json()
     assert "message" in data
     assert "version" in data
+
+
+def test_liveness(client: TestClient) -> None:
+    """Test liveness endpoint."""
+    response = client.get("/api/v1/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_readiness(client: TestClient) -> None:
+    """Test readiness endpoint probes the database."""
+    health_monitor.reset()
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["database"]["status"] == "ok"
+    assert response.headers["cache-control"] == "no-store"
+
+
+@pytest_asyncio.fixture
+async def pooled_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """Engine with a one-connection queue pool."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'health.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_probe_result_is_cached(
+    pooled_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Polls within the TTL reuse the report; concurrent polls share a probe."""
+    monkeypatch.setattr(settings, "HEALTH_CACHE_TTL", 60)
+    monitor = HealthMonitor(pooled_engine)
+    reports = await asyncio.gather(*(monitor.check() for _ in range(5)))
+    await monitor.check()
+    
+    assert monitor.probes == 1
+    assert all(report.status == "ready" for report in reports)
+    assert reports[0].pool.capacity == 1
+    assert reports[0].cache.status == "ok"
+
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_is_not_ready(
+    pooled_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With every connection checked out the worker reports not ready."""
+    monkeypatch.setattr(settings, "HEALTH_PROBE_TIMEOUT", 0.1)
+    monitor = HealthMonitor(pooled_engine)
+    
+    async with pooled_engine.connect():
+        report = await monitor.check()
+    
+    assert report.status == "not_ready"
+    assert report.pool.saturation == 1.0
+    assert report.database.status == "timeout"
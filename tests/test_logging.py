@@ -0,0 +1,90 @@
+"""
+Tests for the logging pipeline (sampling, batching, JSON output).
+"""
+
+import io
+import logging
+
+import orjson
+from loguru import logger
+
+from app.core.logging import BatchedStream, LogSampler, _json_format
+
+
+def make_record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Build a stdlib log record."""
+    return logging.LogRecord(name, level, __file__, 1, "message", (), None)
+
+
+class TestLogSampler:
+    """Test sampling of noisy stdlib loggers."""
+
+    def test_keeps_one_in_n_for_logger_and_children(self):
+        """A rate covers child loggers; warnings and other loggers always pass."""
+        sampler = LogSampler({"sqlalchemy.engine": 0.25})
+        kept = [sampler.filter(make_record("sqlalchemy.engine.Engine")) for _ in range(8)]
+        assert kept.count(True) == 2
+        assert sampler.filter(make_record("sqlalchemy.engine.Engine", logging.WARNING))
+        assert sampler.filter(make_record("sqlalchemy.pool"))
+        assert sampler.filter(make_record("app"))
+
+    def test_zero_rate_drops_all(self):
+        """A rate of 0 silences everything below WARNING."""
+        sampler = LogSampler({"uvicorn.access": 0})
+        assert not any(sampler.filter(make_record("uvicorn.access")) for _ in range(5))
+        assert sampler.filter(make_record("uvicorn.access", logging.ERROR))
+
+
+class TestBatchedStream:
+    """Test batched writes."""
+
+    def test_writes_when_batch_is_full_and_on_stop(self):
+        """Lines are written together once batch_size is reached, the rest on stop."""
+        out = io.StringIO()
+        stream = BatchedStream(out, batch_size=2, flush_interval=60)
+        stream.write("a\n")
+        assert out.getvalue() == ""
+        stream.write("b\n")
+        stream.write("c\n")
+        assert out.getvalue() == "a\nb\n"
+        stream.stop()
+        assert out.getvalue() == "a\nb\nc\n"
+
+    def test_errors_are_written_at_once(self):
+        """An ERROR record flushes the batch through the loguru sink."""
+        out = io.StringIO()
+        stream = BatchedStream(out, batch_size=100, flush_interval=60)
+        handler_id = logger.add(stream, format="{message}")
+        try:
+            logger.info("first")
+            assert out.getvalue() == ""
+            logger.error("second")
+            assert out.getvalue() == "first\nsecond\n"
+        finally:
+            logger.remove(handler_id)
+
+
+class TestJsonFormat:
+    """Test LOG_FORMAT=json output."""
+
+    def test_one_json_object_per_line(self):
+        """Records render as JSON with logger name, context and exception."""
+        lines: list[str] = []
+        handler_id = logger.add(lines.append, format=_json_format)
+        try:
+            log = logger.bind(logger="app.test", supplier_id=7)
+            log.info("price {not a placeholder}")
+            try:
+                raise ValueError("bad")
+            except ValueError:
+                log.exception("failed")
+        finally:
+            logger.remove(handler_id)
+
+        info, error = (orjson.loads(str(line)) for line in lines)
+        assert info["message"] == "price {not a placeholder}"
+        assert info["logger"] == "app.test"
+        assert info["level"] == "INFO"
+        assert info["extra"] == {"supplier_id": 7}
+        assert "exception" not in info
+        assert "ValueError: bad" in error["exception"]
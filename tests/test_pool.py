@@ -0,0 +1,78 @@
+"""
+Tests for connection pool warmup and adaptive pool sizing.
+"""
+
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from app.core.health import pool_status
+from app.db.pool import AdaptiveQueuePool, PoolSizer, warm_pool
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """Engine with a three-connection adaptive pool."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=AdaptiveQueuePool,
+        pool_size=3,
+        max_overflow=2,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_opens_pool_size_connections(engine: AsyncEngine):
+    """Warmup leaves one idle connection per pool slot."""
+    assert await warm_pool(engine) == 3
+    assert engine.pool.checkedin() == 3
+    assert engine.pool.checkedout() == 0
+    assert pool_status(engine).checkouts == 3
+
+
+@pytest.mark.asyncio
+async def test_resize_keeps_checkout_accounting(engine: AsyncEngine):
+    """Connections beyond a shrunk pool are closed when returned."""
+    pool = engine.pool
+    connections = [await engine.connect().start() for _ in range(3)]
+    pool.resize(1)
+    assert (pool.size(), pool.checkedout()) == (1, 3)
+    for connection in connections:
+        await connection.close()
+    assert (pool.checkedin(), pool.checkedout()) == (1, 0)
+
+    pool.resize(4)
+    await warm_pool(engine)
+    assert (pool.size(), pool.checkedin(), pool.resizes) == (4, 4, 2)
+
+
+@pytest.mark.asyncio
+async def test_sizer_grows_on_waits_and_shrinks_when_idle(
+    engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Slow checkouts grow the pool; idle intervals shrink it down to the minimum."""
+    monkeypatch.setattr(settings, "DATABASE_POOL_MIN_SIZE", 2)
+    monkeypatch.setattr(settings, "DATABASE_POOL_MAX_SIZE", 4)
+    monkeypatch.setattr(settings, "DATABASE_POOL_TARGET_WAIT_MS", 5.0)
+    pool = engine.pool
+    sizer = PoolSizer(lambda: [engine], interval=60)
+
+    # Ten checkouts waiting 50 ms on average
+    pool.checkouts, pool.wait_total = 10, 0.5
+    sizer.adjust()
+    assert pool.size() == 4
+    pool.checkouts, pool.wait_total = 20, 1.0
+    sizer.adjust()
+    assert pool.size() == 4
+
+    for expected in (3, 2, 2):
+        sizer.adjust()
+        assert pool.size() == expected
+    assert pool_status(engine).resizes == 3
@@ -0,0 +1,226 @@
+"""
+Tests for supplier price lists and point-in-time price resolution.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.scope import supplier_scope
+from app.db.session import commit_session
+from app.models.product import Product, ProductCategory, SupplierProduct
+from app.models.supplier import Supplier
+from app.repositories.price_list import SupplierPriceListItemRepository
+from app.schemas.price_list import (
+    DeliveryPriceLine,
+    DeliveryPriceValidationRequest,
+    SupplierPriceListCreate,
+    SupplierPriceListItemCreate,
+    SupplierPriceListUpdate,
+)
+from app.services.catalog_index import product_mapping_index
+from app.services.price_cache import ActivePriceCache, active_price_cache
+from app.services.price_list_service import PriceListService
+from tests.factories import create_suppliers
+
+
+@pytest_asyncio.fixture
+async def mapped_item(test_db: AsyncSession, sample_supplier: Supplier) -> SupplierProduct:
+    """Create one mapped supplier item."""
+    category = ProductCategory(code="DRY", name="Hàng khô")
+    test_db.add(category)
+    await test_db.flush()
+    product = Product(code="P-DUONG", name="Đường", category_id=category.id, unit="kg")
+    test_db.add(product)
+    await test_db.flush()
+    supplier_product = SupplierProduct(
+        supplier_id=sample_supplier.id,
+        product_id=product.id,
+        supplier_product_code="DUONG-BAO",
+        supplier_product_name="Đường bao 50kg",
+        supplier_unit="bao",
+    )
+    test_db.add(supplier_product)
+    await test_db.commit()
+
+    product_mapping_index.invalidate()
+    active_price_cache.invalidate()
+    return supplier_product
+
+
+async def create_list(
+    service: PriceListService,
+    supplier_product: SupplierProduct,
+    code: str,
+    valid_from: date,
+    price: str,
+    valid_to: date | None = None,
+):
+    """Create a one-item price list."""
+    return await service.create_price_list(
+        SupplierPriceListCreate(
+            supplier_id=supplier_product.supplier_id,
+            code=code,
+            name=code,
+            valid_from=valid_from,
+            valid_to=valid_to,
+            items=[SupplierPriceListItemCreate(
+                supplier_product_id=supplier_product.id, price=Decimal(price)
+            )],
+        )
+    )
+
+
+class TestPriceResolution:
+    """Test point-in-time price lookups."""
+
+    @pytest.mark.asyncio
+    async def test_latest_started_list_wins(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """Overlapping lists resolve to the one with the latest valid_from."""
+        today = date.today()
+        service = PriceListService(test_db)
+        await create_list(service, mapped_item, "BASE", today - timedelta(days=30), "1000000")
+        promo = await create_list(
+            service, mapped_item, "PROMO", today - timedelta(days=5), "900000",
+            valid_to=today + timedelta(days=5),
+        )
+
+        prices = await service.resolve_prices([mapped_item.id], today)
+        assert prices[mapped_item.id].price_list_id == promo.id
+
+        prices = await service.resolve_prices([mapped_item.id], today - timedelta(days=10))
+        assert prices[mapped_item.id].price == Decimal("1000000")
+
+    @pytest.mark.asyncio
+    async def test_query_matches_cache_for_old_dates(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """Dates before the cache window use the indexed query."""
+        service = PriceListService(test_db)
+        old = date.today() - timedelta(days=400)
+        await create_list(
+            service, mapped_item, "2024", old - timedelta(days=10), "800000",
+            valid_to=old + timedelta(days=10),
+        )
+
+        prices = await service.resolve_prices([mapped_item.id], old)
+        assert not active_price_cache.covers(old)
+        assert prices[mapped_item.id].price == Decimal("800000")
+
+        rows = await SupplierPriceListItemRepository(test_db).resolve_prices(
+            [mapped_item.id], old + timedelta(days=11)
+        )
+        assert rows == []
+
+    @pytest.mark.asyncio
+    async def test_deactivating_list_invalidates_cache(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """Updates are copied to items and visible through the cache."""
+        today = date.today()
+        service = PriceListService(test_db)
+        price_list = await create_list(service, mapped_item, "BASE", today, "1000000")
+        assert mapped_item.id in await service.resolve_prices([mapped_item.id], today)
+
+        await service.update_price_list(price_list.id, SupplierPriceListUpdate(is_active=False))
+        await commit_session(test_db)
+
+        assert await service.resolve_prices([mapped_item.id], today) == {}
+
+    @pytest.mark.asyncio
+    async def test_price_change_reaches_other_workers(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """A worker that did not make the change reloads after its version check."""
+        today = date.today()
+        service = PriceListService(test_db)
+        await create_list(service, mapped_item, "BASE", today - timedelta(days=30), "1000000")
+        await commit_session(test_db)
+        writer = ActivePriceCache(check_interval=0)
+        reader = ActivePriceCache(check_interval=0)
+        await writer.ensure_loaded(test_db)
+        await reader.ensure_loaded(test_db)
+
+        promo = await create_list(service, mapped_item, "PROMO", today, "900000")
+        await commit_session(test_db)
+        writer.invalidate()
+
+        for cache in (writer, reader):
+            await cache.ensure_loaded(test_db)
+            prices = cache.lookup_many([mapped_item.id], today)
+            assert prices[mapped_item.id].price_list_id == promo.id
+
+
+class TestDeliveryPriceValidation:
+    """Test delivery note price validation."""
+
+    @pytest.mark.asyncio
+    async def test_validate_delivery_prices(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """Each line gets a status against the agreed price."""
+        today = date.today()
+        service = PriceListService(test_db)
+        await create_list(service, mapped_item, "BASE", today, "1000000")
+
+        response = await service.validate_delivery_prices(
+            DeliveryPriceValidationRequest(
+                supplier_code="SUP001",
+                delivery_date=today,
+                lines=[
+                    DeliveryPriceLine(iit_code="DUONG-BAO", quantity=Decimal("2"),
+                                      price=Decimal("1000000"), money=Decimal("2000000")),
+                    DeliveryPriceLine(iit_code="DUONG-BAO", quantity=Decimal("1"),
+                                      price=Decimal("1100000")),
+                    DeliveryPriceLine(iit_code="UNKNOWN", quantity=Decimal("1"),
+                                      price=Decimal("1")),
+                ],
+            )
+        )
+
+        assert [line.status for line in response.lines] == ["ok", "price_mismatch", "unmapped"]
+        assert response.lines[1].price_difference == Decimal("100000")
+        assert response.is_valid is False
+
+    @pytest.mark.asyncio
+    async def test_supplier_user_cannot_validate_other_suppliers_prices(
+        self,
+        test_db: AsyncSession,
+        mapped_item: SupplierProduct,
+    ):
+        """Agreed prices of another supplier are not revealed."""
+        today = date.today()
+        service = PriceListService(test_db)
+        await create_list(service, mapped_item, "BASE", today, "1000000")
+        (other,) = await create_suppliers(test_db, 1, start=2)
+        await test_db.commit()
+
+        with supplier_scope(other.id):
+            with pytest.raises(HTTPException) as exc_info:
+                await service.validate_delivery_prices(
+                    DeliveryPriceValidationRequest(
+                        supplier_code="SUP001",
+                        delivery_date=today,
+                        lines=[
+                            DeliveryPriceLine(iit_code="DUONG-BAO", quantity=Decimal("1"),
+                                              price=Decimal("1")),
+                        ],
+                    )
+                )
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,253 @@
+"""
+Tests for the product catalog and the in-memory supplier item mapping index.
+"""
+
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.scope import supplier_scope
+from app.models.product import Product, ProductCategory, SupplierProduct, UnitConversion
+from app.models.supplier import Supplier
+from app.schemas.product import ProductMatchLine
+from app.services.catalog_index import ProductMappingIndex, product_mapping_index
+from app.services.product_service import ProductService
+from app.services.snapshot import DatabaseSnapshot
+from tests.factories import create_suppliers
+
+
+@pytest_asyncio.fixture
+async def catalog(test_db: AsyncSession, sample_supplier: Supplier) -> dict:
+    """Create a small catalog with two mapped supplier items."""
+    category = ProductCategory(code="SEAFOOD", name="Hải sản")
+    test_db.add(category)
+    await test_db.flush()
+
+    fish_sauce = Product(code="P-NUOCMAM", name="Nước mắm", category_id=category.id, unit="chai")
+    shrimp = Product(code="P-TOM", name="Tôm sú", category_id=category.id, unit="kg")
+    test_db.add_all([fish_sauce, shrimp])
+    await test_db.flush()
+
+    test_db.add_all([
+        SupplierProduct(
+            supplier_id=sample_supplier.id,
+            product_id=fish_sauce.id,
+            supplier_product_code="NM-THUNG",
+            supplier_product_name="Nước mắm Phú Quốc thùng 12 chai",
+            supplier_unit="thùng",
+            conversion_rate=Decimal("12"),
+        ),
+        SupplierProduct(
+            supplier_id=sample_supplier.id,
+            product_id=shrimp.id,
+            supplier_product_code="TOM-G",
+            supplier_product_name="Tôm sú tươi",
+            supplier_unit="g",
+        ),
+        UnitConversion(from_unit="kg", to_unit="g", factor=Decimal("1000")),
+    ])
+    await test_db.commit()
+
+    return {"supplier": sample_supplier, "fish_sauce": fish_sauce, "shrimp": shrimp}
+
+
+class TestProductMappingIndex:
+    """Test the in-memory supplier item mapping index."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_uses_explicit_conversion_rate(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """Mapped item resolves to the canonical product and its rate."""
+        index = ProductMappingIndex()
+        await index.load(test_db)
+
+        mapping = index.lookup(" sup001 ", "nm-thung")
+
+        assert mapping is not None
+        assert mapping.product_id == catalog["fish_sauce"].id
+        assert mapping.product_unit == "chai"
+        assert mapping.conversion_factor == Decimal("12")
+
+    @pytest.mark.asyncio
+    async def test_conversion_falls_back_to_inverse_unit_rule(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """Without a rate, the factor comes from the unit conversion table."""
+        index = ProductMappingIndex()
+        await index.load(test_db)
+
+        mapping = index.lookup("SUP001", "TOM-G")
+
+        assert mapping is not None
+        assert mapping.conversion_factor == Decimal("0.001")
+
+    @pytest.mark.asyncio
+    async def test_lookup_many_reports_unmapped_codes(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """Batch lookup returns None for unknown items."""
+        index = ProductMappingIndex()
+        await index.load(test_db)
+
+        result = index.lookup_many("SUP001", ["NM-THUNG", "UNKNOWN"])
+
+        assert result["NM-THUNG"] is not None
+        assert result["UNKNOWN"] is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_triggers_reload(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """New mappings become visible after invalidation."""
+        index = ProductMappingIndex()
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is None
+
+        test_db.add(
+            SupplierProduct(
+                supplier_id=catalog["supplier"].id,
+                product_id=catalog["shrimp"].id,
+                supplier_product_code="TOM-KG",
+                supplier_product_name="Tôm sú kg",
+                supplier_unit="kg",
+            )
+        )
+        await test_db.commit()
+
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is None
+
+        index.invalidate()
+        await index.ensure_loaded(test_db)
+        mapping = index.lookup("SUP001", "TOM-KG")
+        assert mapping is not None
+        assert mapping.conversion_factor == Decimal(1)
+
+    @pytest.mark.asyncio
+    async def test_write_from_another_worker_is_noticed(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """A catalog change nobody invalidated here shows up after the version check."""
+        index = ProductMappingIndex(check_interval=0)
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is None
+
+        # Written by another worker: this index is never invalidated
+        test_db.add(
+            SupplierProduct(
+                supplier_id=catalog["supplier"].id,
+                product_id=catalog["shrimp"].id,
+                supplier_product_code="TOM-KG",
+                supplier_product_name="Tôm sú kg",
+                supplier_unit="kg",
+            )
+        )
+        await test_db.commit()
+
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is not None
+
+
+class TestProductService:
+    """Test product catalog service."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_supplier_items(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """Service resolves a whole batch through the shared index."""
+        product_mapping_index.invalidate()
+        service = ProductService(test_db)
+        response = await service.resolve_supplier_items("SUP001", ["NM-THUNG", "XYZ"])
+
+        assert [m.iit_code for m in response.mapped] == ["NM-THUNG"]
+        assert response.unmapped == ["XYZ"]
+
+    @pytest.mark.asyncio
+    async def test_supplier_user_cannot_read_other_suppliers_mappings(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+    ):
+        """The shared index is not scoped, so foreign supplier codes are rejected."""
+        (other,) = await create_suppliers(test_db, 1, start=2)
+        await test_db.commit()
+        product_mapping_index.invalidate()
+        service = ProductService(test_db)
+
+        with supplier_scope(other.id):
+            with pytest.raises(HTTPException) as exc_info:
+                await service.resolve_supplier_items("SUP001", ["NM-THUNG"])
+            assert exc_info.value.status_code == 404
+
+            with pytest.raises(HTTPException) as exc_info:
+                await service.match_supplier_items(
+                    [ProductMatchLine(iit_code="NM-THUNG", iit_name="Nước mắm")],
+                    supplier_code="SUP001",
+                )
+            assert exc_info.value.status_code == 404
+
+        with supplier_scope(catalog["supplier"].id):
+            response = await service.resolve_supplier_items("sup001", ["NM-THUNG"])
+            assert [m.iit_code for m in response.mapped] == ["NM-THUNG"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_rebuilt_when_too_old(
+        self,
+        test_db: AsyncSession,
+        catalog: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Changes the version misses (old updated_at) are picked up by age."""
+        index = ProductMappingIndex(check_interval=0)
+
+        async def unchanged(session: AsyncSession) -> str:
+            return "v1"
+
+        monkeypatch.setattr(index, "version", unchanged)
+        await index.ensure_loaded(test_db)
+        test_db.add(
+            SupplierProduct(
+                supplier_id=catalog["supplier"].id,
+                product_id=catalog["shrimp"].id,
+                supplier_product_code="TOM-KG",
+                supplier_product_name="Tôm sú kg",
+                supplier_unit="kg",
+            )
+        )
+        await test_db.commit()
+
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is None
+
+        monkeypatch.setattr(settings, "SNAPSHOT_MAX_AGE_SECONDS", 0)
+        await index.ensure_loaded(test_db)
+        assert index.lookup("SUP001", "TOM-KG") is not None
+
+
+def test_snapshot_subclass_must_implement_version_and_rebuild():
+    """A snapshot missing a hook fails when created, not on its first load."""
+
+    class Incomplete(DatabaseSnapshot):
+        async def version(self, session: AsyncSession) -> str:
+            return "v1"
+
+    with pytest.raises(TypeError):
+        Incomplete()
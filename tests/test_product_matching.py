@@ -0,0 +1,130 @@
+"""
+Tests for fuzzy product matching of unmapped supplier items.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product, ProductCategory, SupplierProduct
+from app.models.supplier import Supplier
+from app.schemas.product import ProductMatchLine
+from app.services.catalog_index import product_mapping_index
+from app.services.product_matching import (
+    ProductMatchIndex,
+    normalize_vietnamese,
+    product_match_index,
+)
+from app.services.product_service import ProductService
+
+
+def build_index() -> ProductMatchIndex:
+    """Build a small in-memory index."""
+    index = ProductMatchIndex()
+    index.build(
+        {
+            1: ("P-NUOCMAM", "Nước mắm Phú Quốc", "chai"),
+            2: ("P-TOM", "Tôm sú", "kg"),
+            3: ("P-DUONG", "Đường cát trắng", "kg"),
+        },
+        [
+            (1, "Nước mắm Phú Quốc"),
+            (2, "Tôm sú"),
+            (3, "Đường cát trắng"),
+            (2, "Tôm sú tươi loại 1"),
+        ],
+    )
+    return index
+
+
+class TestNormalization:
+    """Test Vietnamese normalization."""
+
+    def test_strips_diacritics_and_d_stroke(self):
+        """Tone marks, vowel marks and đ are folded to ASCII."""
+        assert normalize_vietnamese("ĐƯỜNG Cát-trắng (1kg)") == "duong cat trang 1kg"
+
+
+class TestProductMatchIndex:
+    """Test the in-memory n-gram TF-IDF index."""
+
+    def test_match_ignores_accents_and_case(self):
+        """Unaccented input finds the accented canonical name first."""
+        candidates = build_index().match("NUOC MAM PHU QUOC 500ML", top_k=3)
+
+        assert candidates[0].product_id == 1
+        assert 0 < candidates[0].score <= 1
+
+    def test_match_returns_one_candidate_per_product(self):
+        """Aliases of the same product do not produce duplicate candidates."""
+        candidates = build_index().match("tôm sú tươi", top_k=5)
+
+        assert [c.product_id for c in candidates].count(2) == 1
+        assert candidates[0].matched_name == "Tôm sú tươi loại 1"
+
+    def test_match_many_respects_min_score(self):
+        """Unrelated names yield no candidates above the threshold."""
+        results = build_index().match_many(["duong trang", "xyz"], min_score=0.3)
+
+        assert results["duong trang"][0].product_code == "P-DUONG"
+        assert results["xyz"] == []
+
+
+class TestProductServiceMatching:
+    """Test batch matching through the service."""
+
+    @pytest.mark.asyncio
+    async def test_match_skips_mapped_lines(
+        self,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+    ):
+        """Mapped lines return their mapping; unmapped lines get candidates."""
+        category = ProductCategory(code="SEAFOOD", name="Hải sản")
+        test_db.add(category)
+        await test_db.flush()
+        shrimp = Product(code="P-TOM", name="Tôm sú", category_id=category.id, unit="kg")
+        test_db.add(shrimp)
+        await test_db.flush()
+        test_db.add(
+            SupplierProduct(
+                supplier_id=sample_supplier.id,
+                product_id=shrimp.id,
+                supplier_product_code="TOM-KG",
+                supplier_product_name="Tôm sú kg",
+                supplier_unit="kg",
+            )
+        )
+        await test_db.commit()
+
+        product_mapping_index.invalidate()
+        product_match_index.invalidate()
+        service = ProductService(test_db)
+        response = await service.match_supplier_items(
+            [
+                ProductMatchLine(iit_code="TOM-KG", iit_name="Tôm sú kg"),
+                ProductMatchLine(iit_code="TOM-NEW", iit_name="TOM SU SONG"),
+            ],
+            supplier_code="SUP001",
+        )
+
+        mapped, unmapped = response.results
+        assert mapped.mapping is not None and mapped.candidates == []
+        assert unmapped.mapping is None
+        assert unmapped.candidates[0].product_id == shrimp.id
+
+    @pytest.mark.asyncio
+    async def test_index_follows_other_workers_writes(self, test_db: AsyncSession):
+        """A product added elsewhere becomes matchable after the version check."""
+        category = ProductCategory(code="DRY", name="Hàng khô")
+        test_db.add(category)
+        await test_db.commit()
+        index = ProductMatchIndex(check_interval=0)
+        await index.ensure_loaded(test_db)
+        assert index.match("duong cat") == []
+
+        # Written by another worker: this index is never invalidated
+        test_db.add(Product(code="P-DUONG", name="Đường cát", category_id=category.id, unit="kg"))
+        await test_db.commit()
+
+        await index.ensure_loaded(test_db)
+        assert index.match("duong cat")[0].product_code == "P-DUONG"
@@ -0,0 +1,165 @@
+"""
+Tests for the sampling profiler and slow-request capture.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.api.deps import get_current_superuser, get_current_user
+from app.core.config import settings
+from app.core.profiling import (
+    ProfilerBusy,
+    SlowRequestMiddleware,
+    profile_worker,
+    slow_requests,
+    trace_queries,
+)
+from app.main import app
+
+
+def burn(seconds: float) -> None:
+    """Keep the event loop busy."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def frame_names(profile: dict) -> set[str]:
+    """Names of the frames sampled in a speedscope profile."""
+    frames = profile["shared"]["frames"]
+    return {frames[i]["name"] for sample in profile["profiles"][0]["samples"] for i in sample}
+
+
+@pytest.fixture(autouse=True)
+def clear_captures() -> None:
+    """Start every test without slow request captures."""
+    slow_requests.clear()
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    """In-memory engine with SQL tracing."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    trace_queries(engine)
+    yield engine
+    await engine.dispose()
+
+
+async def test_worker_profile_sees_blocking_code():
+    """CPU-bound work on the loop shows up in a speedscope profile."""
+
+    async def busy() -> None:
+        await asyncio.sleep(0.05)
+        burn(0.15)
+
+    profile, _ = await asyncio.gather(profile_worker(0.3, 0.002), busy())
+
+    assert profile["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    sampled = profile["profiles"][0]
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"]) > 0
+    assert "burn" in frame_names(profile)
+
+
+async def test_one_worker_profile_at_a_time():
+    first = asyncio.ensure_future(profile_worker(0.1, 0.01))
+    await asyncio.sleep(0)
+    with pytest.raises(ProfilerBusy):
+        await profile_worker(0.1, 0.01)
+    await first
+
+
+async def test_slow_request_is_captured_with_sql_trace(
+    engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A request over the threshold keeps its statements and where it waited."""
+    monkeypatch.setattr(settings, "SLOW_REQUEST_THRESHOLD_MS", 50.0)
+    monkeypatch.setattr(settings, "SLOW_REQUEST_INTERVAL_MS", 5.0)
+    traced = FastAPI()
+    traced.add_middleware(SlowRequestMiddleware)
+
+    @traced.get("/slow")
+    async def slow_endpoint() -> int:
+        async with engine.connect() as conn:
+            value = (await conn.execute(text("SELECT 42"))).scalar_one()
+        await asyncio.sleep(0.2)
+        return value
+
+    @traced.get("/fast")
+    async def fast_endpoint() -> int:
+        return 1
+
+    async with AsyncClient(transport=ASGITransport(app=traced), base_url="http://test") as ac:
+        assert (await ac.get("/fast")).status_code == 200
+        assert (await ac.get("/slow")).json() == 42
+
+    [capture] = slow_requests.list()
+    assert (capture.method, capture.path, capture.status_code) == ("GET", "/slow", 200)
+    assert capture.duration_ms >= 200
+    assert [q["statement"] for q in capture.queries] == ["SELECT 42"]
+    names = frame_names(capture.profile)
+    assert "[await]" in names
+    assert any(name.endswith("slow_endpoint") for name in names)
+
+
+@pytest_asyncio.fixture
+async def admin_api(api: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
+    """API client authenticated as a superuser."""
+    app.dependency_overrides[get_current_superuser] = lambda: SimpleNamespace(id=1)
+    yield api
+
+
+async def test_admin_endpoints_require_superuser(api: AsyncClient):
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        id=2, is_superuser=False
+    )
+    response = await api.get("/api/v1/admin/slow-requests")
+    assert response.status_code == 403
+
+
+async def test_admin_profile(admin_api: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+    response = await admin_api.get("/api/v1/admin/profile", params={"seconds": 0.1})
+    assert response.status_code == 200
+    assert response.json()["profiles"][0]["type"] == "sampled"
+    assert "speedscope.json" in response.headers["Content-Disposition"]
+
+    monkeypatch.setattr(settings, "PROFILING_MAX_SECONDS", 1.0)
+    response = await admin_api.get("/api/v1/admin/profile", params={"seconds": 5})
+    assert response.status_code == 400
+
+
+async def test_admin_slow_requests(admin_api: AsyncClient):
+    capture = slow_requests.add(
+        method="GET",
+        path="/api/v1/suppliers",
+        status_code=200,
+        duration_ms=2500.0,
+        started_at=datetime.now(timezone.utc),
+        queries=[{"statement": "SELECT 1", "duration_ms": 2400.0}],
+        dropped_queries=0,
+        profile={"profiles": []},
+    )
+
+    [summary] = (await admin_api.get("/api/v1/admin/slow-requests")).json()
+    assert summary["id"] == capture.id
+    assert (summary["query_count"], summary["query_ms"]) == (1, 2400.0)
+
+    detail = (await admin_api.get(f"/api/v1/admin/slow-requests/{capture.id}")).json()
+    assert detail["queries"][0]["statement"] == "SELECT 1"
+    assert detail["profile"] == {"profiles": []}
+
+    assert (await admin_api.delete("/api/v1/admin/slow-requests")).status_code == 204
+    response = await admin_api.get(f"/api/v1/admin/slow-requests/{capture.id}")
+    assert response.status_code == 404
+
@@ -0,0 +1,179 @@
+"""
+Tests for the token-bucket rate limiter.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.core.rate_limit import (
+    Bucket,
+    Decision,
+    LocalRateLimitBackend,
+    RateLimitMiddleware,
+)
+from app.core.security import create_access_token, request_principal
+from tests.factories import DEFAULT_PASSWORD
+
+
+async def ok_endpoint(request):
+    return PlainTextResponse("ok")
+
+
+async def take_one(backend: LocalRateLimitBackend, key: str, bucket: Bucket) -> Decision:
+    """Take a token from a single bucket."""
+    (decision,) = await backend.take(key, [bucket])
+    return decision
+
+
+def make_client(backend: LocalRateLimitBackend) -> AsyncClient:
+    """Client for a small app wrapped in the middleware."""
+    app = Starlette(routes=[
+        Route("/api/v1/suppliers", ok_endpoint),
+        Route("/api/v1/suppliers/search", ok_endpoint),
+        Route("/api/v1/health", ok_endpoint),
+    ])
+    wrapped = RateLimitMiddleware(app, backend=backend)
+    return AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test")
+
+
+@pytest.fixture
+def limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable rate limiting with small buckets."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 3)
+    monkeypatch.setattr(settings, "RATE_LIMIT_EXPENSIVE_PER_MINUTE", 1)
+
+
+class TestBuckets:
+    """Test the token bucket arithmetic."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self, monkeypatch: pytest.MonkeyPatch):
+        """A full bucket allows a burst, then refills at its rate."""
+        now = [1000.0]
+        monkeypatch.setattr("app.core.rate_limit.time.monotonic", lambda: now[0])
+        backend = LocalRateLimitBackend()
+        bucket = Bucket("minute", capacity=2, period=60)
+
+        assert (await take_one(backend, "k", bucket)).remaining == 1
+        assert (await take_one(backend, "k", bucket)).remaining == 0
+        denied = await take_one(backend, "k", bucket)
+        assert not denied.allowed
+        assert denied.retry_after == 30
+        assert denied.reset == 60
+
+        now[0] += 30
+        assert (await take_one(backend, "k", bucket)).allowed
+        assert not (await take_one(backend, "k", bucket)).allowed
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Only max_keys bucket states are kept."""
+        backend = LocalRateLimitBackend(max_keys=2)
+        bucket = Bucket("minute", capacity=5, period=60)
+        for key in ("a", "b", "a", "c"):
+            await take_one(backend, key, bucket)
+        assert list(backend._states) == ["a:minute", "c:minute"]
+
+    @pytest.mark.asyncio
+    async def test_denied_request_takes_no_tokens(self):
+        """A bucket that is out of tokens leaves the other buckets untouched."""
+        backend = LocalRateLimitBackend()
+        minute = Bucket("minute", capacity=3, period=60)
+        expensive = Bucket("expensive", capacity=1, period=60)
+
+        assert all(d.allowed for d in await backend.take("k", [minute, expensive]))
+        denied = await backend.take("k", [minute, expensive])
+
+        assert [d.allowed for d in denied] == [True, False]
+        assert denied[0].remaining == 2
+        assert (await take_one(backend, "k", minute)).remaining == 1
+
+
+class TestIdentity:
+    """Test who a request is counted against."""
+
+    def test_bearer_token_identifies_user(self):
+        """A valid token counts against the user, anything else the IP."""
+        token = create_access_token(subject=42)
+        headers = Headers({"authorization": f"Bearer {token}"})
+        assert request_principal(headers, ("10.0.0.1", 1234)) == "user:42"
+        invalid = Headers({"authorization": "Bearer not-a-jwt"})
+        assert request_principal(invalid, ("10.0.0.1", 1234)) == "ip:10.0.0.1"
+        assert request_principal(Headers({}), None) == "ip:unknown"
+
+    @pytest.mark.asyncio
+    async def test_login_token_identifies_user(self, api: AsyncClient, sample_aladdin_admin):
+        """Tokens issued by /auth/login carry an audience and still count per user."""
+        response = await api.post(
+            "/api/v1/auth/login",
+            data={"username": sample_aladdin_admin.email, "password": DEFAULT_PASSWORD},
+        )
+        assert response.status_code == 200
+        token = response.json()["access_token"]
+        headers = Headers({"authorization": f"Bearer {token}"})
+        assert request_principal(headers, ("1.2.3.4", 1234)) == f"user:{sample_aladdin_admin.id}"
+
+
+class TestMiddleware:
+    """Test responses of the middleware."""
+
+    @pytest.mark.asyncio
+    async def test_limit_headers_and_429(self, limits: None):
+        """Responses report the bucket; the request over the limit gets 429."""
+        async with make_client(LocalRateLimitBackend()) as client:
+            responses = [await client.get("/api/v1/suppliers") for _ in range(4)]
+
+        assert [r.status_code for r in responses] == [200, 200, 200, 429]
+        assert responses[0].headers["ratelimit-limit"] == "3"
+        assert responses[0].headers["ratelimit-remaining"] == "2"
+        rejected = responses[-1]
+        assert int(rejected.headers["retry-after"]) > 0
+        assert rejected.headers["ratelimit-remaining"] == "0"
+        assert rejected.json()["error"] == "RateLimitExceeded"
+
+    @pytest.mark.asyncio
+    async def test_expensive_routes_have_own_bucket(self, limits: None):
+        """Search uses up its own bucket without exhausting cheap routes."""
+        async with make_client(LocalRateLimitBackend()) as client:
+            assert (await client.get("/api/v1/suppliers/search")).status_code == 200
+            assert (await client.get("/api/v1/suppliers/search")).status_code == 429
+            response = await client.get("/api/v1/suppliers")
+        assert response.status_code == 200
+        # The rejected search did not take from the minute bucket
+        assert response.headers["ratelimit-remaining"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_principals_are_separate(self, limits: None):
+        """Each user has their own buckets."""
+        backend = LocalRateLimitBackend()
+        tokens = [create_access_token(subject=i) for i in (1, 2)]
+        async with make_client(backend) as client:
+            for _ in range(3):
+                await client.get(
+                    "/api/v1/suppliers",
+                    headers={"Authorization": f"Bearer {tokens[0]}"},
+                )
+            other = await client.get(
+                "/api/v1/suppliers",
+                headers={"Authorization": f"Bearer {tokens[1]}"},
+            )
+        assert other.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_exempt_and_disabled(self, limits: None, monkeypatch: pytest.MonkeyPatch):
+        """Health checks are never limited; the setting turns limiting off."""
+        async with make_client(LocalRateLimitBackend()) as client:
+            for _ in range(5):
+                response = await client.get("/api/v1/health")
+                assert response.status_code == 200
+            assert "ratelimit-limit" not in response.headers
+
+            monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+            for _ in range(5):
+                assert (await client.get("/api/v1/suppliers")).status_code == 200
@@ -0,0 +1,163 @@
+"""
+Tests for read replica routing and read-your-writes stickiness.
+
+Two SQLite files stand in for the primary and a replica; each holds a
+marker row naming the database, so a read shows where it was routed.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+from sqlalchemy import Column, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import session as db_session
+from app.db.session import (
+    RedisRecentWriters,
+    close_db,
+    get_db,
+    get_read_db,
+    get_read_session_factory,
+    init_db,
+    primary_session,
+    session_wrote,
+)
+
+marker = Table("marker", MetaData(), Column("name", String))
+
+router_app = FastAPI()
+
+
+@router_app.get("/where")
+async def where(db: AsyncSession = Depends(get_read_db)) -> list[str]:
+    return list((await db.execute(select(marker.c.name))).scalars())
+
+
+@router_app.post("/write")
+async def write(db: AsyncSession = Depends(get_db)) -> dict[str, bool]:
+    await db.execute(insert(marker).values(name="written"))
+    return {"wrote": session_wrote(db)}
+
+
+@router_app.post("/noop")
+async def noop(db: AsyncSession = Depends(get_db)) -> dict[str, bool]:
+    await db.execute(select(marker.c.name))
+    return {"wrote": session_wrote(db)}
+
+
+def make_database(path: Path, name: str) -> str:
+    """Create a SQLite file holding one marker row; return its URL."""
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE marker (name VARCHAR)")
+        connection.execute("INSERT INTO marker VALUES (?)", (name,))
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def auth(user_id: int) -> dict[str, str]:
+    """Authorization header of a user."""
+    return {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+
+
+@pytest_asyncio.fixture
+async def client(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Client of an app whose database has one read replica."""
+    await close_db()
+    monkeypatch.setattr(settings, "DATABASE_URL", make_database(tmp_path / "primary.db", "primary"))
+    monkeypatch.setattr(
+        settings,
+        "DATABASE_READ_REPLICA_URLS",
+        [make_database(tmp_path / "replica.db", "replica")],
+    )
+    await init_db()
+    async with AsyncClient(transport=ASGITransport(app=router_app), base_url="http://test") as ac:
+        yield ac
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(client: AsyncClient):
+    """Without recent writes, reads use the replica."""
+    assert (await client.get("/where", headers=auth(1))).json() == ["replica"]
+    assert (await client.get("/where")).json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_reads_stick_to_primary_after_write(client: AsyncClient):
+    """The writer reads its own write from the primary; others use the replica."""
+    assert (await client.post("/write", headers=auth(1))).json() == {"wrote": True}
+    assert (await client.get("/where", headers=auth(1))).json() == ["primary", "written"]
+    assert (await client.get("/where", headers=auth(2))).json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_stickiness_expires(client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+    """Once the sticky window is over, reads return to the replica."""
+    await client.post("/write", headers=auth(1))
+    monkeypatch.setattr(settings, "DATABASE_READ_STICKY_SECONDS", 0)
+    assert (await client.get("/where", headers=auth(1))).json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_reads_through_get_db_do_not_stick(client: AsyncClient):
+    """Sessions that only read are not counted as writes."""
+    assert (await client.post("/noop", headers=auth(1))).json() == {"wrote": False}
+    assert (await client.get("/where", headers=auth(1))).json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_primary_session_never_reads_from_replica(client: AsyncClient):
+    """Snapshot loads given a replica session switch to the primary."""
+    async with (await get_read_session_factory())() as replica:
+        async with primary_session(replica) as session:
+            assert list((await session.execute(select(marker.c.name))).scalars()) == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_workers_without_shared_store_warn(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Replicas with several workers need REDIS_URL to share recent writes."""
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, format="{message}", level="WARNING")
+    try:
+        await close_db()
+        monkeypatch.setattr(settings, "WORKERS", 2)
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        await init_db()
+        assert any("Read-your-writes is per worker" in m for m in messages)
+
+        messages.clear()
+        await close_db()
+        monkeypatch.setattr(settings, "REDIS_URL", "redis://127.0.0.1:1/0")
+        await init_db()
+        assert isinstance(db_session.recent_writers, RedisRecentWriters)
+        assert not any("Read-your-writes is per worker" in m for m in messages)
+    finally:
+        logger.remove(handler_id)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_shared_store_falls_back_to_local_writers(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A Redis outage keeps stickiness on the worker that saw the write."""
+    await close_db()
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://127.0.0.1:1/0")
+    await init_db()
+
+    assert (await client.post("/write", headers=auth(1))).json() == {"wrote": True}
+    assert (await client.get("/where", headers=auth(1))).json() == ["primary", "written"]
+    assert (await client.get("/where", headers=auth(2))).json() == ["replica"]
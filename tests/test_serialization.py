@@ -0,0 +1,82 @@
+"""
+Tests for the fast row rendering path.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from pydantic import field_serializer
+
+from app.core.serialization import column_plan, render_item, render_page
+from app.models.supplier import Supplier
+from app.schemas.base import BaseSchema
+from app.schemas.supplier import SupplierList
+
+
+class PriceRow(BaseSchema):
+    """Schema exercising types orjson and Pydantic format differently by default."""
+
+    id: int
+    price: Decimal
+    valid_at: datetime
+    note: str | None = None
+
+
+class TestRendering:
+    """Test fast rendering against the Pydantic path."""
+
+    def test_matches_pydantic_output(self):
+        """Decimals, UTC datetimes and None render exactly like Pydantic."""
+        plan = column_plan(PriceRow)
+        row = {
+            "id": 1,
+            "price": Decimal("12500.50"),
+            "valid_at": datetime(2024, 5, 1, 8, 30, 0, 123456, tzinfo=timezone.utc),
+            "note": None,
+        }
+        body = render_page(plan, [row], total=1, skip=0, limit=10)
+        assert body == (
+            b'{"items":[' + PriceRow.model_validate(row).model_dump_json().encode()
+            + b'],"total":1,"skip":0,"limit":10}'
+        )
+
+    def test_verify_mode_detects_drift(self):
+        """Rows that Pydantic would transform fail in verify mode."""
+        plan = column_plan(PriceRow, ("id", "note"))
+        with pytest.raises(AssertionError):
+            render_item(plan, {"id": 1, "note": "  untrimmed  "})
+
+    def test_custom_serializers_are_refused(self):
+        """Schemas with serializers must stay on the Pydantic path."""
+
+        class Formatted(BaseSchema):
+            price: Decimal
+
+            @field_serializer("price")
+            def format_price(self, value: Decimal) -> str:
+                return f"{value:,.0f}"
+
+        with pytest.raises(ValueError):
+            column_plan(Formatted)
+
+
+class TestListEndpoint:
+    """Test the supplier list rendered through the fast path."""
+
+    @pytest.mark.asyncio
+    async def test_list_matches_schema(
+        self,
+        api: AsyncClient,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Each item has exactly the SupplierList fields."""
+        response = await api.get("/api/v1/suppliers", params={"is_active": True})
+        assert response.status_code == 200
+        body = orjson.loads(response.content)
+        assert body["total"] == 5
+        for item in body["items"]:
+            assert list(item) == list(SupplierList.model_fields)
+            SupplierList.model_validate(item)
@@ -0,0 +1,117 @@
+"""
+Tests for request session lifecycle: no COMMIT for read-only requests and
+connections released before the response is serialized.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, field_serializer
+from sqlalchemy import Column, Integer, MetaData, Table, event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routing import DBRoute
+from app.core.config import settings
+from app.db.session import close_db, get_db, get_engine, init_db
+
+counter = Table("counter", MetaData(), Column("value", Integer))
+
+# Whether the request session was still in a transaction at serialization
+serialized_in_transaction: list[bool] = []
+
+
+class Result(BaseModel):
+    """Response recording the session state when it is serialized."""
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    session: AsyncSession
+    total: int
+
+    @field_serializer("session")
+    def record_session_state(self, session: AsyncSession) -> None:
+        serialized_in_transaction.append(session.in_transaction())
+        return None
+
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.get("/read", response_model=Result)
+async def read(db: AsyncSession = Depends(get_db)) -> Result:
+    total = len((await db.execute(select(counter.c.value))).all())
+    return Result(session=db, total=total)
+
+
+@router.post("/write", response_model=Result)
+async def write(db: AsyncSession = Depends(get_db)) -> Result:
+    await db.execute(insert(counter).values(value=1))
+    total = len((await db.execute(select(counter.c.value))).all())
+    return Result(session=db, total=total)
+
+
+lifecycle_app = FastAPI()
+lifecycle_app.include_router(router)
+
+
+@pytest_asyncio.fixture
+async def client(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[tuple[AsyncClient, list[str]], None]:
+    """Client of the app above and the list of COMMITs issued."""
+    path = tmp_path / "lifecycle.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE counter (value INTEGER)")
+    await close_db()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+    await init_db()
+
+    commits: list[str] = []
+    event.listen(get_engine().sync_engine, "commit", lambda connection: commits.append("COMMIT"))
+    serialized_in_transaction.clear()
+    async with AsyncClient(
+        transport=ASGITransport(app=lifecycle_app),
+        base_url="http://test",
+    ) as ac:
+        yield ac, commits
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_read_only_request_skips_commit(client: tuple[AsyncClient, list[str]]):
+    """A request that only reads releases its connection without COMMIT."""
+    ac, commits = client
+    response = await ac.get("/read")
+    assert response.json()["total"] == 0
+    assert commits == []
+    assert serialized_in_transaction == [False]
+
+
+@pytest.mark.asyncio
+async def test_write_commits_before_serialization(client: tuple[AsyncClient, list[str]]):
+    """Writes are committed once, before the response is serialized."""
+    ac, commits = client
+    assert (await ac.post("/write")).json()["total"] == 1
+    assert commits == ["COMMIT"]
+    assert serialized_in_transaction == [False]
+    assert (await ac.get("/read")).json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_release_early_can_be_disabled(
+    client: tuple[AsyncClient, list[str]],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Without early release the session is finished after the response."""
+    ac, commits = client
+    monkeypatch.setattr(settings, "DATABASE_RELEASE_EARLY", False)
+    assert (await ac.post("/write")).json()["total"] == 1
+    assert serialized_in_transaction == [True]
+    assert commits == ["COMMIT"]
@@ -0,0 +1,87 @@
+"""
+Tests for request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import get_cache
+from app.core.singleflight import SingleFlight, get_single_flight
+from app.models.supplier import Supplier
+from app.services.supplier_service import SupplierService
+
+
+class TestSingleFlight:
+    """Test the single-flight group."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_invocation(self):
+        """Identical concurrent calls run the function once."""
+        group = SingleFlight()
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(group.do("k", load) for _ in range(10)))
+        assert results == [42] * 10
+        assert calls == 1
+        assert group.followers == 9
+        assert len(group) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Followers receive the leader's exception."""
+        group = SingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(group.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_follower_takes_over_when_leader_cancelled(self):
+        """A cancelled leader does not cancel waiting followers."""
+        group = SingleFlight()
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(group.do("k", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("k", load))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == 2
+        assert leader.cancelled()
+
+
+class TestCoalescedSupplierService:
+    """Test coalescing on SupplierService reads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_query(self, test_db, sample_supplier: Supplier):
+        """Concurrent cache misses for one supplier run a single query."""
+        get_cache().enabled = False
+        group = get_single_flight()
+        leaders = group.leaders
+        service = SupplierService(test_db)
+
+        results = await asyncio.gather(
+            *(service.get_supplier(sample_supplier.id) for _ in range(5))
+        )
+        assert {r.id for r in results} == {sample_supplier.id}
+        assert group.leaders == leaders + 1
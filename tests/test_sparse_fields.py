@@ -0,0 +1,46 @@
+"""
+Tests for sparse fieldsets (?fields=).
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from app.models.supplier import Supplier
+
+
+class TestSparseFieldsets:
+    """Test ?fields= on supplier endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_list_returns_only_requested_fields(
+        self,
+        api: AsyncClient,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Dropdown calls get id (always) plus the requested columns."""
+        response = await api.get("/api/v1/suppliers", params={"fields": "code,name", "limit": 3})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == len(multiple_suppliers)
+        assert [set(item) for item in body["items"]] == [{"id", "code", "name"}] * 3
+        assert body["items"][0]["code"] == "SUP101"
+        assert "etag" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_detail_fields_and_validation(
+        self,
+        api: AsyncClient,
+        sample_supplier: Supplier,
+    ):
+        """Detail accepts column fields and rejects unknown or computed ones."""
+        url = f"/api/v1/suppliers/{sample_supplier.id}"
+        response = await api.get(url, params={"fields": "name,updated_at"})
+        assert response.status_code == 200
+        assert set(response.json()) == {"id", "name", "updated_at"}
+
+        full = await api.get(url)
+        assert full.headers["etag"] != response.headers["etag"]
+
+        assert (await api.get(url, params={"fields": "name,password"})).status_code == 400
+        assert (await api.get(url, params={"fields": "is_deleted"})).status_code == 400
+        assert (await api.get("/api/v1/suppliers/999999", params={"fields": "name"})).status_code == 404
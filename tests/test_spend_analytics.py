@@ -0,0 +1,121 @@
+"""
+Tests for incrementally maintained spend rollups.
+"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.main import app
+from app.models.product import Product, ProductCategory
+from app.models.supplier import Supplier
+from app.schemas.analytics import SpendDeliveryLine
+from app.services.analytics_service import SpendAnalyticsService
+
+
+@pytest_asyncio.fixture
+async def products(test_db: AsyncSession) -> list[Product]:
+    """Create two canonical products."""
+    category = ProductCategory(code="DRY", name="Hàng khô")
+    test_db.add(category)
+    await test_db.flush()
+    items = [
+        Product(code="P-DUONG", name="Đường", category_id=category.id, unit="kg"),
+        Product(code="P-MUOI", name="Muối", category_id=category.id, unit="kg"),
+    ]
+    test_db.add_all(items)
+    await test_db.commit()
+    return items
+
+
+def line(product: Product, quantity: str, amount: str) -> SpendDeliveryLine:
+    """Build a delivery line."""
+    return SpendDeliveryLine(
+        product_id=product.id, quantity=Decimal(quantity), amount=Decimal(amount)
+    )
+
+
+class TestSpendRollups:
+    """Test rollup maintenance and reporting."""
+
+    @pytest.mark.asyncio
+    async def test_confirmed_deliveries_accumulate(
+        self,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+        products: list[Product],
+    ):
+        """Two notes in one month add up in both rollups."""
+        sugar, salt = products
+        service = SpendAnalyticsService(test_db)
+        await service.apply_confirmed_delivery(
+            sample_supplier.id, 1, date(2026, 9, 3),
+            [line(sugar, "10", "200000"), line(sugar, "5", "100000"), line(salt, "1", "5000")],
+        )
+        await service.apply_confirmed_delivery(
+            sample_supplier.id, 1, date(2026, 9, 20), [line(salt, "2", "10000")],
+        )
+        await test_db.commit()
+
+        monthly = await service.spend_by_supplier_by_month(date(2026, 9, 1), date(2026, 9, 30))
+        assert len(monthly) == 1
+        assert monthly[0].amount == Decimal("315000")
+        assert monthly[0].delivery_count == 2
+        assert monthly[0].line_count == 4
+
+        top = await service.top_products(1, date(2026, 9, 1), date(2026, 9, 30))
+        assert [p.product_code for p in top] == ["P-DUONG", "P-MUOI"]
+        assert top[0].quantity == Decimal("15")
+        assert top[1].amount == Decimal("15000")
+
+    @pytest.mark.asyncio
+    async def test_reverse_removes_delivery(
+        self,
+        test_db: AsyncSession,
+        sample_supplier: Supplier,
+        products: list[Product],
+    ):
+        """Reversing a confirmation subtracts it again."""
+        sugar, _ = products
+        service = SpendAnalyticsService(test_db)
+        lines = [line(sugar, "10", "200000")]
+        await service.apply_confirmed_delivery(sample_supplier.id, 2, date(2026, 9, 3), lines)
+        await service.apply_confirmed_delivery(
+            sample_supplier.id, 2, date(2026, 9, 3), lines, reverse=True
+        )
+        await test_db.commit()
+
+        monthly = await service.spend_by_supplier_by_month(
+            date(2026, 9, 1), date(2026, 9, 1), restaurant_id=2
+        )
+        assert monthly[0].amount == Decimal("0")
+        assert monthly[0].delivery_count == 0
+
+
+async def test_recording_deliveries_requires_superuser(
+    api: AsyncClient,
+    sample_supplier: Supplier,
+    products: list[Product],
+):
+    """Only superusers feed the rollups through the API."""
+    payload = {
+        "supplier_id": sample_supplier.id,
+        "restaurant_id": 1,
+        "delivery_date": "2026-09-03",
+        "lines": [{"product_id": products[0].id, "quantity": "1", "amount": "20000"}],
+    }
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        id=2, is_superuser=False
+    )
+    response = await api.post("/api/v1/analytics/spend/deliveries", json=payload)
+    assert response.status_code == 403
+
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1, is_superuser=True)
+    response = await api.post("/api/v1/analytics/spend/deliveries", json=payload)
+    assert response.status_code == 204
@@ -0,0 +1,79 @@
+"""
+Tests for the SQLite engine profiles.
+"""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.core.config import settings
+from app.db.pool import AdaptiveQueuePool
+from app.db.session import close_db, get_engine, get_engine_config, get_session_factory, init_db
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[None, None]:
+    """Application database on a SQLite file with the tuned profile."""
+    path = tmp_path / "tuned.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE event (name VARCHAR)")
+    await close_db()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+    monkeypatch.setattr(settings, "DATABASE_SQLITE_PROFILE", "tuned")
+    await init_db()
+    yield
+    await close_db()
+
+
+def test_profiles_pick_pools(monkeypatch: pytest.MonkeyPatch):
+    """Files get a pool in the tuned profile; memory databases share one connection."""
+    assert get_engine_config("sqlite+aiosqlite:///./app.db")["poolclass"] is AdaptiveQueuePool
+    assert get_engine_config("sqlite+aiosqlite:///:memory:")["poolclass"] is StaticPool
+    assert get_engine_config("sqlite+aiosqlite://")["poolclass"] is StaticPool
+    monkeypatch.setattr(settings, "DATABASE_SQLITE_PROFILE", "basic")
+    assert get_engine_config("sqlite+aiosqlite:///./app.db")["poolclass"] is NullPool
+
+
+@pytest.mark.asyncio
+async def test_pragmas_are_applied_on_connect(database: None):
+    """Connections use WAL, NORMAL sync and the configured busy timeout."""
+    async with get_engine().connect() as connection:
+        pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}")  # noqa: E731
+        assert (await pragma("journal_mode")).scalar() == "wal"
+        assert (await pragma("synchronous")).scalar() == 1
+        assert (await pragma("busy_timeout")).scalar() == settings.DATABASE_SQLITE_BUSY_TIMEOUT
+        assert (await pragma("cache_size")).scalar() == -settings.DATABASE_SQLITE_CACHE_SIZE_KB
+
+
+@pytest.mark.asyncio
+async def test_writers_queue_until_commit(database: None):
+    """A second writer waits on the event loop until the first commits."""
+    session_factory = get_session_factory()
+    order: list[str] = []
+
+    async def write(name: str) -> None:
+        async with session_factory() as session:
+            await session.execute(text("INSERT INTO event VALUES (:name)"), {"name": name})
+            order.append(name)
+            await session.commit()
+
+    async with session_factory() as first:
+        await first.execute(text("INSERT INTO event VALUES ('first')"))
+        second = asyncio.create_task(write("second"))
+        await asyncio.sleep(0.1)
+        assert not second.done()
+        order.append("first")
+        await first.commit()
+    await asyncio.wait_for(second, timeout=5)
+
+    assert order == ["first", "second"]
+    async with session_factory() as session:
+        names = (await session.execute(text("SELECT name FROM event"))).scalars().all()
+    assert names == ["first", "second"]
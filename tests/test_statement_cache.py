@@ -0,0 +1,77 @@
+"""
+Tests for cached repository statements and statement cache instrumentation.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.core.scope import supplier_scope
+from app.db.session import get_engine_config
+from app.db.statements import StatementCacheStats
+from app.models.supplier import Supplier
+from app.repositories.supplier import SupplierRepository
+
+
+class TestCachedStatements:
+    """Test prebuilt statements of the hot repository lookups."""
+
+    @pytest.mark.asyncio
+    async def test_statement_is_built_once_per_scope_variant(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Lookups reuse one statement object and still honour the supplier scope."""
+        repository = SupplierRepository(test_db)
+        first, second = multiple_suppliers[:2]
+
+        assert (await repository.get(first.id)).id == first.id
+        statement, params = repository._cached_statement("get", lambda: None)
+        assert statement is not None
+        assert params == {}
+
+        with supplier_scope(second.id):
+            assert await repository.get(first.id) is None
+            scoped, scope_params = repository._cached_statement("get", lambda: None)
+            assert scoped is not None and scoped is not statement
+            assert scope_params == {"scope_supplier_id": second.id}
+            assert (await repository.get_by_code(second.code)).id == second.id
+            # Email uniqueness checks see every supplier
+            assert (await repository.get_by_email(first.email.upper())).id == first.id
+
+
+class TestStatementCacheStats:
+    """Test hit rate reporting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_compiled_cache_hits(self):
+        """Repeating a statement hits the compiled cache."""
+        engine = create_async_engine("sqlite+aiosqlite://", query_cache_size=10)
+        stats = StatementCacheStats()
+        stats.instrument(engine)
+        try:
+            async with engine.connect() as connection:
+                for value in range(3):
+                    await connection.execute(text("SELECT :value"), {"value": value})
+            status = stats.status(engine)
+        finally:
+            await engine.dispose()
+
+        assert (status.compiled_misses, status.compiled_hits) == (1, 2)
+        assert status.compiled_hit_rate == 0.667
+        assert status.compiled_capacity == 10
+        # SQLite has no prepared statement cache
+        assert status.prepared_hit_rate is None
+
+    def test_engine_config_sets_cache_sizes(self):
+        """asyncpg engines get the prepared statement cache size."""
+        config = get_engine_config("postgresql+asyncpg://user:pass@db/app")
+        assert config["query_cache_size"] == settings.DATABASE_QUERY_CACHE_SIZE
+        assert config["connect_args"]["prepared_statement_cache_size"] == (
+            settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE
+        )
+        assert "prepared_statement_cache_size" not in get_engine_config(
+            "sqlite+aiosqlite://"
+        )["connect_args"]
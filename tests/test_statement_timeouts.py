@@ -0,0 +1,141 @@
+"""
+Tests for per-route statement timeouts and cancellation on client disconnect.
+"""
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routing import DBRoute
+from app.core.config import settings
+from app.db.session import close_db, get_db, init_db
+from app.db.timeouts import route_statement_timeout, statement_timeout
+
+# Counts far enough to run for many seconds unless interrupted
+SLOW_QUERY = text(
+    "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 1000000000) "
+    "SELECT count(*) FROM n"
+)
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.get("/slow")
+async def slow(db: AsyncSession = Depends(get_db)) -> int:
+    return (await db.execute(SLOW_QUERY)).scalar_one()
+
+
+@router.get("/reports/timeout")
+async def report_timeout() -> float:
+    return statement_timeout()
+
+
+@router.get("/busy")
+async def busy() -> None:
+    raise PoolTimeoutError("QueuePool limit of size 5 overflow 10 reached")
+
+
+def make_app() -> FastAPI:
+    """App with the routes above (built per test, after settings are patched)."""
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[None, None]:
+    """SQLite database with a short statement timeout."""
+    path = tmp_path / "timeouts.db"
+    sqlite3.connect(path).close()
+    await close_db()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+    monkeypatch.setattr(settings, "DATABASE_STATEMENT_TIMEOUT", 0.2)
+    monkeypatch.setattr(settings, "DATABASE_ROUTE_STATEMENT_TIMEOUTS", {"/reports": 30.0})
+    await init_db()
+    yield
+    await close_db()
+
+
+def test_route_timeout_is_longest_prefix(monkeypatch: pytest.MonkeyPatch):
+    """The most specific prefix wins; other routes use the default."""
+    monkeypatch.setattr(
+        settings,
+        "DATABASE_ROUTE_STATEMENT_TIMEOUTS",
+        {"/api/v1/analytics": 60.0, "/api/v1/analytics/spend/deliveries": 5.0},
+    )
+    assert route_statement_timeout("/api/v1/analytics/spend/suppliers/monthly") == 60.0
+    assert route_statement_timeout("/api/v1/analytics/spend/deliveries") == 5.0
+    assert route_statement_timeout("/api/v1/suppliers") is None
+
+
+@pytest.mark.asyncio
+async def test_slow_query_times_out_with_504(database: None):
+    """A statement running past the timeout is interrupted and answered with 504."""
+    async with AsyncClient(transport=ASGITransport(app=make_app()), base_url="http://test") as ac:
+        started = time.monotonic()
+        response = await ac.get("/slow")
+        assert response.status_code == 504
+        assert response.json()["detail"] == "Database query timed out"
+        assert time.monotonic() - started < 5
+        assert (await ac.get("/reports/timeout")).json() == 30.0
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_answers_503(database: None):
+    """An exhausted pool is answered with 503 and Retry-After."""
+    async with AsyncClient(transport=ASGITransport(app=make_app()), base_url="http://test") as ac:
+        response = await ac.get("/busy")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_query(
+    database: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The query stops as soon as the client goes away, well before the timeout."""
+    monkeypatch.setattr(settings, "DATABASE_STATEMENT_TIMEOUT", 30.0)
+    app = make_app()
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> dict:
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.2)
+        return {"type": "http.disconnect"}
+
+    sent: list[dict] = []
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/slow",
+        "raw_path": b"/slow",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    started = time.monotonic()
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+    assert time.monotonic() - started < 5
+    assert sent[0]["status"] == 499
@@ -0,0 +1,76 @@
+"""
+Tests for supplier-scoped row filtering in repositories.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.scope import (
+    NO_SUPPLIER,
+    get_supplier_scope,
+    set_supplier_scope_for_user,
+    supplier_scope,
+    unscoped,
+)
+from app.models.supplier import Supplier
+from app.models.user import UserType
+from app.repositories.supplier import SupplierRepository
+
+
+class TestSupplierScope:
+    """Test the supplier scope applied by BaseRepository."""
+
+    @pytest.mark.asyncio
+    async def test_list_only_returns_own_supplier(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """A scoped list query returns just the principal's supplier."""
+        own = multiple_suppliers[2]
+        repository = SupplierRepository(test_db)
+
+        with supplier_scope(own.id):
+            suppliers, total = await repository.list_suppliers()
+            assert [s.id for s in suppliers] == [own.id]
+            assert total == 1
+
+        with unscoped():
+            _, total = await repository.list_suppliers()
+            assert total == len(multiple_suppliers)
+
+    @pytest.mark.asyncio
+    async def test_other_supplier_is_not_found(
+        self,
+        test_db: AsyncSession,
+        multiple_suppliers: list[Supplier],
+    ):
+        """Rows of other suppliers behave as if they did not exist."""
+        own, other = multiple_suppliers[0], multiple_suppliers[1]
+        repository = SupplierRepository(test_db)
+
+        with supplier_scope(own.id):
+            assert await repository.get(other.id) is None
+            assert await repository.get_by_code(other.code) is None
+            assert await repository.delete(other.id) is False
+            assert (await repository.get(own.id)).id == own.id
+
+    def test_scope_set_from_principal(self):
+        """Supplier users are scoped, Aladdin users are not."""
+        with unscoped():
+            set_supplier_scope_for_user(
+                SimpleNamespace(user_type=UserType.SUPPLIER, supplier_id=7)
+            )
+            assert get_supplier_scope() == 7
+
+            set_supplier_scope_for_user(
+                SimpleNamespace(user_type=UserType.SUPPLIER, supplier_id=None)
+            )
+            assert get_supplier_scope() == NO_SUPPLIER
+
+            set_supplier_scope_for_user(
+                SimpleNamespace(user_type=UserType.ALADDIN, supplier_id=None)
+            )
+            assert get_supplier_scope() is None
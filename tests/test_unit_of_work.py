@@ -0,0 +1,106 @@
+"""
+Tests for the request unit of work: one shared session and one commit per
+request, with side effects deferred until the commit.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi_users.db import SQLAlchemyUserDatabase
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Column, Integer, MetaData, Table, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import DBSession
+from app.api.routing import DBRoute
+from app.core.config import settings
+from app.core.users import get_user_db
+from app.db.session import (
+    after_commit,
+    close_db,
+    commit_session,
+    get_db,
+    get_engine,
+    get_read_db,
+    get_session_factory,
+    init_db,
+)
+
+counter = Table("counter", MetaData(), Column("value", Integer))
+
+# Side effects run by after-commit callbacks
+effects: list[str] = []
+
+router = APIRouter(route_class=DBRoute)
+
+
+@router.post("/write")
+async def write(
+    repo_db: DBSession,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+    user_db: SQLAlchemyUserDatabase = Depends(get_user_db),
+) -> dict[str, bool]:
+    await db.execute(insert(counter).values(value=1))
+    await db.flush()
+    after_commit(db, effects.append, "invalidated")
+    return {"shared": read_db is db and repo_db is db and user_db.session is db}
+
+
+unit_of_work_app = FastAPI()
+unit_of_work_app.include_router(router)
+
+
+@pytest_asyncio.fixture
+async def client(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[tuple[AsyncClient, list[str]], None]:
+    """Client of the app above and the list of COMMITs issued."""
+    path = tmp_path / "unit_of_work.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE counter (value INTEGER)")
+    await close_db()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+    await init_db()
+
+    commits: list[str] = []
+    event.listen(get_engine().sync_engine, "commit", lambda connection: commits.append("COMMIT"))
+    effects.clear()
+    async with AsyncClient(
+        transport=ASGITransport(app=unit_of_work_app),
+        base_url="http://test",
+    ) as ac:
+        yield ac, commits
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_dependencies_share_one_session_and_commit(
+    client: tuple[AsyncClient, list[str]],
+):
+    """Every session dependency resolves to one session, committed once."""
+    ac, commits = client
+    assert (await ac.post("/write")).json() == {"shared": True}
+    assert commits == ["COMMIT"]
+    assert effects == ["invalidated"]
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_wait_for_commit(client: tuple[AsyncClient, list[str]]):
+    """Callbacks run after the commit and are dropped on rollback."""
+    async with get_session_factory()() as session:
+        await session.execute(insert(counter).values(value=1))
+        after_commit(session, effects.append, "rolled back")
+        await session.rollback()
+
+        await session.execute(insert(counter).values(value=2))
+        after_commit(session, effects.append, "committed")
+        assert effects == []
+        await commit_session(session)
+    assert effects == ["committed"]